@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+Measures the generator, the generated status script and the generated dev server
+
+Usage:
+    python run_benchmarks.py run                         # all suites -> results.json
+    python run_benchmarks.py run --suite generate --repeat 20
+    python run_benchmarks.py run --quick --save-baseline # small trees, store as baseline
+    python run_benchmarks.py compare results.json        # flag regressions vs baseline.json
+
+Everything runs offline on the local machine. Baselines are machine
+specific: record one per benchmark host before comparing.
+"""
+
+import sys
+import json
+import platform
+import argparse
+import os
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+SUITES = ["generate", "status", "serve"]
+DEFAULT_SIZES = "1000,100000,1000000"
+QUICK_SIZES = "1000,10000"
+
+
+def run_suites(args):
+    # Imported lazily so `compare` does not need to load the generator
+    import suite_generate
+    import suite_status
+    import suite_serve
+
+    results = {}
+    for suite in args.suite or SUITES:
+        print(f"⏱️ Suite: {suite}")
+        if suite == "generate":
+            results.update(suite_generate.run(repeat=args.repeat))
+        elif suite == "status":
+            sizes = [int(n) for n in (args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)).split(",")]
+            results.update(suite_status.run(repeat=args.repeat, sizes=sizes, workdir=args.workdir))
+        elif suite == "serve":
+            results.update(suite_serve.run(connections=args.connections,
+                                           duration=1.0 if args.quick else args.duration))
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "generator_version": suite_generate.load_generator().GENERATOR_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Return (rows, regressions) comparing the `value` of every shared metric"""
+    rows = []
+    regressions = []
+    for name, result in sorted(current["results"].items()):
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, None, result["value"], None, "new"))
+            continue
+        old, new = base["value"], result["value"]
+        if old == 0:
+            change = 0.0 if new == 0 else float("inf")
+        else:
+            change = (new - old) / old
+        # Positive `worse` means slower / fewer requests / more errors
+        worse = -change if result.get("higher_is_better") else change
+        status = "REGRESSION" if worse > threshold else ("improved" if worse < -threshold else "ok")
+        rows.append((name, old, new, change, status))
+        if status == "REGRESSION":
+            regressions.append(name)
+    return rows, regressions
+
+
+def print_comparison(rows, threshold):
+    print(f"{'Metric':<28} {'Baseline':>12} {'Current':>12} {'Change':>9}  Status (threshold {threshold:.0%})")
+    for name, old, new, change, status in rows:
+        old_text = f"{old:12.6g}" if old is not None else f"{'-':>12}"
+        change_text = f"{change:+9.1%}" if change is not None else f"{'-':>9}"
+        print(f"{name:<28} {old_text} {new:12.6g} {change_text}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the project template generator")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmark suites and save JSON results")
+    run_parser.add_argument("--suite", action="append", choices=SUITES, help="Suite to run (repeatable, default: all)")
+    run_parser.add_argument("--repeat", type=int, default=10, help="Runs per measurement (default: 10)")
+    run_parser.add_argument("--sizes", help=f"Status tree sizes, comma separated (default: {DEFAULT_SIZES})")
+    run_parser.add_argument("--workdir", help="Keep synthetic status trees here between runs")
+    run_parser.add_argument("--connections", type=int, default=8, help="Concurrent server connections (default: 8)")
+    run_parser.add_argument("--duration", type=float, default=5.0, help="Server load duration in seconds (default: 5)")
+    run_parser.add_argument("--quick", action="store_true", help=f"Small trees ({QUICK_SIZES}) and a 1s server run")
+    run_parser.add_argument("--output", default="results.json", help="Results file (default: results.json)")
+    run_parser.add_argument("--save-baseline", action="store_true", help=f"Also save results as {DEFAULT_BASELINE.name}")
+
+    compare_parser = sub.add_parser("compare", help="Flag regressions against a stored baseline")
+    compare_parser.add_argument("results", help="Results file from `run`")
+    compare_parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline results file")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Allowed relative slowdown before flagging (default: 0.10)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run_suites(args)
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"✅ Results saved: {args.output}")
+        if args.save_baseline:
+            DEFAULT_BASELINE.write_text(json.dumps(report, indent=2), encoding='utf-8')
+            print(f"📌 Baseline saved: {DEFAULT_BASELINE}")
+        return
+
+    try:
+        current = json.loads(Path(args.results).read_text(encoding='utf-8'))
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read results: {e}")
+        sys.exit(2)
+
+    rows, regressions = compare(current, baseline, args.threshold)
+    print_comparison(rows, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark Statistics
+Timing helpers shared by the benchmark suites
+"""
+
+import statistics
+from time import perf_counter
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples, unit="s", higher_is_better=False):
+    """Result record for a list of samples; `value` is what compare() looks at"""
+    return {
+        "value": statistics.median(samples),
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "p95": percentile(samples, 0.95),
+        "runs": len(samples),
+    }
+
+
+def single(value, unit, higher_is_better=False):
+    """Result record for a metric measured once"""
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better, "runs": 1}
+
+
+def time_call(fn, repeat, setup=None):
+    """Run fn `repeat` times and return wall-clock seconds per run (setup is not timed)"""
+    samples = []
+    for i in range(repeat):
+        args = setup(i) if setup else ()
+        start = perf_counter()
+        fn(*args)
+        samples.append(perf_counter() - start)
+    return samples
@@ -0,0 +1,71 @@
+"""
+Generator Benchmarks
+Times create_project for every built-in type, with and without --git
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+
+from stats import summarize, time_call
+
+CORE_DIR = Path(__file__).resolve().parent.parent
+
+# git commit needs an identity; benchmark hosts often have none configured
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Benchmark",
+    "GIT_AUTHOR_EMAIL": "benchmark@example.com",
+    "GIT_COMMITTER_NAME": "Benchmark",
+    "GIT_COMMITTER_EMAIL": "benchmark@example.com",
+}
+
+
+def load_generator():
+    """Import core/create-project.py as a module"""
+    if str(CORE_DIR) not in sys.path:
+        sys.path.insert(0, str(CORE_DIR))
+    spec = importlib.util.spec_from_file_location("create_project", CORE_DIR / "create-project.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate(generator, path, project_type="web", name="Bench Project", git=False):
+    """Create one project quietly, returns the project directory"""
+    from events import NullSink
+
+    cwd = os.getcwd()
+    try:
+        ok = generator.create_project(name, project_type=project_type, description="Benchmark project",
+                                      author="Benchmark", email="benchmark@example.com", path=str(path),
+                                      git=git, events=NullSink())
+    finally:
+        os.chdir(cwd)
+    if not ok:
+        raise RuntimeError(f"create_project failed for {project_type} in {path}")
+    return Path(path) / generator.sanitize_name(name)
+
+
+def run(repeat=10, types=None, log=print):
+    generator = load_generator()
+    types = types or generator.build_registry().names()
+    for key, value in GIT_IDENTITY.items():
+        os.environ.setdefault(key, value)
+    git_available = shutil.which("git") is not None
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench-generate-") as workdir:
+        for project_type in types:
+            for git in ([False, True] if git_available else [False]):
+                label = f"generate/{project_type}" + ("+git" if git else "")
+                runs = [Path(workdir) / f"{project_type}-{git}-{i}" for i in range(repeat)]
+                samples = time_call(lambda path: generate(generator, path, project_type, git=git),
+                                    repeat, setup=lambda i: (runs[i],))
+                results[label] = summarize(samples)
+                log(f"  {label:<24} median {results[label]['value'] * 1000:8.2f} ms")
+                for path in runs:
+                    shutil.rmtree(path, ignore_errors=True)
+    return results
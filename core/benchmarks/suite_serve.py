@@ -0,0 +1,72 @@
+"""
+Dev Server Benchmarks
+Throughput and latency of the generated serve.py
+
+A web project is generated, its serve.py handler is started in a child
+process on a free local port, and the project's own loadtest.py replays
+the page's files over concurrent keep-alive connections.
+"""
+
+import sys
+import asyncio
+import tempfile
+import subprocess
+import importlib.util
+
+from stats import single
+from suite_generate import load_generator, generate
+
+SCRIPTS_DIR = ("05-utilities", "scripts")
+
+# Serves the generated handler on an ephemeral port without opening a browser
+SERVER_BOOTSTRAP = """
+import sys, importlib.util, http.server
+spec = importlib.util.spec_from_file_location("serve", sys.argv[1])
+serve = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(serve)
+with http.server.ThreadingHTTPServer(("127.0.0.1", 0), serve.CustomHTTPRequestHandler) as httpd:
+    print(httpd.server_address[1], flush=True)
+    httpd.serve_forever()
+"""
+
+
+def load_script(path):
+    """Import a generated script as a module"""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(connections=8, duration=5.0, log=print):
+    generator = load_generator()
+    with tempfile.TemporaryDirectory(prefix="bench-serve-") as workdir:
+        project = generate(generator, workdir, "web")
+        scripts = project.joinpath(*SCRIPTS_DIR)
+        loadtest = load_script(scripts / "loadtest.py")
+        paths = loadtest.crawl(project / "01-core")
+        server = subprocess.Popen([sys.executable, "-c", SERVER_BOOTSTRAP, str(scripts / "serve.py")],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        try:
+            port = int(server.stdout.readline())
+            stats = asyncio.run(loadtest.run_load("127.0.0.1", port, paths, connections, duration))
+        finally:
+            server.terminate()
+            server.wait()
+
+    summary = stats.summary()
+    if not summary["requests"]:
+        raise RuntimeError(f"serve.py answered no requests ({summary['errors']} errors)")
+    # A server answering 404s is fast for the wrong reason
+    summary["errors"] += sum(count for code, count in summary["statuses"].items() if not code.startswith("2"))
+    latency = summary["latency_ms"]
+    results = {
+        "serve/rps": single(summary["requests"] / stats.elapsed, "req/s", higher_is_better=True),
+        "serve/latency_p50": single(latency["p50"] / 1000, "s"),
+        "serve/latency_p95": single(latency["p95"] / 1000, "s"),
+        "serve/latency_p99": single(latency["p99"] / 1000, "s"),
+        "serve/errors": single(summary["errors"], "count"),
+    }
+    log(f"  serve/rps                {results['serve/rps']['value']:10.1f} req/s "
+        f"(p50 {latency['p50']:.2f} ms, p99 {latency['p99']:.2f} ms, {summary['errors']} errors)")
+    return results
@@ -0,0 +1,112 @@
+"""
+Status Script Benchmarks
+Times the generated generate_status.py on synthetic trees of N files
+
+Trees are created under 03-content/data of a freshly generated project,
+1,000 files per folder. Pass a persistent workdir to reuse trees between
+runs: building a 1M-file tree takes far longer than scanning it.
+
+status/N times the report alone (--no-history). status-history/N times a
+run that also records a history snapshot, always on top of the same
+one-snapshot store, so neither repeats nor reused workdirs let it grow.
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+from pathlib import Path
+
+from stats import summarize, time_call
+from suite_generate import load_generator, generate
+
+FILES_PER_DIR = 1000
+STATUS_SCRIPT = Path("05-utilities/scripts/repo-status/generate_status.py")
+HISTORY_STORE = Path("05-utilities/scripts/repo-status/status_history.sqlite3")
+
+
+def build_tree(root, count):
+    """Create `count` small files below root in folders of FILES_PER_DIR"""
+    payload = b"benchmark\n"
+    for index in range(count):
+        folder = root / f"d{index // FILES_PER_DIR:05d}"
+        if index % FILES_PER_DIR == 0:
+            folder.mkdir(parents=True, exist_ok=True)
+        fd = os.open(folder / f"f{index % FILES_PER_DIR:04d}.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+
+def prepare_project(generator, workdir, count, log):
+    """Generated project with a synthetic tree of `count` files, reused if already built"""
+    base = Path(workdir) / f"status-{count}"
+    project = base / generator.sanitize_name("Bench Project")
+    marker = base / f".tree-{count}-complete"
+    if marker.exists():
+        return project
+
+    if project.exists():
+        shutil.rmtree(project)
+    generate(generator, base, "web")
+    log(f"  building {count:,} file tree...")
+    build_tree(project / "03-content" / "data" / "bench", count)
+    marker.touch()
+    return project
+
+
+def run(repeat=5, sizes=(1000, 100000, 1000000), workdir=None, log=print):
+    generator = load_generator()
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench-status-") as tmp:
+        workdir = workdir or tmp
+        for count in sizes:
+            project = prepare_project(generator, workdir, count, log)
+            # Big trees take seconds per scan; a few runs are enough for a stable median
+            runs = repeat if count < 100000 else min(repeat, 3)
+
+            def scan(*options):
+                subprocess.run([sys.executable, str(STATUS_SCRIPT), *options], cwd=project, check=True,
+                               stdout=subprocess.DEVNULL)
+
+            label = f"status/{count}"
+            results[label] = summarize(time_call(lambda: scan("--no-history"), runs))
+            log(f"  {label:<24} median {results[label]['value'] * 1000:8.2f} ms")
+
+            # Seed the store with one snapshot, then restore it before every timed run
+            store = project / HISTORY_STORE
+            seed = store.with_name(store.name + ".seed")
+            reset_store(store)
+            scan()
+            checkpoint(store)
+            shutil.copyfile(store, seed)
+
+            def restore(i):
+                reset_store(store)
+                shutil.copyfile(seed, store)
+                return ()
+
+            label = f"status-history/{count}"
+            results[label] = summarize(time_call(scan, runs, setup=restore))
+            log(f"  {label:<24} median {results[label]['value'] * 1000:8.2f} ms")
+            reset_store(store)
+            seed.unlink()
+    return results
+
+
+def reset_store(store):
+    """Delete a SQLite store with its -wal/-shm files"""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{store}{suffix}").unlink(missing_ok=True)
+
+
+def checkpoint(store):
+    """Fold the write-ahead log into the main file, so copying that file copies everything"""
+    conn = sqlite3.connect(str(store))
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
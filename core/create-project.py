@@ -8,539 +8,333 @@ Based on Project Ares architecture
 import os
 import sys
 import argparse
-import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
-import shutil
+from contextlib import contextmanager
+
+from template_pack import open_pack
+from project_writer import ProjectWriter, DEFAULT_INFLIGHT
+from project_types import TypeRegistry, ProjectTypeError, template_dirs_from_env
+from output_cache import OutputCache, RecordingWriter, cache_key, replay, stamp_context
+from dep_store import DepStore, DepStoreError, link_project
+from venv_builder import VenvBuilder, VenvOptions
+from profiling import Profiler, NULL_PROFILER
+from events import ConsoleSink, QuietSink, JsonLinesSink, ProfiledSink
+
+GENERATOR_VERSION = "1.1.0"
+
+# Optional template variants per built-in type, besides "standard"
+TEMPLATE_VARIANTS = {
+    "web": ["perf"],
+    "python": ["data"],
+}
+
+# Types whose 01-core/package.json can be linked from a local store (--link-deps)
+LINKABLE_TYPES = ("node", "react")
+
+# Types with a 01-core/requirements.txt that --venv installs into <project>/venv
+VENV_TYPES = ("python", "docs")
+ACTIVATE = "source venv/bin/activate (Linux/Mac) or venv\\Scripts\\activate (Windows)"
 
 def sanitize_name(name):
     """Convert project name to filesystem-safe format"""
     import re
     return re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '-')
 
-def create_project(name, project_type="web", description="", author="", email="", path=".", git=False):
-    """Create a new project with the specified parameters"""
+def run_git(profiler, *args):
+    """Run a git command inside the project, timed as a git span"""
+    with profiler.span(f"git {args[0]}", "git"):
+        subprocess.run(["git", *args], check=True, capture_output=True)
+
+def python_start(variant):
+    """Command that runs a python project; the data variant first writes sample data"""
+    if variant == "data":
+        return "python 01-core/main.py --sample-rows 1000000"
+    return "python 01-core/main.py"
+
+def next_steps(project_type, safe_name, deps_linked=False, venv=None, variant="standard"):
+    """Post-generation instructions for a project type
+
+    venv is None when no virtualenv was built, "created" when venv/ exists but
+    requirements are not installed yet, "installed" when both are done.
+    """
+    steps = [f"1. Navigate to project: cd \"{safe_name}\""]
+    
+    if project_type == "web":
+        steps.append("2. Start development: python 05-utilities/scripts/serve.py")
+        steps.append("3. Check page weight: python 05-utilities/scripts/check_perf.py")
+        steps.append("4. Build for deploy: python 05-utilities/scripts/build.py")
+    elif project_type == "python" and venv == "installed":
+        steps.append(f"2. Activate environment: {ACTIVATE}")
+        steps.append(f"3. Start development: {python_start(variant)}")
+    elif project_type == "python" and venv == "created":
+        steps.append(f"2. Activate environment: {ACTIVATE}")
+        steps.append("3. Install dependencies: pip install -r 01-core/requirements.txt")
+        steps.append(f"4. Start development: {python_start(variant)}")
+    elif project_type == "python":
+        steps.append("2. Setup environment: python -m venv venv")
+        steps.append(f"3. Activate environment: {ACTIVATE}")
+        steps.append("4. Install dependencies: pip install -r 01-core/requirements.txt")
+        steps.append(f"5. Start development: {python_start(variant)}")
+    elif project_type in ["node", "react"]:
+        if deps_linked:
+            steps.append("2. Dependencies are linked from the store: cd 01-core")
+        else:
+            steps.append("2. Install dependencies: cd 01-core && npm install")
+        steps.append("3. Start development: npm start")
+        if project_type == "react":
+            steps.append("4. Build (checks bundle size budgets): npm run build")
+    elif project_type == "docs":
+        if venv:
+            steps.append(f"{len(steps) + 1}. Activate environment: {ACTIVATE}")
+        if venv != "installed":
+            steps.append(f"{len(steps) + 1}. Install dependencies: pip install -r 01-core/requirements.txt")
+        n = len(steps)
+        steps.append(f"{n + 1}. Start development: cd 01-core && mkdocs serve")
+        steps.append(f"{n + 2}. Build documentation: cd 01-core && mkdocs build")
+        steps.append(f"{n + 3}. Fast incremental build (no MkDocs needed): python 05-utilities/scripts/build_docs.py")
+    
+    steps.append("📊 Generate status: python 05-utilities/scripts/repo-status/generate_status.py")
+    return steps
+
+@contextmanager
+def phase(events, profiler, name):
+    """Time a generation phase and announce its start and end to the event sink"""
+    events.emit("phase_start", phase=name)
+    with profiler.span(name, "phase"):
+        yield
+    events.emit("phase_end", phase=name)
+
+def create_project(name, project_type="web", description="", author="", email="", path=".", git=False,
+                   registry=None, cache=None, profiler=NULL_PROFILER, events=None, variant="standard",
+                   link_deps=None, venv=None, inflight=DEFAULT_INFLIGHT):
+    """Create a new project with the specified parameters
+    
+    `variant` picks an alternative template set for the type (see TEMPLATE_VARIANTS),
+    e.g. "perf" for the performance-tuned web page or "data" for a python data pipeline.
+    `link_deps` is a dep_store directory: node and react projects get their
+    node_modules linked from it instead of needing npm install.
+    `venv` is a venv_builder.VenvOptions: python and docs projects get a
+    ready <project>/venv, built on a background thread while files are written.
+    `inflight` is how many file writes may be outstanding at once; raise it on
+    network filesystems, where each write costs round trips.
+    Pass an OutputCache as `cache` to reuse rendered output for repeated parameters,
+    a profiling.Profiler as `profiler` to record timed spans for every phase and file,
+    and an events sink as `events` to receive progress (defaults to ConsoleSink).
+    """
     
     safe_name = sanitize_name(name)
     project_path = Path(path) / safe_name
+    registry = registry or build_registry()
+    events = events or ConsoleSink()
+    if profiler.enabled:
+        events = ProfiledSink(events, profiler)
+    
+    events.emit("project_start", name=name, path=str(project_path), type=project_type)
     
-    print(f"🚀 Creating project: {name}")
-    print(f"📁 Location: {project_path}")
-    print(f"🎯 Type: {project_type}")
+    # Resolve the type first so a broken plugin does not leave a half-created project
+    try:
+        create_type_files = registry.load(project_type)
+    except ProjectTypeError as e:
+        events.emit("error", message=str(e))
+        return False
+    if variant != "standard" and variant not in TEMPLATE_VARIANTS.get(project_type, []):
+        events.emit("error", message=f"Template variant '{variant}' is not available for {project_type} projects")
+        return False
     
     # Check if directory exists
     if project_path.exists():
-        print(f"❌ Directory already exists: {project_path}")
+        events.emit("error", message=f"Directory already exists: {project_path}")
         return False
     
+    if link_deps and project_type not in LINKABLE_TYPES:
+        events.emit("warning", message=f"--link-deps ignored: {project_type} projects have no npm dependencies")
+        link_deps = None
+    # Opened before changing directory, so a relative store path still works
+    store = DepStore(link_deps) if link_deps else None
+    if venv and project_type not in VENV_TYPES:
+        events.emit("warning", message=f"--venv ignored: {project_type} projects have no requirements.txt")
+        venv = None
+    
     # Create main project directory
     project_path.mkdir(parents=True)
     os.chdir(project_path)
     
-    # Create folder structure
-    folders = [
-        "01-core",
-        "02-assets/images",
-        "02-assets/docs",
-        "03-content/data", 
-        "04-docs/specs",
-        "05-utilities/scripts/repo-status"
-    ]
+    # ensurepip takes seconds: start it now and let it run while the files are written
+    builder = VenvBuilder("venv", venv, profiler).start() if venv else None
     
-    for folder in folders:
-        Path(folder).mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created: {folder}")
-    
-    # Create project-specific files
-    if project_type == "web":
-        create_web_files(name, description, author, email)
-    elif project_type == "python":
-        create_python_files(name, description, author, email)
-    elif project_type == "node":
-        create_node_files(name, safe_name, description, author, email)
-    elif project_type == "react":
-        create_react_files(name, safe_name, description, author, email)
-    elif project_type == "docs":
-        create_docs_files(name, safe_name, description, author, email)
-    
-    # Create universal files
-    create_readme(name, safe_name, project_type, description, author, email)
-    create_utilities(name, safe_name, project_type, author, email, description)
-    
-    # Git initialization
-    if git:
-        create_gitignore(project_type, name)
-        try:
-            subprocess.run(["git", "init"], check=True, capture_output=True)
-            subprocess.run(["git", "add", "."], check=True, capture_output=True)
-            subprocess.run(["git", "commit", "-m", f"Initial commit: {name} project structure ({project_type})"], 
-                         check=True, capture_output=True)
-            print("✅ Git repository initialized")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️ Git initialization failed: {e}")
-    
-    print(f"\n🎉 Project '{name}' created successfully!")
-    print(f"📁 Location: {project_path}")
-    print(f"🎯 Type: {project_type}")
-    
-    # Next steps
-    print("\n🚀 Next steps:")
-    print(f"  1. Navigate to project: cd \"{safe_name}\"")
-    
-    if project_type == "web":
-        print("  2. Start development: python 05-utilities/scripts/serve.py")
-    elif project_type == "python":
-        print("  2. Setup environment: python -m venv venv")
-        print("  3. Activate environment: source venv/bin/activate (Linux/Mac) or venv\\Scripts\\activate (Windows)")
-        print("  4. Install dependencies: pip install -r 01-core/requirements.txt")
-        print("  5. Start development: python 01-core/main.py")
-    elif project_type in ["node", "react"]:
-        print("  2. Install dependencies: cd 01-core && npm install")
-        print("  3. Start development: npm start")
-    elif project_type == "docs":
-        print("  2. Install dependencies: cd 01-core && pip install -r requirements.txt")
-        print("  3. Start development: cd 01-core && mkdocs serve")
-        print("  4. Build documentation: cd 01-core && mkdocs build")
-    
-    print("  📊 Generate status: python 05-utilities/scripts/repo-status/generate_status.py")
-    print("\n📖 See README.md for full instructions")
-    
-    return True
-
-def create_web_files(name, description, author, email):
-    """Create web project files"""
-    
-    # HTML file
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{description}">
-    <meta name="author" content="{author}">
-    <title>{name}</title>
-    <link rel="stylesheet" href="style.css">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Open+Sans:wght@400;600;700&family=Merriweather:wght@300;400;700&display=swap" rel="stylesheet">
-</head>
-<body>
-    <header class="main-header">
-        <div class="progress-bar">
-            <div class="progress-fill" id="progress-fill"></div>
-        </div>
-        <nav class="sticky-nav" id="sticky-nav">
-            <div class="nav-toggle" id="nav-toggle">
-                <span></span>
-                <span></span>
-                <span></span>
-            </div>
-            <div class="nav-content">
-                <h3>Navigation</h3>
-                <ul>
-                    <li><a href="#section-1">Section 1</a></li>
-                    <li><a href="#section-2">Section 2</a></li>
-                    <li><a href="#section-3">Section 3</a></li>
-                </ul>
-            </div>
-        </nav>
-    </header>
-
-    <main class="main-content">
-        <section id="section-1" class="section">
-            <h1>{name}</h1>
-            <p class="subtitle">{description}</p>
-            
-            <div class="content-placeholder">
-                <h2>Welcome to your new project!</h2>
-                <p>This project was generated with the Universal Project Template Generator.</p>
-                <p>Start editing this file to build your application.</p>
-            </div>
-        </section>
-
-        <section id="section-2" class="section">
-            <h2>Getting Started</h2>
-            <div class="content-placeholder">
-                <p>1. Edit files in the <code>01-core/</code> folder</p>
-                <p>2. Add assets to <code>02-assets/</code></p>
-                <p>3. Store data in <code>03-content/</code></p>
-                <p>4. Document in <code>04-docs/</code></p>
-                <p>5. Use utilities in <code>05-utilities/</code></p>
-            </div>
-        </section>
-
-        <section id="section-3" class="section">
-            <h2>Development Tools</h2>
-            <div class="content-placeholder">
-                <p>🚀 <strong>Start Server:</strong> <code>python 05-utilities/scripts/serve.py</code></p>
-                <p>📊 <strong>Generate Status:</strong> <code>python 05-utilities/scripts/repo-status/generate_status.py</code></p>
-            </div>
-        </section>
-    </main>
-
-    <button class="back-to-top" id="back-to-top" aria-label="Back to top">↑</button>
-
-    <footer class="main-footer">
-        <div class="footer-content">
-            <p>&copy; {datetime.now().year} {name}. Created by {author}</p>
-        </div>
-    </footer>
-
-    <script src="script.js"></script>
-</body>
-</html>"""
-    
-    Path("01-core/index.html").write_text(html_content, encoding='utf-8')
-    
-    # CSS file (modern framework based on Project Ares)
-    css_content = """/* Modern CSS Framework - Based on Project Ares architecture */
-
-/* ========== RESET & BASE ========== */
-* { margin: 0; padding: 0; box-sizing: border-box; }
-
-html { scroll-behavior: smooth; }
-
-body {
-    font-family: 'Merriweather', Georgia, serif;
-    font-size: 1.1rem;
-    line-height: 1.7;
-    color: #333;
-    background: #F8F8F8;
-    overflow-x: hidden;
-}
-
-/* ========== TYPOGRAPHY ========== */
-h1, h2, h3, h4, h5, h6 {
-    font-family: 'Open Sans', Arial, sans-serif;
-    font-weight: 600;
-    margin-bottom: 1rem;
-    color: #2C3E50;
-}
-
-h1 { font-size: 2.5rem; font-weight: 700; margin-bottom: 1.5rem; }
-h2 { font-size: 2rem; margin-bottom: 1.2rem; }
-h3 { font-size: 1.5rem; margin-bottom: 1rem; }
-
-p { margin-bottom: 1.2rem; }
-
-a {
-    color: #4682B4;
-    text-decoration: none;
-    transition: color 0.3s ease;
-}
-
-a:hover {
-    color: #6B8E23;
-    text-decoration: underline;
-}
-
-/* ========== LAYOUT ========== */
-.main-header {
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    z-index: 1000;
-    background: rgba(248, 248, 248, 0.95);
-    backdrop-filter: blur(10px);
-    border-bottom: 1px solid #E0E0E0;
-}
-
-.progress-bar {
-    height: 3px;
-    background: #E0E0E0;
-    position: relative;
-}
-
-.progress-fill {
-    height: 100%;
-    background: linear-gradient(90deg, #4682B4, #6B8E23);
-    width: 0%;
-    transition: width 0.3s ease;
-}
-
-.main-content {
-    max-width: 800px;
-    margin: 0 auto;
-    padding: 80px 2rem 2rem;
-    background: white;
-    box-shadow: 0 0 20px rgba(0, 0, 0, 0.1);
-    min-height: 100vh;
-}
-
-/* ========== NAVIGATION ========== */
-.sticky-nav {
-    position: fixed;
-    top: 60px;
-    left: 20px;
-    width: 280px;
-    max-height: calc(100vh - 80px);
-    background: white;
-    border-radius: 8px;
-    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-    overflow-y: auto;
-    z-index: 999;
-    transform: translateX(-100%);
-    transition: transform 0.3s ease;
-    padding: 1.5rem;
-}
-
-.sticky-nav.active { transform: translateX(0); }
-
-.nav-toggle {
-    position: fixed;
-    top: 15px;
-    left: 20px;
-    width: 30px;
-    height: 30px;
-    cursor: pointer;
-    z-index: 1001;
-    display: flex;
-    flex-direction: column;
-    justify-content: space-between;
-    padding: 5px 0;
-}
-
-.nav-toggle span {
-    display: block;
-    height: 3px;
-    background: #333;
-    border-radius: 1px;
-    transition: all 0.3s ease;
-}
-
-.nav-toggle.active span:nth-child(1) { transform: rotate(45deg) translate(5px, 5px); }
-.nav-toggle.active span:nth-child(2) { opacity: 0; }
-.nav-toggle.active span:nth-child(3) { transform: rotate(-45deg) translate(7px, -6px); }
-
-.nav-content ul { list-style: none; }
-.nav-content li { margin-bottom: 0.5rem; }
-.nav-content li a {
-    display: block;
-    padding: 0.5rem 0;
-    color: #555;
-    font-size: 0.9rem;
-    transition: all 0.3s ease;
-}
-
-.nav-content li a:hover {
-    background: #EDF2F7;
-    padding-left: 0.5rem;
-    text-decoration: none;
-}
-
-/* ========== SECTIONS ========== */
-.section { margin-bottom: 3rem; }
-
-.content-placeholder {
-    background: #F9F9F9;
-    border: 2px dashed #E0E0E0;
-    border-radius: 8px;
-    padding: 2rem;
-    margin: 1rem 0;
-}
-
-/* ========== BACK TO TOP ========== */
-.back-to-top {
-    position: fixed;
-    bottom: 30px;
-    right: 30px;
-    width: 50px;
-    height: 50px;
-    background: #4682B4;
-    color: white;
-    border: none;
-    border-radius: 50%;
-    cursor: pointer;
-    font-size: 1.2rem;
-    opacity: 0;
-    visibility: hidden;
-    transition: all 0.3s ease;
-    z-index: 999;
-}
-
-.back-to-top.visible {
-    opacity: 1;
-    visibility: visible;
-}
-
-.back-to-top:hover {
-    background: #5a94c7;
-    transform: scale(1.1);
-}
-
-/* ========== FOOTER ========== */
-.main-footer {
-    background: #2C3E50;
-    color: white;
-    text-align: center;
-    padding: 2rem;
-    margin-top: 3rem;
-}
-
-/* ========== RESPONSIVE ========== */
-@media (max-width: 768px) {
-    .main-content { padding: 80px 1rem 1rem; }
-    .sticky-nav { width: 250px; left: -270px; }
-    h1 { font-size: 2rem; }
-    h2 { font-size: 1.7rem; }
-}
-
-@media (max-width: 480px) {
-    body { font-size: 1rem; line-height: 1.6; }
-    .main-content { padding: 70px 0.5rem 0.5rem; }
-}"""
-    
-    Path("01-core/style.css").write_text(css_content, encoding='utf-8')
-    
-    # JavaScript file (interactive features based on Project Ares)
-    js_content = f"""// {name} - Interactive JavaScript
-// Based on Project Ares architecture
-
-document.addEventListener('DOMContentLoaded', function() {{
-    // Elements
-    const navToggle = document.getElementById('nav-toggle');
-    const stickyNav = document.getElementById('sticky-nav');
-    const backToTop = document.getElementById('back-to-top');
-    const progressFill = document.getElementById('progress-fill');
-
-    // Navigation toggle
-    if (navToggle && stickyNav) {{
-        navToggle.addEventListener('click', function() {{
-            navToggle.classList.toggle('active');
-            stickyNav.classList.toggle('active');
-        }});
-
-        // Close navigation when clicking outside
-        document.addEventListener('click', function(event) {{
-            if (!stickyNav.contains(event.target) && !navToggle.contains(event.target)) {{
-                navToggle.classList.remove('active');
-                stickyNav.classList.remove('active');
-            }}
-        }});
-    }}
-
-    // Scroll progress indicator
-    function updateProgressBar() {{
-        const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
-        const scrollHeight = document.documentElement.scrollHeight - window.innerHeight;
-        const progress = (scrollTop / scrollHeight) * 100;
+    # Released even if a step below raises, so library callers do not leak the pack
+    # mapping, the writer's threads and folder descriptors, or a running venv build
+    pack = None
+    try:
+        # Templates are read lazily from the memory-mapped pack
+        with profiler.span("open template pack", "phase"):
+            pack = open_pack()
+        context = template_context(name, safe_name, project_type, description, author, email, variant)
+    
+        # Only built-in output is cached: plugin templates are not covered by the pack digest
+        key = None
+        cached_ops = None
+        if cache is not None and registry.is_builtin(project_type):
+            key = cache_key(GENERATOR_VERSION, pack.digest, project_type=project_type, name=name,
+                            description=description, author=author, email=email, git=git, variant=variant)
+            with profiler.span("cache lookup", "phase"):
+                cached_ops = cache.get(key)
+    
+        if cached_ops is not None:
+            with phase(events, profiler, "cache replay"):
+                with ProjectWriter(".", pack, context, profiler, events, inflight) as out:
+                    count = replay(cached_ops, out, stamp_context(context)[1])
+            events.emit("cache_hit", files=count)
+        else:
+            writer_class = RecordingWriter if key else ProjectWriter
+            with writer_class(".", pack, context, profiler, events, inflight) as out:
+                # Create folder structure
+                folders = [
+                    "01-core",
+                    "02-assets/images",
+                    "02-assets/docs",
+                    "03-content/data", 
+                    "04-docs/specs",
+                    "05-utilities/scripts/repo-status"
+                ]
         
-        if (progressFill) {{
-            progressFill.style.width = Math.min(progress, 100) + '%';
-        }}
-    }}
-
-    // Back to top functionality
-    function updateBackToTop() {{
-        const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
+                with phase(events, profiler, "folders"):
+                    for folder in folders:
+                        out.mkdir(folder)
         
-        if (backToTop) {{
-            if (scrollTop > 300) {{
-                backToTop.classList.add('visible');
-            }} else {{
-                backToTop.classList.remove('visible');
-            }}
-        }}
-    }}
-
-    if (backToTop) {{
-        backToTop.addEventListener('click', function() {{
-            window.scrollTo({{
-                top: 0,
-                behavior: 'smooth'
-            }});
-        }});
-    }}
-
-    // Scroll handlers
-    window.addEventListener('scroll', function() {{
-        updateProgressBar();
-        updateBackToTop();
-    }});
-
-    // Smooth scrolling for internal links
-    document.querySelectorAll('a[href^="#"]').forEach(link => {{
-        link.addEventListener('click', function(e) {{
-            e.preventDefault();
-            const targetId = this.getAttribute('href').substring(1);
-            const targetElement = document.getElementById(targetId);
-            
-            if (targetElement) {{
-                const offsetTop = targetElement.offsetTop - 80;
-                window.scrollTo({{
-                    top: offsetTop,
-                    behavior: 'smooth'
-                }});
-                
-                // Close navigation if open
-                if (navToggle && stickyNav) {{
-                    navToggle.classList.remove('active');
-                    stickyNav.classList.remove('active');
-                }}
-            }}
-        }});
-    }});
-
-    // Keyboard navigation
-    document.addEventListener('keydown', function(e) {{
-        if (e.key === 'Escape') {{
-            if (navToggle && stickyNav) {{
-                navToggle.classList.remove('active');
-                stickyNav.classList.remove('active');
-            }}
-        }}
-    }});
-
-    // Initialize
-    updateProgressBar();
-    updateBackToTop();
-    
-    console.log('{name} initialized successfully');
-}});"""
-    
-    Path("01-core/script.js").write_text(js_content, encoding='utf-8')
-
-def create_python_files(name, description, author, email):
-    """Create Python project files"""
+                # Create project-specific files
+                with phase(events, profiler, f"{project_type} files"):
+                    create_type_files(out, name, safe_name, description, author, email)
+        
+                # Create universal files
+                with phase(events, profiler, "universal files"):
+                    create_readme(out, project_type)
+                    create_utilities(out, project_type)
+                    if git:
+                        create_gitignore(out, project_type, name)
+                    # Flushed inside the phase so queued writes are timed with it; everything
+                    # must be on disk before the venv, dependency linking and git read it
+                    out.close()
+        
+            if key:
+                with profiler.span("cache store", "phase"):
+                    cache.put(key, out.ops)
+    
+        venv = None
+        if builder:
+            builder.install("01-core/requirements.txt")
+            with phase(events, profiler, "venv"):
+                venv = report_venv(builder.wait(), events)
+    
+        deps_linked = False
+        if store:
+            with phase(events, profiler, "link deps"):
+                deps_linked = link_deps_from_store(store, events)
+    
+        # Git initialization
+        if git:
+            try:
+                with phase(events, profiler, "git"):
+                    run_git(profiler, "init")
+                    run_git(profiler, "add", ".")
+                    run_git(profiler, "commit", "-m", f"Initial commit: {name} project structure ({project_type})")
+                events.emit("git_initialized")
+            except subprocess.CalledProcessError as e:
+                events.emit("warning", message=f"Git initialization failed: {e}")
+    finally:
+        if pack is not None:
+            pack.close()
+        if builder:
+            builder.wait()
+    
+    events.emit("project_done", name=name, path=str(project_path), type=project_type,
+                next_steps=next_steps(project_type, safe_name, deps_linked, venv, variant))
     
-    # Main Python file
-    main_content = f'''# {name}
-"""
-{description}
+    return True
 
-Author: {author} <{email}>
-Created: {datetime.now().strftime('%Y-%m-%d')}
-"""
+def report_venv(result, events):
+    """Announce a finished VenvBuilder; returns "installed", "created" (venv/ only) or None"""
+    if result.python:
+        events.emit("venv_ready", path=result.path, method=result.method, installed=result.installed,
+                    seconds=round(result.seconds, 2))
+    if not result.ok:
+        events.emit("warning", message=result.message)
+    if result.ok:
+        return "installed"
+    return "created" if result.python else None
+
+def link_deps_from_store(store, events):
+    """Link 01-core/node_modules from a dep_store, returns True if nothing was missing"""
+    try:
+        result = link_project("01-core", store)
+    except (DepStoreError, OSError) as e:
+        events.emit("warning", message=f"Dependency linking failed: {e}")
+        return False
+    events.emit("deps_linked", packages=result.packages, files=result.files, copied=result.copied,
+                missing=[f"{name}@{spec}" for name, spec, _ in result.missing])
+    if result.missing:
+        events.emit("warning", message=f"{len(result.missing)} dependencies are not in {store.root}, "
+                                       f"add their tarballs and rerun dep_store.py link or npm install: "
+                                       + ", ".join(f"{name}@{spec}" for name, spec, _ in result.missing))
+        return False
+    return True
 
-def main():
-    """Main entry point for {name}."""
-    print("Welcome to {name}")
-    print("{description}")
+def template_context(name, safe_name, project_type, description, author, email, variant="standard"):
+    """Values available to every $placeholder in the template pack"""
+    now = datetime.now()
+    return {
+        "name": name,
+        "name_upper": name.upper(),
+        "safe_name": safe_name,
+        "status_slug": safe_name.lower().replace('-', '_'),
+        "project_type": project_type,
+        "variant": variant,
+        "description": description,
+        "author": author,
+        "email": email,
+        "created": now.strftime('%Y-%m-%d'),
+        "year": str(now.year),
+    }
 
-if __name__ == "__main__":
-    main()'''
-    
-    Path("01-core/main.py").write_text(main_content, encoding='utf-8')
+def create_web_files(out, name, safe_name, description, author, email):
+    """Create web project files"""
     
-    # Requirements file
-    requirements_content = f"""# {name} Dependencies
-# Add your Python packages here
-
-# Common packages for most projects
-requests>=2.28.0
-numpy>=1.21.0
-pandas>=1.4.0
-
-# Development dependencies
-pytest>=7.0.0
-black>=22.0.0
-flake8>=4.0.0"""
+    # The perf variant inlines critical CSS, defers JS and self-hosts fonts
+    group = "web-perf" if out.context["variant"] == "perf" else "web"
+    out.write_template(f"{group}/index.html", "01-core/index.html")
+    out.write_template(f"{group}/style.css", "01-core/style.css")
+    out.write_template(f"{group}/script.js", "01-core/script.js")
+    if group == "web-perf":
+        out.mkdir("01-core/fonts")
+        out.write_template("web-perf/fonts-README.md", "01-core/fonts/README.md")
+    out.write_template("web/check_perf.py", "05-utilities/scripts/check_perf.py")
+    out.write_template("web/build.py", "05-utilities/scripts/build.py")
+
+def create_python_files(out, name, safe_name, description, author, email):
+    """Create Python project files"""
     
-    Path("01-core/requirements.txt").write_text(requirements_content, encoding='utf-8')
-
-def create_node_files(name, safe_name, description, author, email):
+    # The data variant runs a chunked, cached pipeline over 03-content/data
+    data = out.context["variant"] == "data"
+    if data:
+        out.write_template("python-data/main.py", "01-core/main.py")
+        out.write_template("python-data/pipeline.py", "01-core/pipeline.py")
+    else:
+        out.write_template("python/main.py", "01-core/main.py")
+    out.write_template("python/requirements.txt", "01-core/requirements.txt")
+    
+    # Measurable from the start: a profiler wrapper and a benchmark suite with baselines
+    out.write_template("python/profile.py", "05-utilities/scripts/profile.py")
+    out.mkdir("01-core/tests/bench")
+    for entry in ("harness.py", "run_benchmarks.py"):
+        out.write_template(f"python/bench/{entry}", f"01-core/tests/bench/{entry}")
+    if data:
+        out.write_template("python-data/bench_pipeline.py", "01-core/tests/bench/bench_pipeline.py")
+    else:
+        out.write_template("python/bench/bench_main.py", "01-core/tests/bench/bench_main.py")
+
+def create_node_files(out, name, safe_name, description, author, email):
     """Create Node.js project files"""
     
     # Package.json
@@ -551,6 +345,7 @@ def create_node_files(name, safe_name, description, author, email):
         "main": "index.js",
         "scripts": {
             "start": "node index.js",
+            "start:cluster": "node cluster.js",
             "dev": "nodemon index.js",
             "test": "jest",
             "lint": "eslint .",
@@ -559,6 +354,9 @@ def create_node_files(name, safe_name, description, author, email):
         "keywords": ["project", "template"],
         "author": f"{author} <{email}>",
         "license": "MIT",
+        "engines": {
+            "node": ">=16"
+        },
         "dependencies": {
             "express": "^4.18.2",
             "cors": "^2.8.5",
@@ -572,57 +370,18 @@ def create_node_files(name, safe_name, description, author, email):
         }
     }
     
-    with open("01-core/package.json", 'w') as f:
-        json.dump(package_json, f, indent=2)
-    
-    # Main application file
-    index_js = f'''// {name} - Node.js Application
-// {description}
-
-const express = require('express');
-const cors = require('cors');
-const helmet = require('helmet');
-
-const app = express();
-const port = process.env.PORT || 3000;
-
-// Middleware
-app.use(helmet());
-app.use(cors());
-app.use(express.json());
-app.use(express.static('public'));
-
-// Routes
-app.get('/', (req, res) => {{
-    res.json({{
-        name: '{name}',
-        description: '{description}',
-        author: '{author}',
-        version: '1.0.0',
-        status: 'running'
-    }});
-}});
-
-app.get('/api/health', (req, res) => {{
-    res.json({{ status: 'healthy', timestamp: new Date().toISOString() }});
-}});
-
-// Start server
-app.listen(port, () => {{
-    console.log(`🚀 {name} server running on port ${{port}}`);
-    console.log(`📖 Open http://localhost:${{port}} in your browser`);
-}});
-
-module.exports = app;'''
-    
-    Path("01-core/index.js").write_text(index_js, encoding='utf-8')
+    out.write_json("01-core/package.json", package_json)
+    out.write_template("node/index.js", "01-core/index.js")
+    out.write_template("node/cluster.js", "01-core/cluster.js")
+    out.write_template("node/metrics.js", "01-core/metrics.js")
 
-def create_react_files(name, safe_name, description, author, email):
+def create_react_files(out, name, safe_name, description, author, email):
     """Create React project files"""
     
     # Create src and public directories
-    Path("01-core/src").mkdir(exist_ok=True)
-    Path("01-core/public").mkdir(exist_ok=True)
+    out.mkdir("01-core/src/components")
+    out.mkdir("01-core/src/pages")
+    out.mkdir("01-core/public")
     
     # Package.json for React
     package_json = {
@@ -639,6 +398,8 @@ def create_react_files(name, safe_name, description, author, email):
         "scripts": {
             "start": "react-scripts start",
             "build": "react-scripts build",
+            "postbuild": "node ../05-utilities/scripts/check_bundle_size.js",
+            "check:bundle": "node ../05-utilities/scripts/check_bundle_size.js",
             "test": "react-scripts test",
             "eject": "react-scripts eject"
         },
@@ -651,556 +412,194 @@ def create_react_files(name, safe_name, description, author, email):
         }
     }
     
-    with open("01-core/package.json", 'w') as f:
-        json.dump(package_json, f, indent=2)
+    out.write_json("01-core/package.json", package_json)
     
-    # Create React component files (simplified to save space)
-    # App.js, index.js, CSS files etc. would go here
+    # Application: one lazily loaded chunk per route (src/routes.js)
+    for entry in ["public/index.html", "src/index.js", "src/index.css", "src/App.js", "src/App.css",
+                  "src/routes.js", "src/components/Nav.js", "src/components/Loading.js",
+                  "src/components/ErrorBoundary.js", "src/components/ItemList.js",
+                  "src/pages/Home.js", "src/pages/About.js", "src/pages/NotFound.js",
+                  "bundle-budgets.json"]:
+        out.write_template(f"react/{entry}", f"01-core/{entry}")
+    out.write_template("react/check_bundle_size.js", "05-utilities/scripts/check_bundle_size.js")
 
-def create_docs_files(name, safe_name, description, author, email):
+def create_docs_files(out, name, safe_name, description, author, email):
     """Create documentation project files using MkDocs"""
     
     # Create docs directory structure first
-    docs_dir = Path("01-core/docs")
-    docs_dir.mkdir(parents=True, exist_ok=True)
-    
-    # MkDocs requirements
-    requirements_txt = """mkdocs>=1.5.0
-mkdocs-material>=9.0.0
-pymdown-extensions>=10.0.0
-"""
-    Path("01-core/requirements.txt").write_text(requirements_txt, encoding='utf-8')
-    
-    # Simple MkDocs configuration
-    mkdocs_yml = f"""site_name: {name}
-site_description: {description}
-site_author: {author}
-
-theme:
-  name: material
-  palette:
-    - scheme: default
-      primary: blue
-    - scheme: slate
-      primary: blue
-
-plugins:
-  - search
-
-markdown_extensions:
-  - pymdownx.highlight
-  - pymdownx.superfences
-  - admonition
-
-nav:
-  - Home: index.md
-  - Getting Started: getting-started.md
-  - User Guide: user-guide.md
-"""
-    Path("01-core/mkdocs.yml").write_text(mkdocs_yml, encoding='utf-8')
-    
-    # Simple documentation index
-    index_content = f"""# {name}
-
-{description}
-
-## Welcome
-
-Welcome to the {name} documentation site.
-
-## Quick Start
-
-1. Install dependencies: `pip install -r requirements.txt`
-2. Start development server: `mkdocs serve`
-3. Build documentation: `mkdocs build`
-
-## Features
-
-- Professional documentation with MkDocs
-- Material theme for modern appearance
-- Search functionality
-- Responsive design
-
-## Contact
-
-Author: {author}
-Email: {email}
-"""
-    Path("01-core/docs/index.md").write_text(index_content, encoding='utf-8')
+    out.mkdir("01-core/docs")
     
-    # Getting started guide
-    getting_started = f"""# Getting Started
-
-## Installation
-
-1. Install Python 3.8 or higher
-2. Install dependencies:
-
-```bash
-pip install -r requirements.txt
-```
-
-## Development
-
-Start the development server:
-
-```bash
-mkdocs serve
-```
-
-Visit http://localhost:8000 to view the documentation.
-
-## Building
-
-Build the static site:
-
-```bash
-mkdocs build
-```
-
-The generated site will be in the `site/` directory.
-"""
-    Path("01-core/docs/getting-started.md").write_text(getting_started, encoding='utf-8')
+    out.write_template("docs/requirements.txt", "01-core/requirements.txt")
+    out.write_template("docs/mkdocs.yml", "01-core/mkdocs.yml")
+    out.write_template("docs/index.md", "01-core/docs/index.md")
+    out.write_template("docs/getting-started.md", "01-core/docs/getting-started.md")
+    out.write_template("docs/user-guide.md", "01-core/docs/user-guide.md")
     
-    # User guide
-    user_guide = """# User Guide
-
-## Overview
-
-This documentation site is built with MkDocs and the Material theme.
-
-## Writing Documentation
-
-- Create new `.md` files in the `docs/` directory
-- Add them to the navigation in `mkdocs.yml`
-- Use Markdown syntax for formatting
-
-## Features
-
-- Code syntax highlighting
-- Admonitions for notes and warnings
-- Search functionality
-- Responsive design
-
-## Tips
-
-- Keep pages focused and well-organized
-- Use clear headings and sections
-- Include code examples where helpful
-- Test your documentation locally before publishing
-"""
-    Path("01-core/docs/user-guide.md").write_text(user_guide, encoding='utf-8')
+    # In-process build that only re-renders changed pages and their dependents,
+    # plus the sharded search index and the client script it copies into the site
+    out.write_template("docs/build_docs.py", "05-utilities/scripts/build_docs.py")
+    out.write_template("docs/docs-search.js", "05-utilities/scripts/docs-search.js")
 
-def create_readme(name, safe_name, project_type, description, author, email):
+def create_readme(out, project_type):
     """Create universal README file"""
     
-    python_setup = ""
+    type_setup = ""
     if project_type == "python":
-        python_setup = """
-
-## Python Setup
-
-1. Create virtual environment: `python -m venv venv`
-2. Activate environment: `source venv/bin/activate` (Linux/Mac) or `venv\\Scripts\\activate` (Windows)
-3. Install dependencies: `pip install -r 01-core/requirements.txt`
-4. Run application: `python 01-core/main.py`"""
-    
-    node_setup = ""
-    if project_type in ["node", "react"]:
-        node_setup = """
-
-## Node.js Setup
-
-1. Install dependencies: `npm install` (in 01-core/ folder)
-2. Start development: `npm run dev` or `npm start`
-3. Build for production: `npm run build`"""
-    
-    readme_content = f"""# {name}
-
-{description}
-
-## 🚀 Quick Start
-
-### Development
-1. **Start development:** Run appropriate server for your platform
-   - Python server: `python 05-utilities/scripts/serve.py`
-   - Windows batch: Double-click `05-utilities/start-server.bat`
-2. **Edit files:** Modify files in `01-core/` folder  
-3. **Generate status:** `python 05-utilities/scripts/repo-status/generate_status.py`
-
-### Project Structure
-```
-{safe_name}/
-├── 01-core/           # Main application files
-├── 02-assets/         # Static assets (images, docs)
-├── 03-content/        # Content and data files
-├── 04-docs/           # Project documentation
-└── 05-utilities/      # Development tools
-    ├── start-server.bat      # 🖱️ Start development server (Windows)
-    ├── generate-status.bat   # 🖱️ Generate project status (Windows)
-    └── scripts/              # Utility scripts
-        ├── serve.py          # Python dev server
-        └── repo-status/      # Status generation tools
-```
-
-## 📊 Project Status
-
-Run status generation scripts to create comprehensive project reports perfect for sharing with AI assistants.
-
-## 👨‍💻 Development
-
-- **Project Type:** {project_type}
-- **Author:** {author}
-- **Email:** {email}
-- **Created:** {datetime.now().strftime('%Y-%m-%d')}
-{python_setup}{node_setup}
-
----
-
-*Generated with Universal Project Template Generator based on Project Ares architecture*"""
+        type_setup = out.render("python/README-setup.md")
+        if out.context["variant"] == "data":
+            type_setup += out.render("python-data/README-setup.md")
+    elif project_type in ["node", "react"]:
+        type_setup = out.render("node/README-setup.md")
+    elif project_type == "docs":
+        type_setup = out.render("docs/README-setup.md")
     
-    Path("README.md").write_text(readme_content, encoding='utf-8')
+    out.write_template("common/README.md", "README.md", type_setup=type_setup)
 
-def create_utilities(name, safe_name, project_type, author, email, description):
+def create_utilities(out, project_type):
     """Create development utilities"""
     
-    # Python server script (universal)
-    serve_py = f'''#!/usr/bin/env python3
-"""
-Simple development server for {name}
-Run with: python serve.py
-"""
-
-import http.server
-import socketserver
-import webbrowser
-import os
-from pathlib import Path
-
-PORT = 8000
-DIRECTORY = Path(__file__).parent.parent / "01-core"
-
-class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=DIRECTORY, **kwargs)
-
-def main():
-    try:
-        with socketserver.TCPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
-            print(f"🚀 {name} Development Server")
-            print(f"📂 Serving directory: {{DIRECTORY}}")
-            print(f"🌐 Server running at: http://localhost:{{PORT}}")
-            print(f"⭐ Press Ctrl+C to stop the server")
-            
-            try:
-                webbrowser.open(f"http://localhost:{{PORT}}")
-                print(f"🌟 Browser opened automatically")
-            except:
-                print(f"💡 Please manually open: http://localhost:{{PORT}}")
-            
-            httpd.serve_forever()
-            
-    except KeyboardInterrupt:
-        print(f"\\n🛑 Server stopped by user")
-    except OSError as e:
-        if e.errno == 48:
-            print(f"❌ Port {{PORT}} is already in use")
-        else:
-            print(f"❌ Error starting server: {{e}}")
-
-if __name__ == "__main__":
-    main()'''
-    
-    Path("05-utilities/scripts/serve.py").write_text(serve_py, encoding='utf-8')
-    
-    # Status generator script
-    status_script = f'''#!/usr/bin/env python3
-"""
-Repository Status Generator for {name}
-Generates comprehensive project snapshot
-"""
-
-import os
-import subprocess
-from datetime import datetime
-from pathlib import Path
-
-def generate_status():
-    """Generate project status report"""
-    
-    output_file = "05-utilities/scripts/repo-status/repo_status_{safe_name.lower().replace('-', '_')}.txt"
-    date_str = datetime.now().strftime("%a, %b %d, %Y %I:%M:%S %p")
-    
-    with open(output_file, 'w') as f:
-        f.write(f"""==============================
-{name.upper()} – REPO SNAPSHOT  
-Generated: {{date_str}}
-==============================
-
-[PROJECT OVERVIEW]
-Project: {name}
-Type: {project_type}
-Description: {description}
-Author: {author}
-Created: {datetime.now().strftime('%Y-%m-%d')}
-
-[CORE PROJECT FILES STATUS]
-""")
-        
-        # Check core files
-        if Path("01-core").exists():
-            core_files = list(Path("01-core").rglob("*"))
-            f.write("[CORE APPLICATION FILES - 01-core]\\n")
-            for file in core_files:
-                if file.is_file():
-                    try:
-                        size_kb = round(file.stat().st_size / 1024, 1)
-                        f.write(f"PASS {{file.relative_to('.')}} - {{size_kb}}KB\\n")
-                    except:
-                        f.write(f"PASS {{file.relative_to('.')}} - Unknown size\\n")
-        
-        # Check project structure
-        f.write("\\n[PROJECT STRUCTURE]\\n")
-        directories = ["01-core", "02-assets", "03-content", "04-docs", "05-utilities"]
-        for dir_name in directories:
-            if Path(dir_name).exists():
-                try:
-                    count = len(list(Path(dir_name).rglob("*")))
-                    f.write(f"PASS {{dir_name}}\\\\ - {{count}} items\\n")
-                except:
-                    f.write(f"PASS {{dir_name}}\\\\ - Directory exists\\n")
-            else:
-                f.write(f"FAIL {{dir_name}}\\\\ - MISSING\\n")
-        
-        # Git status if available
-        f.write("\\n[GIT STATUS]\\n")
-        try:
-            result = subprocess.run(["git", "status", "--short"], 
-                                  capture_output=True, text=True, check=True)
-            if result.stdout.strip():
-                f.write("Working directory changes:\\n")
-                f.write(result.stdout)
-            else:
-                f.write("Working directory: CLEAN\\n")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            f.write("Not a git repository or git not available\\n")
-        
-        f.write(f"""
-[SUMMARY]
-Project: {name}
-Type: {project_type}
-Status: Ready for development
-Generated: {{output_file}}
-Ready to share with AI assistants!
-""")
-    
-    print(f"✅ Status report generated: {{output_file}}")
-
-if __name__ == "__main__":
-    generate_status()'''
-    
-    Path("05-utilities/scripts/repo-status/generate_status.py").write_text(status_script, encoding='utf-8')
+    out.write_template("common/serve.py", "05-utilities/scripts/serve.py")
+    out.write_template("common/loadtest.py", "05-utilities/scripts/loadtest.py")
+    out.write_template("common/generate_status.py", "05-utilities/scripts/repo-status/generate_status.py")
+    out.write_template("common/status_history.py", "05-utilities/scripts/repo-status/status_history.py")
+    out.write_template("common/git_churn.py", "05-utilities/scripts/repo-status/git_churn.py")
     
     # Windows batch files
-    start_server_bat = f"""@echo off
-title {name} - Development Server
-color 0B
-echo.
-echo ================================================
-echo   {name.upper()} - DEVELOPMENT SERVER  
-echo ================================================
-echo.
-cd /d "%~dp0\\.."
-"""
-        
+    server_commands = ""
     if project_type == "web":
-        start_server_bat += """if exist "05-utilities\\scripts\\serve.py" (
-    python "05-utilities\\scripts\\serve.py"
-) else (
-    echo Starting basic file server...
-    if exist "01-core\\index.html" (
-        start "" "01-core\\index.html"
-    ) else (
-        echo Open files in 01-core/ folder to get started
-    )
-)"""
+        server_commands = out.render("web/start-server.bat")
     elif project_type == "python":
-        start_server_bat += """echo Starting Python application...
-cd 01-core
-if exist "venv\\Scripts\\activate.bat" (
-    call venv\\Scripts\\activate.bat
-    python main.py
-) else (
-    echo Warning: Virtual environment not found
-    echo Run: python -m venv venv
-    echo Then: venv\\Scripts\\activate
-    echo Then: pip install -r requirements.txt
-    python main.py
-)"""
+        server_commands = out.render("python/start-server.bat")
     elif project_type in ["node", "react"]:
-        start_server_bat += """echo Starting Node.js application...
-cd 01-core
-if exist "package.json" (
-    if not exist "node_modules" (
-        echo Installing dependencies...
-        npm install
-    )
-    npm start
-) else (
-    echo Error: package.json not found
-    echo Run: npm init -y
-)"""
-        
-    start_server_bat += """
-pause"""
-        
-    Path("05-utilities/start-server.bat").write_text(start_server_bat, encoding='utf-8')
+        server_commands = out.render("node/start-server.bat")
     
-    # Status generation batch
-    status_bat = f"""@echo off
-title {name} - Repository Status
-color 0E
-echo.
-echo ================================================
-echo   {name.upper()} - REPOSITORY STATUS
-echo ================================================
-echo.
-cd /d "%~dp0\\.."
-python "05-utilities\\scripts\\repo-status\\generate_status.py"
-echo.
-echo Status report generated!
-choice /C YN /M "Open the status report now"
-if errorlevel 2 goto end
-if exist "05-utilities\\scripts\\repo-status\\repo_status_{safe_name.lower().replace('-', '_')}.txt" (
-    start notepad "05-utilities\\scripts\\repo-status\\repo_status_{safe_name.lower().replace('-', '_')}.txt"
-)
-:end
-pause"""
-        
-    Path("05-utilities/generate-status.bat").write_text(status_bat, encoding='utf-8')
+    out.write_template("common/start-server.bat", "05-utilities/start-server.bat", server_commands=server_commands)
+    out.write_template("common/generate-status.bat", "05-utilities/generate-status.bat")
 
-def create_gitignore(project_type, name):
+def create_gitignore(out, project_type, name):
     """Create appropriate .gitignore file"""
     
     gitignore_content = f"# {name} - {project_type.title()} Project .gitignore\n\n"
     
     if project_type == "web":
-        gitignore_content += """node_modules/
-*.log
-.env
-.DS_Store
-Thumbs.db
-dist/
-build/"""
-    
+        gitignore_content += out.render("web/gitignore")
     elif project_type == "python":
-        gitignore_content += """__pycache__/
-*.pyc
-*.pyo
-*.pyd
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-MANIFEST
-
-# Virtual environments
-venv/
-env/
-ENV/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db"""
-    
+        gitignore_content += out.render("python/gitignore")
     elif project_type in ["node", "react"]:
-        gitignore_content += """node_modules/
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-
-# Runtime data
-pids
-*.pid
-*.seed
-*.pid.lock
-
-# Coverage directory
-coverage/
-*.lcov
-
-# Dependency directories
-node_modules/
-jspm_packages/
-
-# Optional npm cache directory
-.npm
-
-# Optional eslint cache
-.eslintcache
-
-# Output of 'npm pack'
-*.tgz
-
-# dotenv environment variables file
-.env
-.env.test
-.env.production
-
-# Build outputs
-build/
-dist/
-
-# IDE
-.vscode/
-.idea/
-
-# OS
-.DS_Store
-Thumbs.db"""
+        gitignore_content += out.render("node/gitignore")
+    elif project_type == "docs":
+        gitignore_content += "# Virtual environments\nvenv/\n\n# Built site (mkdocs build, build_docs.py)\n01-core/site/\n"
     
-    Path(".gitignore").write_text(gitignore_content, encoding='utf-8')
+    gitignore_content += ("\n# Status history and git churn caches, bytecode of the modules generate_status.py imports\n"
+                          "05-utilities/scripts/repo-status/*.sqlite3*\n05-utilities/scripts/repo-status/__pycache__/\n")
+    
+    out.write_text(".gitignore", gitignore_content)
+
+def build_registry(templates_dirs=()):
+    """Registry of the built-in types plus any installed or local plugins"""
+    registry = TypeRegistry(templates_dirs=list(templates_dirs) + template_dirs_from_env())
+    registry.register("web", create_web_files, "HTML5/CSS3/JavaScript site with development server")
+    registry.register("python", create_python_files, "Python application with requirements.txt")
+    registry.register("node", create_node_files, "Node.js Express server")
+    registry.register("react", create_react_files, "React application")
+    registry.register("docs", create_docs_files, "MkDocs documentation site")
+    return registry
 
 def main():
+    # --templates-dir decides which --type values exist, so it is read before the full parser is built
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--templates-dir", action="append", default=[])
+    pre_args, _ = pre_parser.parse_known_args()
+    registry = build_registry(pre_args.templates_dir)
+    
+    if "--list-types" in sys.argv[1:]:
+        for type_name in registry.names():
+            info = registry.describe(type_name)
+            print(f"{type_name:<12} {info['source']:<12} {info['description']}")
+        return
+    
     parser = argparse.ArgumentParser(description="Universal Project Template Generator")
     parser.add_argument("name", help="Project name")
-    parser.add_argument("--type", choices=["web", "python", "node", "react", "docs"], 
+    parser.add_argument("--type", choices=registry.names(), 
                        default="web", help="Project type")
     parser.add_argument("--description", default="", help="Project description")
     parser.add_argument("--author", default=os.getenv('USER', 'Your Name'), help="Author name")
     parser.add_argument("--email", default="your.email@example.com", help="Author email")
     parser.add_argument("--path", default=".", help="Output path")
     parser.add_argument("--git", action="store_true", help="Initialize git repository")
+    variants = sorted({v for names in TEMPLATE_VARIANTS.values() for v in names})
+    parser.add_argument("--template", choices=["standard"] + variants, default="standard", dest="variant",
+                       help="Template variant: perf (web), data (python)")
+    parser.add_argument("--perf", action="store_const", const="perf", dest="variant",
+                       help="Shorthand for --template perf")
+    parser.add_argument("--link-deps", metavar="STORE",
+                       help="Link node_modules from a local package store instead of npm install (node, react)")
+    parser.add_argument("--venv", action="store_true",
+                       help="Create venv/ and install requirements offline while generating (python, docs)")
+    parser.add_argument("--wheelhouse", action="append", default=[], metavar="DIR",
+                       help="Folder (searched recursively) of wheels for --venv installs (repeatable)")
+    parser.add_argument("--venv-base", metavar="VENV",
+                       help="Clone this prebuilt virtualenv for --venv instead of creating one")
+    parser.add_argument("--templates-dir", action="append", default=[],
+                       help="Extra directory of <type>.py plugins (repeatable, also PROJECT_TEMPLATE_PATH)")
+    parser.add_argument("--cache", metavar="DIR", help="Reuse rendered output cached in DIR for repeated parameters")
+    parser.add_argument("--cache-size", type=int, default=100, metavar="MB", help="Output cache size limit (default: 100)")
+    parser.add_argument("--profile", nargs="?", const="create-project-trace.json", metavar="TRACE",
+                       help="Time every phase and file write, save a Chrome trace (default: create-project-trace.json)")
+    parser.add_argument("--inflight", type=int, default=DEFAULT_INFLIGHT, metavar="N",
+                       help=f"File writes in flight at once (default: {DEFAULT_INFLIGHT}); "
+                            "raise on NFS/SMB, 1 writes serially")
+    parser.add_argument("--list-types", action="store_true", help="List available project types and exit")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--quiet", action="store_true", help="Only print warnings and errors")
+    output.add_argument("--json-events", action="store_true", help="Print progress as JSON lines (one event per line)")
     
     args = parser.parse_args()
-    
-    success = create_project(
-        name=args.name,
-        project_type=args.type,
-        description=args.description,
-        author=args.author,
-        email=args.email,
-        path=args.path,
-        git=args.git
-    )
+    if (args.wheelhouse or args.venv_base) and not args.venv:
+        parser.error("--wheelhouse and --venv-base need --venv")
+    if args.inflight < 1:
+        parser.error("--inflight must be at least 1")
+    
+    profiler = Profiler() if args.profile else NULL_PROFILER
+    if args.json_events:
+        events = JsonLinesSink()
+    elif args.quiet:
+        events = QuietSink()
+    else:
+        events = ConsoleSink()
+    # Resolved up front: create_project changes into the new project directory
+    trace_path = Path(args.profile).absolute() if args.profile else None
+    
+    with profiler.span("create_project", "total"):
+        success = create_project(
+            name=args.name,
+            project_type=args.type,
+            description=args.description,
+            author=args.author,
+            email=args.email,
+            path=args.path,
+            git=args.git,
+            registry=registry,
+            cache=OutputCache(args.cache, args.cache_size * 1024 * 1024) if args.cache else None,
+            profiler=profiler,
+            events=events,
+            variant=args.variant,
+            link_deps=args.link_deps,
+            # Absolute, since create_project changes into the new project directory
+            venv=VenvOptions([os.path.abspath(os.path.expanduser(p)) for p in args.wheelhouse],
+                             os.path.abspath(os.path.expanduser(args.venv_base)) if args.venv_base else None)
+                 if args.venv else None,
+            inflight=args.inflight
+        )
+    events.close()
+    
+    if args.profile:
+        profiler.write_chrome_trace(trace_path)
+        # Keep stdout machine-readable when it carries JSON events
+        stream = sys.stderr if args.json_events else sys.stdout
+        print("\n⏱️ Generation profile", file=stream)
+        print(profiler.summary(), file=stream)
+        print(f"📈 Chrome trace saved: {trace_path}", file=stream)
     
     if not success:
         sys.exit(1)
@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+Dependency Store
+Offline, content-addressed package store shared by node and react projects
+
+Packages enter the store from local npm tarballs (`npm pack` output, a
+folder of .tgz files, or npm's own download cache) and are never fetched.
+Every file is stored once under the SHA-256 of its contents, so a hundred
+projects using the same express version share one copy on disk.
+
+`link_project` lays out node_modules the way pnpm does:
+
+    node_modules/express -> .store/express@4.18.2/node_modules/express
+    node_modules/.store/express@4.18.2/node_modules/express/...   hardlinks into the store
+    node_modules/.store/express@4.18.2/node_modules/accepts -> ../../accepts@1.3.8/node_modules/accepts
+
+Each package sees exactly its own dependencies, node resolves them through
+the symlinks, and linking is a few thousand link() calls instead of an
+install. Hardlinks fall back to copies across filesystems, directory
+symlinks fall back to junctions on Windows. Install scripts are not run.
+
+Store layout:
+    files/ab/cdef...          file contents by SHA-256 ("-exec" suffix for executables)
+    index/<name>@<version>.json   {"package": package.json, "files": {path: digest}}
+    tarballs/                 drop .tgz files here; they are ingested on the next link
+
+Usage:
+    python dep_store.py add STORE express-4.18.2.tgz tarballs/ ...
+    python dep_store.py add STORE --npm-cache          # everything npm has downloaded before
+    python dep_store.py link STORE path/to/01-core
+    python dep_store.py list STORE
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import tarfile
+import argparse
+import subprocess
+from pathlib import Path
+from collections import namedtuple
+
+STORE_FORMAT = 1
+VIRTUAL_DIR = ".store"
+COMPLETE_MARKER = ".linked"
+CHUNK_SIZE = 1024 * 1024
+
+LinkResult = namedtuple("LinkResult", "packages linked reused files copied missing")
+
+
+class DepStoreError(Exception):
+    """Raised when the store or a project cannot be read or linked"""
+
+
+# ---------------------------------------------------------------------------
+# Versions and ranges (the subset of node-semver that package.json files use)
+
+PARTIAL = re.compile(r"v?(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?")
+OPERATOR = re.compile(r"(>=|<=|>|<|=|\^|~>|~)\s*")
+
+
+def _prerelease_key(text):
+    return tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in text.split("."))
+
+
+def version_key(major, minor, patch, prerelease=None):
+    """Sort key: a prerelease sorts before its release, () is the lowest prerelease"""
+    if prerelease is None:
+        return (major, minor, patch, 1, ())
+    return (major, minor, patch, 0, prerelease)
+
+
+def parse_version(text):
+    """Key of a full version such as 1.2.3 or 1.2.3-beta.1, or None"""
+    match = PARTIAL.fullmatch(text.strip())
+    if not match or not all(part and part.isdigit() for part in match.group(1, 2, 3)):
+        return None
+    major, minor, patch = (int(part) for part in match.group(1, 2, 3))
+    prerelease = _prerelease_key(match.group(4)) if match.group(4) else None
+    return version_key(major, minor, patch, prerelease)
+
+
+def _parse_partial(text):
+    match = PARTIAL.fullmatch(text)
+    if not match:
+        raise ValueError(f"not a version: {text!r}")
+    parts = []
+    for part in match.group(1, 2, 3):
+        # A wildcard makes every later part a wildcard too (1.x.3 means 1.x)
+        if part is None or part in "xX*" or (parts and parts[-1] is None):
+            parts.append(None)
+        else:
+            parts.append(int(part))
+    prerelease = _prerelease_key(match.group(4)) if match.group(4) and parts[2] is not None else None
+    return parts, prerelease
+
+
+def _floor(major, minor, patch):
+    return version_key(major, minor, patch, ())
+
+
+def _comparators(op, text):
+    """Translate one range term into (operator, key) pairs that must all hold"""
+    (major, minor, patch), pre = _parse_partial(text)
+    if major is None:
+        return [] if op in ("", "=", ">=", "<=", "^", "~") else [("<", _floor(0, 0, 0))]
+    low = version_key(major, minor or 0, patch or 0, pre)
+
+    if op in ("", "="):
+        if patch is not None:
+            return [("==", low)]
+        if minor is None:
+            return [(">=", low), ("<", _floor(major + 1, 0, 0))]
+        return [(">=", low), ("<", _floor(major, minor + 1, 0))]
+    if op == "^":
+        if major > 0 or minor is None:
+            high = _floor(major + 1, 0, 0)
+        elif minor > 0 or patch is None:
+            high = _floor(0, minor + 1, 0)
+        else:
+            high = _floor(0, 0, patch + 1)
+        return [(">=", low), ("<", high)]
+    if op in ("~", "~>"):
+        high = _floor(major + 1, 0, 0) if minor is None else _floor(major, minor + 1, 0)
+        return [(">=", low), ("<", high)]
+    if op == ">=":
+        return [(">=", low)]
+    if op == ">":
+        if patch is not None:
+            return [(">", low)]
+        if minor is not None:
+            return [(">=", _floor(major, minor + 1, 0))]
+        return [(">=", _floor(major + 1, 0, 0))]
+    if op == "<":
+        return [("<", _floor(major, minor or 0, patch or 0) if pre is None else low)]
+    # "<="
+    if patch is not None:
+        return [("<=", low)]
+    if minor is not None:
+        return [("<", _floor(major, minor + 1, 0))]
+    return [("<", _floor(major + 1, 0, 0))]
+
+
+def parse_range(spec):
+    """List of alternatives, each a list of (operator, key) pairs; raises ValueError"""
+    spec = spec.strip()
+    if spec in ("", "*", "latest", "x", "X"):
+        return [[]]
+    alternatives = []
+    for alternative in spec.split("||"):
+        alternative = alternative.strip()
+        terms = []
+        hyphen = re.fullmatch(r"(\S+)\s+-\s+(\S+)", alternative)
+        if hyphen:
+            terms += _comparators(">=", hyphen.group(1)) + _comparators("<=", hyphen.group(2))
+        else:
+            for token in OPERATOR.sub(lambda m: m.group(1), alternative).split():
+                op = OPERATOR.match(token)
+                terms += _comparators(op.group(1) if op else "", token[op.end():] if op else token)
+        alternatives.append(terms)
+    return alternatives
+
+
+CHECKS = {
+    "==": lambda a, b: a == b,
+    ">=": lambda a, b: a >= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+}
+
+
+def satisfies(version, spec):
+    """True if a version string is inside a range string (prereleases only match exactly)"""
+    key = parse_version(version)
+    if key is None:
+        return False
+    try:
+        alternatives = parse_range(spec)
+    except ValueError:
+        return False
+    if key[3] == 0 and not any(("==", key) in terms for terms in alternatives):
+        return False
+    return any(all(CHECKS[op](key, bound) for op, bound in terms) for terms in alternatives)
+
+
+def max_satisfying(versions, spec):
+    matching = [v for v in versions if satisfies(v, spec)]
+    return max(matching, key=parse_version) if matching else None
+
+
+# ---------------------------------------------------------------------------
+# The store
+
+def flat_name(name):
+    """Package name as a single path component (@scope/pkg -> @scope+pkg)"""
+    return name.replace("/", "+")
+
+
+def _safe_member_path(name):
+    """Path inside the package, without the tarball's top folder; None if unsafe"""
+    parts = name.replace("\\", "/").split("/")[1:]
+    if not parts or any(part in ("", ".", "..") for part in parts) or ":" in parts[0]:
+        return None
+    return "/".join(parts)
+
+
+class DepStore:
+    """Content-addressed files plus one JSON index per package version"""
+
+    def __init__(self, root):
+        # Absolute, since create_project changes into the new project directory
+        self.root = Path(root).absolute()
+        self.files_dir = self.root / "files"
+        self.index_dir = self.root / "index"
+        self.tarballs_dir = self.root / "tarballs"
+        self._versions = None
+
+    def ensure(self):
+        for directory in (self.files_dir, self.index_dir, self.tarballs_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def file_path(self, digest):
+        return self.files_dir / digest[:2] / digest[2:]
+
+    def _index_path(self, name, version):
+        return self.index_dir / f"{flat_name(name)}@{version}.json"
+
+    # Adding packages
+
+    def _store_stream(self, stream, executable):
+        """Copy a file object into the store, returns its digest"""
+        hasher = hashlib.sha256()
+        tmp_path = self.files_dir / f"tmp-{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                f.write(chunk)
+        digest = hasher.hexdigest() + ("-exec" if executable else "")
+        path = self.file_path(digest)
+        if path.exists():
+            tmp_path.unlink()
+        else:
+            path.parent.mkdir(exist_ok=True)
+            os.chmod(tmp_path, 0o755 if executable else 0o644)
+            tmp_path.replace(path)
+        return digest
+
+    def add_tarball(self, tarball, force=False):
+        """Ingest one npm tarball, returns (name, version, added)"""
+        self.ensure()
+        files = {}
+        manifest = None
+        try:
+            with tarfile.open(tarball, "r:gz") as archive:
+                for member in archive:
+                    relpath = _safe_member_path(member.name)
+                    if not member.isfile() or relpath is None:
+                        continue
+                    stream = archive.extractfile(member)
+                    if relpath == "package.json":
+                        data = stream.read()
+                        manifest = json.loads(data.decode("utf-8"))
+                        stream = io.BytesIO(data)
+                    files[relpath] = self._store_stream(stream, bool(member.mode & 0o111))
+        except (OSError, tarfile.TarError, ValueError) as e:
+            raise DepStoreError(f"{tarball}: not a readable npm tarball ({e})")
+        if not manifest or not manifest.get("name") or not manifest.get("version"):
+            raise DepStoreError(f"{tarball}: package.json without name and version")
+
+        name, version = manifest["name"], manifest["version"]
+        index_path = self._index_path(name, version)
+        if index_path.exists() and not force:
+            return name, version, False
+
+        # Bin scripts are executed directly, whatever mode the tarball gave them
+        for relpath in _bin_entries(manifest).values():
+            digest = files.get(relpath)
+            if digest and not digest.endswith("-exec"):
+                with open(self.file_path(digest), "rb") as f:
+                    files[relpath] = self._store_stream(f, True)
+
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"format": STORE_FORMAT, "package": manifest, "files": files}),
+                            encoding="utf-8")
+        tmp_path.replace(index_path)
+        self._versions = None
+        return name, version, True
+
+    def add(self, paths, force=False):
+        """Ingest tarballs and folders of tarballs, returns [(name, version, added)]"""
+        results = []
+        for path in paths:
+            path = Path(path)
+            candidates = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+            for candidate in candidates:
+                if path.is_dir() and not _looks_gzipped(candidate):
+                    continue
+                try:
+                    results.append(self.add_tarball(candidate, force))
+                except DepStoreError:
+                    if not path.is_dir():
+                        raise
+        return results
+
+    def sync(self):
+        """Ingest tarballs dropped into STORE/tarballs/ since the last sync"""
+        if not self.tarballs_dir.is_dir():
+            return []
+        seen_path = self.index_dir / "tarballs-seen.json"
+        try:
+            seen = json.loads(seen_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            seen = {}
+        results = []
+        for tarball in sorted(self.tarballs_dir.glob("*.tgz")):
+            stat = tarball.stat()
+            stamp = [stat.st_size, stat.st_mtime_ns]
+            if seen.get(tarball.name) == stamp:
+                continue
+            try:
+                results.append(self.add_tarball(tarball))
+            except DepStoreError:
+                pass
+            seen[tarball.name] = stamp
+        if results or not seen_path.exists():
+            self.ensure()
+            seen_path.write_text(json.dumps(seen), encoding="utf-8")
+        return results
+
+    # Reading packages
+
+    def versions(self):
+        """{name: [version, ...]} of every package in the store"""
+        if self._versions is None:
+            self._versions = {}
+            if self.index_dir.is_dir():
+                for path in self.index_dir.glob("*@*.json"):
+                    flat, _, version = path.stem.rpartition("@")
+                    self._versions.setdefault(flat, []).append(version)
+        return self._versions
+
+    def best_version(self, name, spec):
+        return max_satisfying(self.versions().get(flat_name(name), []), spec)
+
+    def manifest(self, name, version):
+        try:
+            entry = json.loads(self._index_path(name, version).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise DepStoreError(f"{name}@{version}: unreadable store index ({e})")
+        return entry
+
+
+def _looks_gzipped(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(2) == b"\x1f\x8b"
+    except OSError:
+        return False
+
+
+def _bin_entries(manifest):
+    """{command: path inside the package} from package.json "bin" """
+    bins = manifest.get("bin")
+    if isinstance(bins, str):
+        bins = {manifest["name"].split("/")[-1]: bins}
+    if not isinstance(bins, dict):
+        return {}
+    return {command: os.path.normpath(path).replace("\\", "/") for command, path in bins.items()
+            if isinstance(path, str)}
+
+
+# ---------------------------------------------------------------------------
+# Resolving and linking a project
+
+def resolve(store, package_json):
+    """Pick a store version for every dependency, transitively
+
+    Returns (packages, top_level, missing): packages maps "name@version" to
+    its manifest and resolved {dependency: "name@version"}, top_level maps the
+    project's own dependency names to their keys, missing lists
+    (name, range, required_by) that the store cannot satisfy.
+    """
+    direct = {}
+    for field in ("dependencies", "devDependencies", "optionalDependencies"):
+        direct.update(package_json.get(field) or {})
+
+    packages = {}
+    top_level = {}
+    missing = []
+    chosen = {}   # name -> first version picked, preferred for peers
+
+    def pick(name, spec, required_by, optional=False):
+        version = store.best_version(name, spec)
+        if version is None:
+            if not optional:
+                missing.append((name, spec, required_by))
+            return None
+        key = f"{name}@{version}"
+        chosen.setdefault(name, version)
+        if key not in packages:
+            packages[key] = None
+            queue.append((key, name, version))
+        return key
+
+    queue = []
+    optional_direct = package_json.get("optionalDependencies") or {}
+    for name, spec in sorted(direct.items()):
+        key = pick(name, spec, "(project)", optional=name in optional_direct)
+        if key:
+            top_level[name] = key
+
+    while queue:
+        key, name, version = queue.pop()
+        manifest = store.manifest(name, version)["package"]
+        deps = {}
+        optional = manifest.get("optionalDependencies") or {}
+        for dep, spec in sorted(dict(manifest.get("dependencies") or {}, **optional).items()):
+            dep_key = pick(dep, spec, key, optional=dep in optional)
+            if dep_key:
+                deps[dep] = dep_key
+        # Peers resolve to the version the project already uses when it fits
+        peer_meta = manifest.get("peerDependenciesMeta") or {}
+        for dep, spec in sorted((manifest.get("peerDependencies") or {}).items()):
+            if dep in deps:
+                continue
+            if dep in chosen and satisfies(chosen[dep], spec):
+                deps[dep] = f"{dep}@{chosen[dep]}"
+            else:
+                dep_key = pick(dep, spec, key, optional=peer_meta.get(dep, {}).get("optional", False))
+                if dep_key:
+                    deps[dep] = dep_key
+        packages[key] = {"name": name, "version": version, "deps": deps}
+
+    return packages, top_level, missing
+
+
+def _package_dir(virtual, name, version):
+    return virtual / f"{flat_name(name)}@{version}" / "node_modules" / name
+
+
+def _link_file(source, target):
+    """Hardlink a store file into a package; returns False if it had to be copied"""
+    try:
+        os.link(source, target)
+        return True
+    except FileExistsError:
+        return True
+    except OSError:
+        shutil.copy2(source, target)
+        return False
+
+
+def _link_dir(target, link):
+    """Relative directory symlink, or a junction where Windows refuses symlinks"""
+    relative = os.path.relpath(target, link.parent)
+    if os.path.islink(link) and os.readlink(link) == relative:
+        return
+    link.parent.mkdir(parents=True, exist_ok=True)
+    if os.path.lexists(link):
+        try:
+            os.unlink(link)
+        except OSError:
+            # Junctions (and empty folders) go with rmdir; a real package folder is left alone
+            try:
+                os.rmdir(link)
+            except OSError:
+                raise DepStoreError(f"{link} is a folder, not a link into the store")
+    try:
+        os.symlink(relative, link, target_is_directory=True)
+    except OSError:
+        if os.name != "nt":
+            raise
+        subprocess.run(["cmd", "/c", "mklink", "/J", str(link), str(target)], check=True, capture_output=True)
+
+
+def _link_bin(bin_dir, command, script):
+    bin_dir.mkdir(exist_ok=True)
+    if os.name == "nt":
+        relative = os.path.relpath(script, bin_dir).replace("/", "\\")
+        (bin_dir / f"{command}.cmd").write_text(f'@node "%~dp0\\{relative}" %*\r\n', encoding="utf-8")
+        return
+    link = bin_dir / command
+    if os.path.lexists(link):
+        os.unlink(link)
+    os.symlink(os.path.relpath(script, bin_dir), link)
+
+
+def link_project(project_dir, store):
+    """Lay out project_dir/node_modules from the store; returns a LinkResult
+
+    Package folders that a previous run completed are reused, so relinking
+    after adding a dependency only materializes the new packages.
+    """
+    project_dir = Path(project_dir)
+    try:
+        package_json = json.loads((project_dir / "package.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise DepStoreError(f"Cannot read {project_dir / 'package.json'}: {e}")
+
+    node_modules = project_dir / "node_modules"
+    virtual = node_modules / VIRTUAL_DIR
+    if node_modules.is_dir() and not virtual.is_dir() and any(node_modules.iterdir()):
+        raise DepStoreError(f"{node_modules} was installed by npm; remove it before linking from the store")
+
+    store.sync()
+    packages, top_level, missing = resolve(store, package_json)
+
+    linked = reused = files = copied = 0
+    for key, package in sorted(packages.items()):
+        name, version = package["name"], package["version"]
+        package_dir = _package_dir(virtual, name, version)
+        marker = virtual / f"{flat_name(name)}@{version}" / COMPLETE_MARKER
+        if marker.exists():
+            reused += 1
+        else:
+            entry = store.manifest(name, version)
+            made = set()
+            for relpath, digest in entry["files"].items():
+                target = package_dir / relpath
+                if target.parent not in made:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    made.add(target.parent)
+                if not _link_file(store.file_path(digest), target):
+                    copied += 1
+                files += 1
+            package_dir.mkdir(parents=True, exist_ok=True)
+            linked += 1
+        # Siblings of the package folder are exactly its dependencies
+        siblings = virtual / f"{flat_name(name)}@{version}" / "node_modules"
+        for dep, dep_key in package["deps"].items():
+            dep_package = packages[dep_key]
+            _link_dir(_package_dir(virtual, dep_package["name"], dep_package["version"]), siblings / dep)
+        marker.touch()
+
+    bin_dir = node_modules / ".bin"
+    for name, key in sorted(top_level.items()):
+        package = packages[key]
+        package_dir = _package_dir(virtual, package["name"], package["version"])
+        _link_dir(package_dir, node_modules / name)
+        manifest = store.manifest(package["name"], package["version"])["package"]
+        for command, relpath in _bin_entries(manifest).items():
+            _link_bin(bin_dir, command, package_dir / relpath)
+
+    return LinkResult(len(packages), linked, reused, files, copied, missing)
+
+
+def default_npm_cache():
+    """Folder of npm's content-addressed download cache (tarballs and metadata)"""
+    root = os.environ.get("npm_config_cache")
+    if not root:
+        base = os.environ.get("LOCALAPPDATA") if os.name == "nt" else None
+        root = Path(base) / "npm-cache" if base else Path.home() / ".npm"
+    return Path(root) / "_cacache" / "content-v2"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline content-addressed package store for node projects")
+    parser.add_argument("command", choices=["add", "link", "list"], help="Action to perform")
+    parser.add_argument("store", help="Store directory")
+    parser.add_argument("paths", nargs="*", help="add: tarballs or folders of tarballs; link: project folder")
+    parser.add_argument("--npm-cache", action="store_true", help="add: ingest every tarball in npm's download cache")
+    parser.add_argument("--force", action="store_true", help="add: re-index versions already in the store")
+    args = parser.parse_args()
+
+    store = DepStore(args.store)
+    try:
+        if args.command == "add":
+            paths = list(args.paths) + ([default_npm_cache()] if args.npm_cache else [])
+            if not paths:
+                parser.error("add needs tarballs, folders or --npm-cache")
+            results = store.add(paths, args.force)
+            added = [f"{name}@{version}" for name, version, new in results if new]
+            for package in added:
+                print(f"✅ Added {package}")
+            print(f"📦 {len(added)} added, {len(results) - len(added)} already in {store.root}")
+        elif args.command == "link":
+            project = Path(args.paths[0] if args.paths else ".")
+            result = link_project(project, store)
+            print(f"🔗 {result.packages} packages: {result.linked} linked ({result.files} files, "
+                  f"{result.copied} copied), {result.reused} already in place")
+            for name, spec, required_by in result.missing:
+                print(f"⚠️ Not in store: {name}@{spec} (required by {required_by})")
+            if result.missing:
+                sys.exit(1)
+        else:
+            for flat, versions in sorted(store.versions().items()):
+                print(f"{flat.replace('+', '/')}: {', '.join(sorted(versions, key=parse_version))}")
+    except DepStoreError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Generation Events
+Structured progress events and the sinks that render them
+
+create_project reports progress as events instead of printing directly:
+
+    project_start   name, path, type
+    phase_start     phase
+    phase_end       phase
+    dir_created     path
+    file_written    path, bytes     (only sent to sinks with detail = True)
+    cache_hit       files
+    deps_linked     packages, files, copied, missing
+    venv_ready      path, method, installed, seconds
+    git_initialized
+    warning         message
+    error           message
+    project_done    name, path, type, next_steps
+
+Built-in sinks:
+    ConsoleSink     the familiar emoji progress output, written in batches
+    QuietSink       nothing but warnings and errors (on stderr)
+    JsonLinesSink   one JSON object per event, buffered
+
+Any object with `detail`, `emit(kind, **data)` and `close()` can be a sink.
+"""
+
+import sys
+import json
+import time
+from collections import namedtuple
+
+Event = namedtuple("Event", "kind time data")
+
+
+class EventSink:
+    """Base sink: builds Event tuples and hands them to handle()"""
+
+    # Sinks that set detail = True also receive one file_written event per file
+    detail = False
+
+    def emit(self, kind, **data):
+        self.handle(Event(kind, time.time(), data))
+
+    def handle(self, event):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NullSink(EventSink):
+    """Discards every event"""
+
+    def emit(self, kind, **data):
+        pass
+
+    def handle(self, event):
+        pass
+
+
+class ConsoleSink(EventSink):
+    """Pretty console renderer that batches lines instead of flushing each one"""
+
+    def __init__(self, stream=None, batch_lines=64):
+        self.stream = stream or sys.stdout
+        self.batch_lines = batch_lines
+        self._lines = []
+
+    def handle(self, event):
+        lines = self.render(event)
+        if lines:
+            self._lines.extend(lines)
+        if len(self._lines) >= self.batch_lines or event.kind in ("phase_end", "warning", "error", "project_done"):
+            self.flush()
+
+    def render(self, event):
+        """Lines for one event (empty for events the console does not show)"""
+        data = event.data
+        kind = event.kind
+        if kind == "project_start":
+            return [f"🚀 Creating project: {data['name']}",
+                    f"📁 Location: {data['path']}",
+                    f"🎯 Type: {data['type']}"]
+        if kind == "dir_created":
+            return [f"✅ Created: {data['path']}"]
+        if kind == "cache_hit":
+            return [f"♻️ Restored {data['files']} files from cache"]
+        if kind == "deps_linked":
+            return [f"🔗 Linked {data['packages']} packages ({data['files']} new files) from the dependency store"]
+        if kind == "venv_ready":
+            return [f"🐍 Virtual environment {data['method']}: venv ({data['installed']} packages installed, "
+                    f"{data['seconds']:.1f}s)"]
+        if kind == "git_initialized":
+            return ["✅ Git repository initialized"]
+        if kind == "warning":
+            return [f"⚠️ {data['message']}"]
+        if kind == "error":
+            return [f"❌ {data['message']}"]
+        if kind == "project_done":
+            return ([f"\n🎉 Project '{data['name']}' created successfully!",
+                     f"📁 Location: {data['path']}",
+                     f"🎯 Type: {data['type']}",
+                     "\n🚀 Next steps:"]
+                    + [f"  {step}" for step in data["next_steps"]]
+                    + ["\n📖 See README.md for full instructions"])
+        return []
+
+    def flush(self):
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self._lines = []
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+class QuietSink(ConsoleSink):
+    """Only warnings and errors, written to stderr"""
+
+    def __init__(self, stream=None):
+        super().__init__(stream or sys.stderr)
+
+    def render(self, event):
+        if event.kind in ("warning", "error"):
+            return super().render(event)
+        return []
+
+
+class JsonLinesSink(EventSink):
+    """Buffered JSON lines: {"event": kind, "time": ..., **data}"""
+
+    detail = True
+
+    def __init__(self, stream=None, batch_events=256):
+        self.stream = stream or sys.stdout
+        self.batch_events = batch_events
+        self._buffer = []
+
+    def handle(self, event):
+        record = {"event": event.kind, "time": round(event.time, 6)}
+        record.update(event.data)
+        self._buffer.append(json.dumps(record, default=str))
+        if len(self._buffer) >= self.batch_events or event.kind == "project_done":
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self.stream.write("\n".join(self._buffer) + "\n")
+            self._buffer = []
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+class ProfiledSink(EventSink):
+    """Wraps a sink so the time spent emitting shows up as output spans"""
+
+    def __init__(self, sink, profiler):
+        self.sink = sink
+        self.profiler = profiler
+        self.detail = sink.detail
+
+    def emit(self, kind, **data):
+        with self.profiler.span(kind, "output"):
+            self.sink.emit(kind, **data)
+
+    def close(self):
+        with self.profiler.span("close", "output"):
+            self.sink.close()
+
+
+NULL_SINK = NullSink()
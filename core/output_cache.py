@@ -0,0 +1,145 @@
+"""
+Output Cache
+Opt-in, size-bounded LRU cache of rendered project manifests
+
+Generating the same (type, name, description, author, email) twice renders
+exactly the same files, except for the date stamps ($created, $year) that
+templates embed. While recording, those values are rendered as stamp tokens
+and only replaced with real dates when a file is written, so a cached
+manifest stays valid on later days: a hit replays the manifest with today's
+stamps instead of re-rendering every template.
+
+Entries are JSON files named by a hash of the parameters, the generator
+version and the template pack digest. Reading an entry refreshes its
+mtime; when the cache grows past its size limit the least recently used
+entries are deleted.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+from project_writer import ProjectWriter, DEFAULT_INFLIGHT
+from profiling import NULL_PROFILER
+from events import NULL_SINK
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# NUL cannot appear in command-line arguments, so the tokens never collide with user input
+STAMP_TOKENS = {
+    "created": "\0created\0",
+    "year": "\0year\0",
+}
+
+
+def cache_key(generator_version, pack_digest, **params):
+    """Hash of everything that determines the generated output"""
+    payload = json.dumps([CACHE_FORMAT, generator_version, pack_digest, params], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def stamp_context(context):
+    """Split a template context into a date-free context and the stamps to apply on write"""
+    stamps = {token: context[field] for field, token in STAMP_TOKENS.items()}
+    context = dict(context, **STAMP_TOKENS)
+    return context, stamps
+
+
+def apply_stamps(text, stamps):
+    if "\0" not in text:
+        return text
+    for token, value in stamps.items():
+        text = text.replace(token, value)
+    return text
+
+
+class RecordingWriter(ProjectWriter):
+    """ProjectWriter that keeps an unstamped copy of every folder and file it writes"""
+
+    def __init__(self, root, pack, context, profiler=NULL_PROFILER, events=NULL_SINK, inflight=DEFAULT_INFLIGHT):
+        context, self.stamps = stamp_context(context)
+        super().__init__(root, pack, context, profiler, events, inflight)
+        self.ops = []
+
+    def mkdir(self, relpath):
+        super().mkdir(relpath)
+        self.ops.append(["dir", str(relpath)])
+
+    def write_text(self, relpath, text):
+        self.ops.append(["file", str(relpath), text])
+        super().write_text(relpath, apply_stamps(text, self.stamps))
+
+
+def replay(ops, out, stamps):
+    """Write a recorded manifest through a writer, returns the number of files written"""
+    files = 0
+    for op in ops:
+        if op[0] == "dir":
+            out.mkdir(op[1])
+        else:
+            out.write_text(op[1], apply_stamps(op[2], stamps))
+            files += 1
+    return files
+
+
+class OutputCache:
+    """Directory of manifest files with least-recently-used eviction"""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        # Absolute, since create_project changes into the new project directory
+        self.directory = Path(directory).absolute()
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        """Return the recorded ops for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("format") != CACHE_FORMAT:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["ops"]
+
+    def put(self, key, ops):
+        """Store recorded ops under key, then evict down to the size limit"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"format": CACHE_FORMAT, "ops": ops}), encoding='utf-8')
+        tmp_path.replace(path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,115 @@
+"""
+Generation Profiler
+Records timed spans for generation phases and file writes
+
+Spans can be exported as a Chrome trace-event file (open it in
+chrome://tracing or https://ui.perfetto.dev) and summarised as a table.
+Code that is instrumented takes a profiler and calls
+`profiler.span(name, category, **args)`; pass NULL_PROFILER (the default
+everywhere) to turn profiling off at the cost of one no-op context manager.
+"""
+
+import os
+import json
+import threading
+from contextlib import nullcontext
+from time import perf_counter_ns
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "category", "args", "start")
+
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.category, self.start, perf_counter_ns(), **self.args)
+
+
+class Profiler:
+    """Collects spans in memory; thread-safe so parallel writers can share one"""
+
+    enabled = True
+
+    def __init__(self):
+        self.spans = []
+        self.origin = perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def span(self, name, category, **args):
+        """Context manager timing a block as one span"""
+        return _Span(self, name, category, args)
+
+    def add(self, name, category, start_ns, end_ns, **args):
+        """Record a span measured elsewhere (perf_counter_ns timestamps)"""
+        record = (name, category, start_ns, end_ns, threading.get_ident(), args)
+        with self._lock:
+            self.spans.append(record)
+
+    def chrome_trace(self):
+        """Spans as a Chrome trace-event document"""
+        pid = os.getpid()
+        events = []
+        for name, category, start, end, tid, args in self.spans:
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            })
+        events.sort(key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def totals(self):
+        """Per-category (count, total ns, bytes) in first-seen order"""
+        totals = {}
+        for _, category, start, end, _, args in self.spans:
+            count, elapsed, size = totals.get(category, (0, 0, 0))
+            totals[category] = (count + 1, elapsed + end - start, size + args.get("bytes", 0))
+        return totals
+
+    def summary(self, slowest=5):
+        """Human-readable table of per-category totals and the slowest spans"""
+        lines = [f"{'Category':<12} {'Spans':>6} {'Total ms':>10} {'Bytes':>10}"]
+        for category, (count, elapsed, size) in self.totals().items():
+            lines.append(f"{category:<12} {count:>6} {elapsed / 1e6:>10.3f} {size or '':>10}")
+
+        spans = sorted(self.spans, key=lambda s: s[3] - s[2], reverse=True)
+        spans = [s for s in spans if s[1] not in ("phase", "total")][:slowest]
+        if spans:
+            lines.append("")
+            lines.append("Slowest spans:")
+            for name, category, start, end, _, _ in spans:
+                lines.append(f"  {(end - start) / 1e6:>8.3f} ms  {category:<8} {name}")
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Profiler stand-in that records nothing"""
+
+    enabled = False
+    _span = nullcontext()
+
+    def span(self, name, category, **args):
+        return self._span
+
+    def add(self, name, category, start_ns, end_ns, **args):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
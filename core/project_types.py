@@ -0,0 +1,251 @@
+"""
+Project Type Registry
+Resolves --type names to generator functions without importing plugins up front
+
+Project types come from three places:
+    built-in    the create_*_files functions in create-project.py
+    installed   entry points in the "project_template.types" group
+    local       <templates dir>/<type>.py files (--templates-dir or PROJECT_TEMPLATE_PATH)
+
+Discovered plugins are indexed into a cached JSON manifest, so listing the
+available types (for --help and --type validation) never imports a plugin.
+The manifest keeps one index per setup (interpreter path plus templates
+dirs), so alternating --templates-dir sets, checkouts or venvs each hit
+their own entry instead of overwriting a shared one.
+A plugin module is only imported when its type is generated.
+
+A plugin is a callable with the same signature as the built-ins:
+    create_files(out, name, safe_name, description, author, email)
+where `out` is the ProjectWriter for the new project. Local plugin files
+must define `create_files`; their module docstring is used as description.
+"""
+
+import os
+import ast
+import json
+import hashlib
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+ENTRY_POINT_GROUP = "project_template.types"
+TEMPLATE_PATH_ENV = "PROJECT_TEMPLATE_PATH"
+LOCAL_PLUGIN_FUNCTION = "create_files"
+MANIFEST_VERSION = 2
+MANIFEST_SETUPS = 16  # setups kept in the manifest, least recently written dropped first
+
+
+class ProjectTypeError(Exception):
+    """Raised when a project type is unknown or its plugin cannot be loaded"""
+
+
+def default_manifest_path():
+    """Location of the plugin manifest cache (honours XDG_CACHE_HOME)"""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "project-template" / "plugins.json"
+
+
+def template_dirs_from_env():
+    """Local plugin directories listed in PROJECT_TEMPLATE_PATH"""
+    value = os.getenv(TEMPLATE_PATH_ENV, "")
+    return [Path(part) for part in value.split(os.pathsep) if part]
+
+
+class TypeRegistry:
+    """Project types by name, with plugins indexed lazily from a manifest cache"""
+
+    def __init__(self, templates_dirs=(), manifest_path=None, discover_installed=True):
+        self.templates_dirs = [Path(d) for d in templates_dirs]
+        self.manifest_path = Path(manifest_path) if manifest_path else default_manifest_path()
+        self.discover_installed = discover_installed
+        self._builtins = {}
+        self._plugins = None
+        self._loaded = {}
+
+    def register(self, name, factory, description=""):
+        """Register a built-in type; built-ins cannot be shadowed by plugins"""
+        self._builtins[name] = {"source": "built-in", "description": description}
+        self._loaded[name] = factory
+
+    def names(self):
+        """All available type names, built-ins first"""
+        plugins = sorted(n for n in self._plugin_index() if n not in self._builtins)
+        return list(self._builtins) + plugins
+
+    def describe(self, name):
+        """Return the manifest record (source, description, ...) for a type"""
+        if name in self._builtins:
+            return self._builtins[name]
+        try:
+            return self._plugin_index()[name]
+        except KeyError:
+            raise ProjectTypeError(f"Unknown project type: {name}") from None
+
+    def __contains__(self, name):
+        return name in self._builtins or name in self._plugin_index()
+
+    def is_builtin(self, name):
+        return name in self._builtins
+
+    def load(self, name):
+        """Return the generator callable for a type, importing its plugin on first use"""
+        if name in self._loaded:
+            return self._loaded[name]
+
+        record = self.describe(name)
+        if record["source"] == "entry-point":
+            factory = _load_reference(record["ref"])
+        else:
+            factory = _load_local(name, record["path"])
+        if not callable(factory):
+            raise ProjectTypeError(f"Plugin for '{name}' is not callable: {record}")
+        self._loaded[name] = factory
+        return factory
+
+    def refresh(self):
+        """Re-scan plugins and rewrite the manifest cache"""
+        self._plugins = self._discover(self._fingerprint())
+        return self._plugins
+
+    def _plugin_index(self):
+        if self._plugins is None:
+            fingerprint = self._fingerprint()
+            entry = self._read_manifest().get(self._setup_key())
+            if entry and entry.get("fingerprint") == fingerprint:
+                self._plugins = entry["types"]
+            else:
+                self._plugins = self._discover(fingerprint)
+        return self._plugins
+
+    def _setup_key(self):
+        """Which plugins can be seen at all: the searched paths, without their mtimes"""
+        digest = hashlib.sha256()
+        if self.discover_installed:
+            digest.update("".join(f"path:{entry}\n" for entry in sys.path).encode())
+        for directory in self.templates_dirs:
+            digest.update(f"dir:{directory.resolve()}\n".encode())
+        return digest.hexdigest()[:16]
+
+    def _fingerprint(self):
+        """Cheap stat-only signature of everything that can add or remove plugins"""
+        digest = hashlib.sha256(f"v{MANIFEST_VERSION}".encode())
+        if self.discover_installed:
+            for entry in sys.path:
+                digest.update(f"path:{entry}:{_mtime(entry)}\n".encode())
+        for directory in self.templates_dirs:
+            digest.update(f"dir:{directory.resolve()}:{_mtime(directory)}\n".encode())
+            for path in _local_plugin_files(directory):
+                digest.update(f"file:{path.name}:{_mtime(path)}\n".encode())
+        return digest.hexdigest()
+
+    def _discover(self, fingerprint):
+        types = {}
+        if self.discover_installed:
+            for entry_point in _entry_points(ENTRY_POINT_GROUP):
+                dist = getattr(entry_point, "dist", None)
+                dist_name = dist.metadata["Name"] if dist is not None else "installed package"
+                types[entry_point.name] = {
+                    "source": "entry-point",
+                    "ref": entry_point.value,
+                    "description": f"Provided by {dist_name}",
+                }
+        # Local directories override installed plugins; earlier directories win
+        for directory in reversed(self.templates_dirs):
+            for path in _local_plugin_files(directory):
+                types[path.stem] = {
+                    "source": "local",
+                    "path": str(path.resolve()),
+                    "description": _docstring_summary(path),
+                }
+
+        self._write_manifest(fingerprint, types)
+        return types
+
+    def _read_manifest(self):
+        """{setup key: {"fingerprint": ..., "types": ...}}, empty if there is no usable manifest"""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("setups", {})
+
+    def _write_manifest(self, fingerprint, types):
+        setups = self._read_manifest()
+        key = self._setup_key()
+        setups.pop(key, None)
+        setups[key] = {"fingerprint": fingerprint, "types": types}
+        setups = dict(list(setups.items())[-MANIFEST_SETUPS:])
+        manifest = {"version": MANIFEST_VERSION, "setups": setups}
+        # The manifest is only a cache; an unwritable cache dir just means re-scanning next time
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(self.manifest_path.name + f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+            tmp_path.replace(self.manifest_path)
+        except OSError:
+            pass
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _local_plugin_files(directory):
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return []
+    return [Path(e.path) for e in entries
+            if e.is_file() and e.name.endswith(".py") and not e.name.startswith("_")]
+
+
+def _docstring_summary(path):
+    """First docstring line of a plugin file, read without importing it"""
+    try:
+        docstring = ast.get_docstring(ast.parse(Path(path).read_text(encoding='utf-8')))
+    except (OSError, SyntaxError, ValueError):
+        return ""
+    return docstring.strip().splitlines()[0] if docstring else ""
+
+
+def _entry_points(group):
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+
+def _load_reference(ref):
+    """Import "package.module:attr.path" and return the attribute"""
+    module_name, _, attr_path = ref.partition(":")
+    try:
+        target = importlib.import_module(module_name.strip())
+        for attr in filter(None, attr_path.strip().split(".")):
+            target = getattr(target, attr)
+    except (ImportError, AttributeError) as e:
+        raise ProjectTypeError(f"Cannot load plugin '{ref}': {e}") from e
+    return target
+
+
+def _load_local(name, path):
+    module_name = f"project_template_plugins.{name}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None:
+        raise ProjectTypeError(f"Cannot load plugin file: {path}")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        raise ProjectTypeError(f"Cannot load plugin '{name}' from {path}: {e}") from e
+    try:
+        return getattr(module, LOCAL_PLUGIN_FUNCTION)
+    except AttributeError:
+        raise ProjectTypeError(f"Plugin {path} does not define {LOCAL_PLUGIN_FUNCTION}()") from None
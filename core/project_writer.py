@@ -0,0 +1,179 @@
+"""
+Project Writer
+Writes generated folders and files beneath a project root
+
+File I/O goes through a backend. Where the OS supports it (Linux, macOS)
+DirFdIO opens every folder once and creates files relative to that folder's
+descriptor, so no write walks the full path again, and hands the writes to a
+small thread pool. On a network filesystem (NFS, SMB) each create/write/close
+is a round trip; with `inflight` writes outstanding, generation waits on
+bandwidth instead of on latency. Elsewhere PathIO writes serially by path.
+Queued writes are finished, and their errors raised, by close().
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from profiling import NULL_PROFILER
+from events import NULL_SINK
+
+DEFAULT_INFLIGHT = 8
+
+
+class PathIO:
+    """Serial writes through full paths: the portable backend"""
+
+    def __init__(self, root, profiler=NULL_PROFILER):
+        self.root = Path(root)
+        self.profiler = profiler
+
+    def mkdir(self, relpath):
+        (self.root / relpath).mkdir(parents=True, exist_ok=True)
+
+    def write(self, relpath, text):
+        if not self.profiler.enabled:
+            (self.root / relpath).write_text(text, encoding='utf-8')
+            return
+        with self.profiler.span(str(relpath), "write", bytes=len(text.encode('utf-8'))):
+            (self.root / relpath).write_text(text, encoding='utf-8')
+
+    def close(self):
+        pass
+
+
+class DirFdIO:
+    """Writes relative to folder descriptors opened once each, up to `inflight` at a time"""
+
+    available = {os.open, os.mkdir} <= os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+    def __init__(self, root, inflight=DEFAULT_INFLIGHT, profiler=NULL_PROFILER):
+        self.profiler = profiler
+        self._dir_flags = os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_CLOEXEC", 0)
+        self._file_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+        self._dirs = {"": os.open(root, self._dir_flags)}
+        # One write in flight is just the calling thread
+        self._pool = ThreadPoolExecutor(inflight, thread_name_prefix="project-writer") if inflight > 1 else None
+        self._slots = threading.BoundedSemaphore(inflight)
+        self._futures = []
+
+    def _dir(self, reldir, create=False):
+        """Descriptor of a folder below the root, opening (and creating) each level only once"""
+        fd = self._dirs.get(reldir)
+        if fd is None:
+            parent, _, name = reldir.rpartition("/")
+            parent_fd = self._dir(parent, create)
+            if create:
+                try:
+                    os.mkdir(name, dir_fd=parent_fd)
+                except FileExistsError:
+                    pass
+            fd = self._dirs[reldir] = os.open(name, self._dir_flags, dir_fd=parent_fd)
+        return fd
+
+    def mkdir(self, relpath):
+        self._dir("/".join(Path(relpath).parts), create=True)
+
+    def write(self, relpath, text):
+        *folders, name = Path(relpath).parts
+        try:
+            dir_fd = self._dir("/".join(folders))
+        except OSError as e:
+            e.filename = str(relpath)
+            raise
+        data = text.encode('utf-8')
+        if self._pool is None:
+            self._write(dir_fd, name, data, relpath)
+            return
+        # Bounds both the threads' queue and the memory held by pending file contents
+        self._slots.acquire()
+        future = self._pool.submit(self._write, dir_fd, name, data, relpath)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _write(self, dir_fd, name, data, relpath):
+        with self.profiler.span(str(relpath), "write", bytes=len(data)):
+            try:
+                fd = os.open(name, self._file_flags, 0o666, dir_fd=dir_fd)
+            except OSError as e:
+                e.filename = str(relpath)  # Not just the name inside the folder
+                raise
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+    def close(self):
+        """Wait for every queued write, release the descriptors, raise the first write error"""
+        futures, self._futures = self._futures, []
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            if self._pool:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            for fd in self._dirs.values():
+                os.close(fd)
+            self._dirs = {}
+
+
+def open_io(root, inflight=DEFAULT_INFLIGHT, profiler=NULL_PROFILER):
+    """Fastest backend this OS supports"""
+    return DirFdIO(root, inflight, profiler) if DirFdIO.available else PathIO(root, profiler)
+
+
+class ProjectWriter:
+    """Write generated files relative to a project root, rendering from a template pack
+
+    Use it as a context manager (or call close()): writes may still be in flight
+    until then.
+    """
+
+    def __init__(self, root, pack, context, profiler=NULL_PROFILER, events=NULL_SINK, inflight=DEFAULT_INFLIGHT):
+        self.root = Path(root)
+        self.pack = pack
+        self.context = context
+        self.profiler = profiler
+        self.events = events
+        self.io = open_io(root, inflight, profiler)
+
+    def close(self):
+        """Finish queued writes; raises the first write error. Safe to call more than once"""
+        self.io.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def mkdir(self, relpath):
+        """Create a folder (and its parents) inside the project"""
+        with self.profiler.span(str(relpath), "mkdir"):
+            self.io.mkdir(relpath)
+        self.events.emit("dir_created", path=str(relpath))
+
+    def write_text(self, relpath, text):
+        """Write a UTF-8 text file inside the project"""
+        self.io.write(relpath, text)
+        if self.events.detail:
+            self.events.emit("file_written", path=str(relpath), bytes=len(text.encode('utf-8')))
+
+    def write_json(self, relpath, data):
+        """Write data as indented JSON"""
+        self.write_text(relpath, json.dumps(data, indent=2))
+
+    def render(self, entry, **extra):
+        """Render a pack entry with the project context plus any extra values"""
+        context = dict(self.context, **extra) if extra else self.context
+        with self.profiler.span(entry, "render"):
+            return self.pack.render(entry, context)
+
+    def write_template(self, entry, relpath, **extra):
+        """Render a pack entry and write it to relpath"""
+        self.write_text(relpath, self.render(entry, **extra))
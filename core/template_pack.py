@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Template Pack
+Indexed single-file storage for the built-in project templates
+
+The sources live in core/templates/<group>/... and are compiled into
+core/templates.pack. The generator memory-maps the pack and only reads
+the entries it renders, so startup cost does not grow with the number
+of templates.
+
+Pack layout:
+    header    b"UPTPACK1"
+    data      entry bodies (UTF-8), back to back
+    index     JSON central directory: {"digest": ..., "entries": {name: [offset, length, template]}}
+    trailer   index offset (uint64), index length (uint32), b"UPTINDEX"
+
+Files ending in ".tmpl" are stored without the suffix and flagged as
+templates; they are rendered with string.Template ($name, $$ for a
+literal dollar). Everything else is copied verbatim.
+
+Usage:
+    python template_pack.py build     # rebuild templates.pack from templates/
+    python template_pack.py check     # exit 1 if templates.pack is stale
+"""
+
+import sys
+import mmap
+import json
+import struct
+import hashlib
+import argparse
+from pathlib import Path
+from string import Template
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+PACK_PATH = Path(__file__).resolve().parent / "templates.pack"
+
+MAGIC = b"UPTPACK1"
+TRAILER = struct.Struct("<QI8s")
+TRAILER_MAGIC = b"UPTINDEX"
+TEMPLATE_SUFFIX = ".tmpl"
+
+
+class TemplatePackError(Exception):
+    """Raised when a pack file is missing, corrupt or lacks an entry"""
+
+
+def collect_sources(source_dir=TEMPLATES_DIR):
+    """Return sorted (entry name, is_template, bytes) tuples for a templates tree"""
+    source_dir = Path(source_dir)
+    sources = []
+    for path in sorted(source_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        name = path.relative_to(source_dir).as_posix()
+        is_template = name.endswith(TEMPLATE_SUFFIX)
+        if is_template:
+            name = name[:-len(TEMPLATE_SUFFIX)]
+        sources.append((name, is_template, path.read_bytes()))
+    return sources
+
+
+def encode_pack(sources):
+    """Serialize (name, is_template, bytes) tuples into pack bytes"""
+    data = bytearray(MAGIC)
+    entries = {}
+    digest = hashlib.sha256()
+    for name, is_template, body in sources:
+        if name in entries:
+            raise TemplatePackError(f"Duplicate template entry: {name}")
+        entries[name] = [len(data), len(body), is_template]
+        data += body
+        digest.update(f"{name}\0{int(is_template)}\0{len(body)}\0".encode('utf-8'))
+        digest.update(body)
+
+    index = json.dumps({"digest": digest.hexdigest(), "entries": entries},
+                       sort_keys=True, separators=(',', ':')).encode('utf-8')
+    index_offset = len(data)
+    data += index
+    data += TRAILER.pack(index_offset, len(index), TRAILER_MAGIC)
+    return bytes(data)
+
+
+def build_pack(source_dir=TEMPLATES_DIR, pack_path=PACK_PATH):
+    """Compile a templates tree into a pack file, returns the entry count"""
+    sources = collect_sources(source_dir)
+    pack_path = Path(pack_path)
+    tmp_path = pack_path.with_name(pack_path.name + ".tmp")
+    tmp_path.write_bytes(encode_pack(sources))
+    tmp_path.replace(pack_path)
+    return len(sources)
+
+
+def check_pack(source_dir=TEMPLATES_DIR, pack_path=PACK_PATH):
+    """Return True if the pack file matches the templates tree"""
+    pack_path = Path(pack_path)
+    if not pack_path.exists():
+        return False
+    return pack_path.read_bytes() == encode_pack(collect_sources(source_dir))
+
+
+class TemplatePack:
+    """Read-only, memory-mapped view of a pack file"""
+
+    def __init__(self, path=PACK_PATH):
+        self.path = Path(path)
+        try:
+            self._file = open(self.path, 'rb')
+        except OSError as e:
+            raise TemplatePackError(f"Cannot open template pack {self.path}: {e}") from e
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._map) < len(MAGIC) + TRAILER.size or self._map[:len(MAGIC)] != MAGIC:
+                raise TemplatePackError(f"Not a template pack: {self.path}")
+            index_offset, index_length, magic = TRAILER.unpack_from(self._map, len(self._map) - TRAILER.size)
+            if magic != TRAILER_MAGIC:
+                raise TemplatePackError(f"Corrupt template pack trailer: {self.path}")
+            index = json.loads(self._map[index_offset:index_offset + index_length])
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise TemplatePackError(f"Corrupt template pack {self.path}: {e}") from e
+        except TemplatePackError:
+            self.close()
+            raise
+
+        self.digest = index["digest"]
+        self._entries = index["entries"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def names(self, group=None):
+        """List entry names, optionally limited to one group (e.g. "web")"""
+        if group is None:
+            return sorted(self._entries)
+        prefix = group.rstrip("/") + "/"
+        return sorted(name for name in self._entries if name.startswith(prefix))
+
+    def is_template(self, name):
+        return self._lookup(name)[2]
+
+    def read(self, name):
+        """Return the raw text of an entry"""
+        offset, length, _ = self._lookup(name)
+        return self._map[offset:offset + length].decode('utf-8')
+
+    def render(self, name, context):
+        """Return an entry with $placeholders substituted from context"""
+        text = self.read(name)
+        if not self.is_template(name):
+            return text
+        try:
+            return Template(text).substitute(context)
+        except (KeyError, ValueError) as e:
+            raise TemplatePackError(f"Cannot render template {name}: {e!r}") from e
+
+    def _lookup(self, name):
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise TemplatePackError(f"Template not found in pack: {name}") from None
+
+
+def open_pack(path=PACK_PATH, source_dir=TEMPLATES_DIR):
+    """Open a pack file, building it from source first if it does not exist yet"""
+    path = Path(path)
+    if not path.exists() and Path(source_dir).is_dir():
+        build_pack(source_dir, path)
+    return TemplatePack(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or verify the template pack")
+    parser.add_argument("command", choices=["build", "check", "list"], help="Action to perform")
+    parser.add_argument("--source", default=str(TEMPLATES_DIR), help="Templates source directory")
+    parser.add_argument("--pack", default=str(PACK_PATH), help="Pack file path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        count = build_pack(args.source, args.pack)
+        print(f"✅ Packed {count} templates into {args.pack}")
+    elif args.command == "check":
+        if not check_pack(args.source, args.pack):
+            print(f"❌ {args.pack} is out of date, run: python {Path(__file__).name} build")
+            sys.exit(1)
+        print(f"✅ {args.pack} is up to date")
+    else:
+        with TemplatePack(args.pack) as pack:
+            for name in pack.names():
+                print(f"{'T' if pack.is_template(name) else '-'} {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Git churn
+Commits per author, most-changed files and lines added/removed over time windows
+
+Run with: python 05-utilities/scripts/repo-status/git_churn.py
+          python 05-utilities/scripts/repo-status/git_churn.py --windows 7,30,all --top 20
+
+History is read from a single streamed `git log --numstat -z` pass and parsed
+as it arrives, never buffered whole. Totals are kept per day, author and file
+in git_churn.sqlite3 next to this script, together with the last commit read:
+later runs only read commits after it, and any window is a SUM over the days
+it covers. If the cached commit is no longer in HEAD's history (rebase, branch
+switch), the cache is rebuilt from scratch. Merge commits are not counted.
+"""
+
+import time
+import sqlite3
+import argparse
+import subprocess
+from pathlib import Path
+from collections import namedtuple, defaultdict
+
+HERE = Path(__file__).resolve().parent
+PROJECT_DIR = HERE.parent.parent.parent
+CACHE_PATH = HERE / "git_churn.sqlite3"
+CACHE_VERSION = 1
+DEFAULT_WINDOWS = (7, 30, None)  # days; None is all history
+FLUSH_EVERY = 5000  # commits aggregated in memory before they are written out
+READ_SIZE = 1 << 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS author_days (
+    day INTEGER NOT NULL,              -- days since 1970-01-01 (UTC) of the author date
+    author TEXT NOT NULL,
+    commits INTEGER NOT NULL,
+    added INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    PRIMARY KEY (day, author)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS file_days (
+    day INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    commits INTEGER NOT NULL,
+    added INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    PRIMARY KEY (day, path)
+) WITHOUT ROWID;
+"""
+
+Commit = namedtuple("Commit", "sha timestamp author files")  # files: [(path, added, removed)]
+Churn = namedtuple("Churn", "name commits added removed")
+Window = namedtuple("Window", "days commits added removed authors files")
+Update = namedtuple("Update", "head commits rebuilt")
+
+
+class ChurnError(Exception):
+    pass
+
+
+def git(*args, root=PROJECT_DIR):
+    result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def read_log(revisions, root=PROJECT_DIR):
+    """Yield a Commit per non-merge commit in revisions, parsing git's output as it streams in"""
+    command = ["git", "-c", "core.quotepath=off", "log", "-z", "--no-merges", "--numstat", "-M",
+               "--format=%x1e%H%x1f%at%x1f%aN", *revisions, "--"]
+    try:
+        process = subprocess.Popen(command, cwd=root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        raise ChurnError(f"git not available: {e}")
+
+    commit = None
+    rename = None  # [added, removed, paths seen] while reading the two path fields of a rename
+    pending = b""
+    with process:
+        while True:
+            block = process.stdout.read(READ_SIZE)
+            if not block:
+                break
+            *fields, pending = (pending + block).split(b"\0")
+            for field in fields:
+                if rename is not None:
+                    rename[2] += 1
+                    if rename[2] == 2:  # "old\0new\0": the file now lives at the new path
+                        commit.files.append((field.decode("utf-8", "replace"), rename[0], rename[1]))
+                        rename = None
+                    continue
+                field = field.lstrip(b"\n")
+                if not field:
+                    continue
+                if field.startswith(b"\x1e"):
+                    if commit:
+                        yield commit
+                    sha, timestamp, author = field[1:].decode("utf-8", "replace").split("\x1f", 2)
+                    commit = Commit(sha, int(timestamp), author, [])
+                    continue
+                added, removed, path = field.split(b"\t", 2)
+                # Binary files report "-" for both counts
+                added = int(added) if added != b"-" else 0
+                removed = int(removed) if removed != b"-" else 0
+                if path:
+                    commit.files.append((path.decode("utf-8", "replace"), added, removed))
+                else:
+                    rename = [added, removed, 0]
+    if process.returncode not in (0, None):
+        raise ChurnError(f"git log failed with exit code {process.returncode}")
+    if commit:
+        yield commit
+
+
+class ChurnCache:
+    """Per-day churn totals in SQLite, extended with each run's new commits"""
+
+    def __init__(self, path=CACHE_PATH, root=PROJECT_DIR):
+        self.root = root
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def update(self):
+        """Read commits newer than the cached one; returns Update, or None without commits"""
+        head = git("rev-parse", "--verify", "-q", "HEAD", root=self.root)
+        if not head:
+            return None
+        last = self.meta("last_commit")
+        if last == head:
+            return Update(head, 0, False)
+
+        rebuilt = (self.meta("version") != str(CACHE_VERSION) or not last
+                   or subprocess.run(["git", "merge-base", "--is-ancestor", last, head], cwd=self.root,
+                                     capture_output=True).returncode != 0)
+        with self.conn:
+            if rebuilt:
+                self.conn.execute("DELETE FROM author_days")
+                self.conn.execute("DELETE FROM file_days")
+            count = 0
+            authors = defaultdict(lambda: [0, 0, 0])
+            files = defaultdict(lambda: [0, 0, 0])
+            for commit in read_log([head] if rebuilt else [f"{last}..{head}"], self.root):
+                day = commit.timestamp // 86400
+                total = authors[day, commit.author]
+                total[0] += 1
+                for path, added, removed in commit.files:
+                    total[1] += added
+                    total[2] += removed
+                    entry = files[day, path]
+                    entry[0] += 1
+                    entry[1] += added
+                    entry[2] += removed
+                count += 1
+                if count % FLUSH_EVERY == 0:
+                    self._flush(authors, files)
+            self._flush(authors, files)
+            self.conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                                  [("last_commit", head), ("version", str(CACHE_VERSION))])
+        return Update(head, count, rebuilt)
+
+    def _flush(self, authors, files):
+        """Add in-memory totals onto the stored ones"""
+        for table, key, totals in (("author_days", "author", authors), ("file_days", "path", files)):
+            self.conn.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?, ?, ?) ON CONFLICT (day, {key}) DO UPDATE SET "
+                "commits = commits + excluded.commits, added = added + excluded.added, "
+                "removed = removed + excluded.removed",
+                ((day, name, *counts) for (day, name), counts in totals.items()))
+            totals.clear()
+
+    def window(self, days=None, top=5, now=None):
+        """Churn of the last `days` days (None: all history), with the top authors and files"""
+        first = int((now or time.time()) // 86400) - days + 1 if days else -(1 << 62)
+        commits, added, removed = self.conn.execute(
+            "SELECT COALESCE(SUM(commits), 0), COALESCE(SUM(added), 0), COALESCE(SUM(removed), 0) "
+            "FROM author_days WHERE day >= ?", (first,)).fetchone()
+        authors = [Churn(*row) for row in self.conn.execute(
+            "SELECT author, SUM(commits) AS n, SUM(added), SUM(removed) FROM author_days WHERE day >= ? "
+            "GROUP BY author ORDER BY n DESC, author LIMIT ?", (first, top))]
+        files = [Churn(*row) for row in self.conn.execute(
+            "SELECT path, SUM(commits) AS n, SUM(added) AS a, SUM(removed) AS r FROM file_days WHERE day >= ? "
+            "GROUP BY path ORDER BY n DESC, a + r DESC, path LIMIT ?", (first, top))]
+        return Window(days, commits, added, removed, authors, files)
+
+
+def parse_windows(text):
+    """"7,30,all" -> (7, 30, None)"""
+    windows = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        if part == "all":
+            windows.append(None)
+        elif part.isdigit() and int(part) > 0:
+            windows.append(int(part))
+        else:
+            raise argparse.ArgumentTypeError(f"invalid window {part!r}: use a number of days or 'all'")
+    return tuple(windows)
+
+
+def report(windows=DEFAULT_WINDOWS, top=5, cache_path=CACHE_PATH, root=PROJECT_DIR):
+    """Churn section for the status report, as a list of lines"""
+    try:
+        with ChurnCache(cache_path, root) as cache:
+            update = cache.update()
+            if update is None:
+                return ["No commits yet"]
+            results = [cache.window(days, top) for days in windows]
+    except (ChurnError, sqlite3.Error) as e:
+        return [f"Churn not available: {e}"]
+
+    source = "full history read" if update.rebuilt else f"{update.commits} new commits read"
+    lines = [f"Up to {update.head[:12]} ({source}, cache: {Path(cache_path).name})"]
+    for result in results:
+        label = f"Last {result.days} day{'s' if result.days != 1 else ''}" if result.days else "All history"
+        lines.append(f"{label}: {result.commits} commits, +{result.added}/-{result.removed} lines")
+        if result.authors:
+            lines.append("  Authors: " + ", ".join(f"{a.name} {a.commits}" for a in result.authors))
+        for f in result.files:
+            lines.append(f"  {f.commits:>4} commits  +{f.added}/-{f.removed}  {f.name}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Git churn by author and file over time windows")
+    parser.add_argument("--windows", type=parse_windows, default=DEFAULT_WINDOWS, metavar="DAYS,...",
+                        help="Comma-separated windows in days, 'all' for all history (default: 7,30,all)")
+    parser.add_argument("--top", type=int, default=10, help="Authors and files per window (default: 10)")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the cache and read all history again")
+    args = parser.parse_args()
+
+    if args.rebuild and CACHE_PATH.exists():
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{CACHE_PATH}{suffix}").unlink(missing_ok=True)
+    start = time.perf_counter()
+    lines = report(args.windows, args.top)
+    print("📈 Git churn")
+    for line in lines:
+        print(f"   {line}")
+    print(f"⏱️ {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
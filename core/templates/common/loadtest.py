@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Load tester for the development server
+Replays requests over concurrent keep-alive connections and reports
+requests per second and latency percentiles
+
+Run with: python 05-utilities/scripts/loadtest.py
+          python 05-utilities/scripts/loadtest.py --port 8080 --connections 32 --duration 30
+          python 05-utilities/scripts/loadtest.py --urls urls.txt --requests 10000 --json
+
+Without --urls every file in 01-core is requested, which is what serve.py serves.
+"""
+
+import sys
+import json
+import asyncio
+import argparse
+import itertools
+from pathlib import Path
+from time import perf_counter
+from urllib.parse import quote, urlsplit
+
+CORE_DIR = Path(__file__).resolve().parent.parent.parent / "01-core"
+HISTOGRAM_BOUNDS_MS = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+# After consecutive errors a client waits 10 ms, 20 ms, ... up to 1 s before retrying
+BACKOFF_START = 0.01
+BACKOFF_MAX = 1.0
+
+
+def crawl(root=CORE_DIR):
+    """URL paths for every file below root, plus / for an index page"""
+    paths = []
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and not any(part.startswith(".") or part == "node_modules"
+                                      for part in path.relative_to(root).parts):
+            paths.append("/" + quote(path.relative_to(root).as_posix()))
+    if (root / "index.html").exists():
+        paths.insert(0, "/")
+    return paths
+
+
+def read_url_list(path):
+    """Paths from a file with one URL or path per line (# comments allowed)"""
+    paths = []
+    for line in Path(path).read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = urlsplit(line)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        paths.append(target if target.startswith("/") else "/" + target)
+    return paths
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+class LoadStats:
+    """Latencies, status codes and errors collected during a run"""
+
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}
+        self.errors = {}
+        self.bytes = 0
+        self.connections_opened = 0
+        self.elapsed = 0.0
+
+    def record(self, status, size, latency):
+        self.latencies.append(latency)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes += size
+
+    def error(self, exc):
+        name = type(exc).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def summary(self):
+        ordered = sorted(self.latencies)
+        elapsed = self.elapsed or 1e-9
+        return {
+            "requests": len(ordered),
+            "errors": sum(self.errors.values()),
+            "elapsed_s": round(self.elapsed, 3),
+            "rps": round(len(ordered) / elapsed, 1),
+            "bytes_per_s": round(self.bytes / elapsed),
+            "connections_opened": self.connections_opened,
+            "statuses": {str(code): count for code, count in sorted(self.statuses.items())},
+            "error_types": self.errors,
+            "latency_ms": {
+                "min": round(ordered[0] * 1000, 3) if ordered else 0,
+                "p50": round(percentile(ordered, 0.50) * 1000, 3),
+                "p90": round(percentile(ordered, 0.90) * 1000, 3),
+                "p95": round(percentile(ordered, 0.95) * 1000, 3),
+                "p99": round(percentile(ordered, 0.99) * 1000, 3),
+                "max": round(ordered[-1] * 1000, 3) if ordered else 0,
+            },
+        }
+
+    def histogram(self, width=40):
+        """Text histogram of latencies in fixed millisecond buckets"""
+        counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for latency in self.latencies:
+            ms = latency * 1000
+            index = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if ms <= bound), len(HISTOGRAM_BOUNDS_MS))
+            counts[index] += 1
+        peak = max(counts) or 1
+        lines = []
+        for i, count in enumerate(counts):
+            if not count:
+                continue
+            label = f"<= {HISTOGRAM_BOUNDS_MS[i]:g} ms" if i < len(HISTOGRAM_BOUNDS_MS) else f" > {HISTOGRAM_BOUNDS_MS[-1]:g} ms"
+            bar = "█" * max(1, round(count / peak * width))
+            lines.append(f"  {label:>12} {count:>8}  {bar}")
+        return lines
+
+
+async def read_body(reader, headers):
+    """Read a response body, returns its size in bytes"""
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        size = 0
+        while True:
+            chunk_size = int((await reader.readline()).split(b";")[0], 16)
+            if chunk_size == 0:
+                # Trailers end with an empty line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return size
+            await reader.readexactly(chunk_size + 2)
+            size += chunk_size
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        await reader.readexactly(length)
+        return length
+    return len(await reader.read())
+
+
+async def fetch(reader, writer, host, path, accept_encoding="identity"):
+    """Send one GET, returns (status, body size on the wire, connection reusable)"""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n"
+                 f"Accept-Encoding: {accept_encoding}\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("server closed the connection")
+    version, status = status_line.split(b" ", 2)[:2]
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+
+    framed = "content-length" in headers or headers.get("transfer-encoding", "").lower() == "chunked"
+    size = await read_body(reader, headers)
+    connection = headers.get("connection", "").lower()
+    if version == b"HTTP/1.1":
+        reusable = framed and connection != "close"
+    else:
+        reusable = framed and connection == "keep-alive"
+    return int(status), size, reusable
+
+
+async def worker(host, port, paths, start_index, deadline, budget, stats, timeout, accept_encoding):
+    conn = None
+    failures = 0
+    for i in itertools.count(start_index):
+        if perf_counter() >= deadline or (budget is not None and next(budget) <= 0):
+            break
+        path = paths[i % len(paths)]
+        start = perf_counter()
+        try:
+            if conn is None:
+                conn = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+                stats.connections_opened += 1
+            status, size, reusable = await asyncio.wait_for(fetch(*conn, host, path, accept_encoding), timeout)
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+            stats.error(e)
+            if conn is not None:
+                conn[1].close()
+            conn = None
+            # Without a pause, a down or refusing server turns every client into a tight reconnect loop
+            failures += 1
+            delay = min(BACKOFF_START * 2 ** (failures - 1), BACKOFF_MAX, deadline - perf_counter())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            continue
+        failures = 0
+        stats.record(status, size, perf_counter() - start)
+        if not reusable:
+            conn[1].close()
+            conn = None
+    if conn is not None:
+        conn[1].close()
+
+
+async def run_load(host, port, paths, connections=16, duration=10.0, requests=None, timeout=10.0,
+                   accept_encoding="identity"):
+    """Drive `connections` concurrent clients for `duration` seconds or `requests` requests"""
+    stats = LoadStats()
+    # Counts down the remaining request budget; each worker takes one ticket per request
+    budget = itertools.count(requests, -1) if requests else None
+    start = perf_counter()
+    deadline = start + duration if not requests else float("inf")
+    await asyncio.gather(*(worker(host, port, paths, n, deadline, budget, stats, timeout, accept_encoding)
+                           for n in range(connections)))
+    stats.elapsed = perf_counter() - start
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the development server")
+    parser.add_argument("--host", default="127.0.0.1", help="Server host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Server port (default: 8000)")
+    parser.add_argument("--connections", "-c", type=int, default=16, help="Concurrent connections (default: 16)")
+    parser.add_argument("--duration", "-d", type=float, default=10.0, help="Seconds to run (default: 10)")
+    parser.add_argument("--requests", "-n", type=int, help="Stop after this many requests instead of --duration")
+    parser.add_argument("--urls", help="File with one URL or path per line (default: crawl 01-core)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds (default: 10)")
+    parser.add_argument("--accept-encoding", default="identity",
+                        help="Accept-Encoding header to send, e.g. 'gzip, br' (default: identity)")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    paths = read_url_list(args.urls) if args.urls else crawl()
+    if not paths:
+        print("❌ Nothing to request: no URLs given and 01-core is empty")
+        sys.exit(1)
+
+    if not args.json:
+        limit = f"{args.requests} requests" if args.requests else f"{args.duration:g}s"
+        print(f"🔥 Load testing http://{args.host}:{args.port} with {args.connections} connections for {limit}")
+        print(f"📄 {len(paths)} URLs in rotation")
+
+    stats = asyncio.run(run_load(args.host, args.port, paths, args.connections,
+                                 args.duration, args.requests, args.timeout, args.accept_encoding))
+    summary = stats.summary()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        latency = summary["latency_ms"]
+        print(f"\n📊 {summary['requests']} requests in {summary['elapsed_s']}s "
+              f"({summary['connections_opened']} connections opened)")
+        print(f"⚡ {summary['rps']} req/s, {summary['bytes_per_s'] / 1024:.1f} KB/s")
+        print(f"⏱️ p50 {latency['p50']} ms | p95 {latency['p95']} ms | p99 {latency['p99']} ms | max {latency['max']} ms")
+        print("📦 Status codes: " + ", ".join(f"{code}: {count}" for code, count in summary["statuses"].items()))
+        if summary["errors"]:
+            print("⚠️ Errors: " + ", ".join(f"{name}: {count}" for name, count in summary["error_types"].items()))
+        print("\nLatency histogram:")
+        print("\n".join(stats.histogram()))
+
+    if summary["errors"] and not summary["requests"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
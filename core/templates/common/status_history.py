@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Status history
+Keeps every generate_status.py run in a local SQLite store for trend queries
+
+Run with: python 05-utilities/scripts/repo-status/status_history.py list
+          python 05-utilities/scripts/repo-status/status_history.py growth --dir 01-core --since 30
+          python 05-utilities/scripts/repo-status/status_history.py dirs --since 7    # fastest-growing folders
+          python 05-utilities/scripts/repo-status/status_history.py diff 12 15        # default: last two runs
+          python 05-utilities/scripts/repo-status/status_history.py compact
+
+A snapshot holds every file (size, mtime), a rollup per directory (files and
+bytes below it) and a git summary. Each run is written in one transaction.
+
+The newest snapshot is stored in full. When a new one arrives, the previous
+one is rewritten as a delta against it: only the files that differ, with
+removed files as tombstones. Every KEYFRAME_EVERY-th snapshot stays full, so
+rebuilding any old snapshot reads a bounded chain of small deltas. Directory
+rollups stay complete for every snapshot, so growth queries are plain indexed
+lookups and never rebuild file lists.
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from collections import namedtuple
+
+HERE = Path(__file__).resolve().parent
+PROJECT_DIR = HERE.parent.parent.parent
+DB_NAME = "status_history.sqlite3"
+DB_PATH = HERE / DB_NAME
+KEYFRAME_EVERY = 50
+SKIP_DIRS = {"node_modules", ".git", "__pycache__", "venv", ".venv"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    taken_at TEXT NOT NULL,
+    files INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    git_branch TEXT,
+    git_head TEXT,
+    git_changes INTEGER,
+    full INTEGER NOT NULL,             -- 1: file_rows hold every file; 0: only differences from base_id
+    base_id INTEGER REFERENCES snapshots(id)
+);
+CREATE INDEX IF NOT EXISTS snapshots_taken_at ON snapshots(taken_at);
+CREATE TABLE IF NOT EXISTS paths (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS file_rows (
+    snapshot_id INTEGER NOT NULL,
+    path_id INTEGER NOT NULL,
+    size INTEGER,                      -- NULL in a delta: the file does not exist in this snapshot
+    mtime_ns INTEGER,
+    PRIMARY KEY (snapshot_id, path_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dir_rollups (
+    snapshot_id INTEGER NOT NULL,
+    path_id INTEGER NOT NULL,
+    files INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, path_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS dir_rollups_by_path ON dir_rollups(path_id, snapshot_id);
+"""
+
+Snapshot = namedtuple("Snapshot", "id taken_at files bytes git_branch git_head git_changes full base_id")
+Recorded = namedtuple("Recorded", "id previous added removed changed")
+GitSummary = namedtuple("GitSummary", "branch head changes")
+
+
+class HistoryError(Exception):
+    pass
+
+
+def scan(root=PROJECT_DIR):
+    """{posix path: (size, mtime_ns)} of every project file, without SKIP_DIRS and the stores next to this script"""
+    root = Path(root)
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        folder = Path(dirpath)
+        own_folder = folder.resolve() == HERE
+        for name in filenames:
+            if own_folder and ".sqlite3" in name:
+                continue  # This store and the git churn cache, plus their -wal/-shm files
+            try:
+                stat = (folder / name).stat()
+            except OSError:
+                continue
+            files[(folder / name).relative_to(root).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def rollups(files):
+    """{directory: [files, bytes]} counting everything below each directory; "." is the project"""
+    totals = {".": [0, 0]}
+    for path, (size, _) in files.items():
+        parts = path.split("/")[:-1]
+        for depth in range(len(parts) + 1):
+            folder = "/".join(parts[:depth]) or "."
+            entry = totals.setdefault(folder, [0, 0])
+            entry[0] += 1
+            entry[1] += size
+    return totals
+
+
+def git_summary(root=PROJECT_DIR):
+    """Branch, short head and number of changed paths, or None outside a git work tree"""
+    try:
+        result = subprocess.run(["git", "status", "--porcelain=v2", "--branch"], cwd=root,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    branch = head = None
+    changes = 0
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line.split(" ", 2)[2]
+        elif line.startswith("# branch.oid "):
+            oid = line.split(" ", 2)[2]
+            head = None if oid == "(initial)" else oid[:12]
+        elif line and not line.startswith("#"):
+            changes += 1
+    return GitSummary(branch, head, changes)
+
+
+class StatusHistory:
+    """SQLite store of status snapshots"""
+
+    def __init__(self, path=DB_PATH):
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._path_ids = None
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- writing ----------
+
+    def path_ids(self, paths):
+        """Interned ids for paths: every path string is stored once, rows refer to it by id"""
+        if self._path_ids is None:
+            self._path_ids = {path: path_id for path_id, path in self.conn.execute("SELECT id, path FROM paths")}
+        missing = [(path,) for path in paths if path not in self._path_ids]
+        if missing:
+            self.conn.executemany("INSERT OR IGNORE INTO paths(path) VALUES (?)", missing)
+            wanted = {path for (path,) in missing}
+            self._path_ids.update((path, path_id) for path_id, path in self.conn.execute("SELECT id, path FROM paths")
+                                  if path in wanted)
+        return self._path_ids
+
+    def record(self, files, git=None, taken_at=None):
+        """Store a snapshot and delta-encode the previous one; returns Recorded"""
+        taken_at = taken_at or datetime.now().isoformat(timespec="seconds")
+        dirs = rollups(files)
+        with self.conn:
+            previous = self.latest()
+            cursor = self.conn.execute(
+                "INSERT INTO snapshots(taken_at, files, bytes, git_branch, git_head, git_changes, full) "
+                "VALUES (?, ?, ?, ?, ?, ?, 1)",
+                (taken_at, dirs["."][0], dirs["."][1], *(git or (None, None, None))))
+            snapshot_id = cursor.lastrowid
+            ids = self.path_ids(list(files) + list(dirs))
+            self.conn.executemany("INSERT INTO file_rows VALUES (?, ?, ?, ?)",
+                                  ((snapshot_id, ids[path], size, mtime) for path, (size, mtime) in files.items()))
+            self.conn.executemany("INSERT INTO dir_rollups VALUES (?, ?, ?, ?)",
+                                  ((snapshot_id, ids[path], count, size) for path, (count, size) in dirs.items()))
+            if previous is None:
+                return Recorded(snapshot_id, None, len(files), 0, 0)
+            old_files = self.files(previous.id)
+            added, removed, changed = compare(old_files, files)
+            if previous.id % KEYFRAME_EVERY:
+                self._write_delta(previous.id, old_files, snapshot_id, files)
+        return Recorded(snapshot_id, previous, len(added), len(removed), len(changed))
+
+    def _write_delta(self, snapshot_id, files, base_id, base_files):
+        """Replace a snapshot's file rows by its differences from base_id"""
+        ids = self.path_ids(list(files) + list(base_files))
+        rows = [(snapshot_id, ids[path], size, mtime) for path, (size, mtime) in files.items()
+                if base_files.get(path) != (size, mtime)]
+        rows += [(snapshot_id, ids[path], None, None) for path in base_files if path not in files]
+        self.conn.execute("DELETE FROM file_rows WHERE snapshot_id = ?", (snapshot_id,))
+        self.conn.executemany("INSERT INTO file_rows VALUES (?, ?, ?, ?)", rows)
+        self.conn.execute("UPDATE snapshots SET full = 0, base_id = ? WHERE id = ?", (base_id, snapshot_id))
+
+    def compact(self):
+        """Delta-encode every full snapshot but the newest and the keyframes; returns how many"""
+        snapshots = self.snapshots()
+        if len(snapshots) < 2:
+            return 0
+        count = 0
+        with self.conn:
+            newer = snapshots[-1]
+            newer_files = self.files(newer.id)
+            for snapshot in reversed(snapshots[:-1]):
+                files = self.files(snapshot.id)
+                if snapshot.full and snapshot.id % KEYFRAME_EVERY:
+                    self._write_delta(snapshot.id, files, newer.id, newer_files)
+                    count += 1
+                newer, newer_files = snapshot, files
+        self.conn.execute("VACUUM")
+        return count
+
+    # ---------- reading ----------
+
+    def snapshots(self):
+        return [Snapshot(*row) for row in self.conn.execute(
+            "SELECT id, taken_at, files, bytes, git_branch, git_head, git_changes, full, base_id "
+            "FROM snapshots ORDER BY id")]
+
+    def snapshot(self, snapshot_id):
+        row = self.conn.execute(
+            "SELECT id, taken_at, files, bytes, git_branch, git_head, git_changes, full, base_id "
+            "FROM snapshots WHERE id = ?", (snapshot_id,)).fetchone()
+        if row is None:
+            raise HistoryError(f"No snapshot #{snapshot_id}")
+        return Snapshot(*row)
+
+    def latest(self, offset=0):
+        row = self.conn.execute(
+            "SELECT id, taken_at, files, bytes, git_branch, git_head, git_changes, full, base_id "
+            "FROM snapshots ORDER BY id DESC LIMIT 1 OFFSET ?", (offset,)).fetchone()
+        return Snapshot(*row) if row else None
+
+    def files(self, snapshot_id):
+        """{path: (size, mtime_ns)} of a snapshot, rebuilt from the nearest full snapshot after it"""
+        chain = [self.snapshot(snapshot_id)]
+        while not chain[-1].full:
+            chain.append(self.snapshot(chain[-1].base_id))
+        state = {}
+        for snapshot in reversed(chain):
+            for path, size, mtime in self.conn.execute(
+                    "SELECT p.path, f.size, f.mtime_ns FROM file_rows f JOIN paths p ON p.id = f.path_id "
+                    "WHERE f.snapshot_id = ?", (snapshot.id,)):
+                if size is None:
+                    state.pop(path, None)
+                else:
+                    state[path] = (size, mtime)
+        return state
+
+    def first_since(self, since):
+        """Oldest snapshot taken at or after a datetime"""
+        row = self.conn.execute("SELECT MIN(id) FROM snapshots WHERE taken_at >= ?",
+                                (since.isoformat(timespec="seconds"),)).fetchone()
+        return row[0]
+
+    def growth(self, directory=".", since=None):
+        """[(snapshot id, taken_at, files, bytes)] of one directory over time"""
+        since = since.isoformat(timespec="seconds") if since else ""
+        return self.conn.execute(
+            "SELECT s.id, s.taken_at, r.files, r.bytes FROM dir_rollups r "
+            "JOIN snapshots s ON s.id = r.snapshot_id "
+            "WHERE r.path_id = (SELECT id FROM paths WHERE path = ?) AND s.taken_at >= ? ORDER BY s.id",
+            (directory, since)).fetchall()
+
+    def fastest_growing(self, old_id, new_id, limit=10):
+        """[(directory, byte growth, file growth)] between two snapshots, largest growth first"""
+        return self.conn.execute(
+            "SELECT p.path, n.bytes - COALESCE(o.bytes, 0) AS grown, n.files - COALESCE(o.files, 0) "
+            "FROM dir_rollups n JOIN paths p ON p.id = n.path_id "
+            "LEFT JOIN dir_rollups o ON o.snapshot_id = ? AND o.path_id = n.path_id "
+            "WHERE n.snapshot_id = ? AND p.path != '.' AND (n.bytes > COALESCE(o.bytes, 0) OR o.files IS NULL) "
+            "ORDER BY grown DESC, p.path LIMIT ?",
+            (old_id, new_id, limit)).fetchall()
+
+
+def compare(old, new):
+    """(added, removed, changed) paths between two {path: (size, mtime_ns)} maps"""
+    added = sorted(path for path in new if path not in old)
+    removed = sorted(path for path in old if path not in new)
+    changed = sorted(path for path in new if path in old and new[path] != old[path])
+    return added, removed, changed
+
+
+def human(size, signed=False):
+    sign = ("+" if size > 0 else "-" if size < 0 else "") if signed else ("-" if size < 0 else "")
+    size = abs(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the history of generate_status.py runs")
+    parser.add_argument("--db", default=str(DB_PATH), help=f"History store (default: repo-status/{DB_NAME})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List snapshots")
+    growth = commands.add_parser("growth", help="Files and size of a directory per snapshot")
+    growth.add_argument("--dir", default=".", help="Directory relative to the project (default: whole project)")
+    growth.add_argument("--since", type=float, metavar="DAYS", help="Only the last DAYS days")
+    dirs = commands.add_parser("dirs", help="Fastest-growing directories")
+    dirs.add_argument("--since", type=float, metavar="DAYS", help="Compare against the first snapshot in the last "
+                                                                  "DAYS days (default: the first snapshot)")
+    dirs.add_argument("--limit", type=int, default=10, help="Rows to show (default: 10)")
+    diff = commands.add_parser("diff", help="Files added, removed and changed between two snapshots")
+    diff.add_argument("old", nargs="?", type=int, help="Older snapshot id (default: the previous one)")
+    diff.add_argument("new", nargs="?", type=int, help="Newer snapshot id (default: the latest)")
+    commands.add_parser("compact", help="Delta-encode old snapshots and reclaim space")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"❌ No history yet: run generate_status.py first ({args.db})")
+        sys.exit(1)
+    since = datetime.now() - timedelta(days=args.since) if getattr(args, "since", None) else None
+
+    try:
+        with StatusHistory(args.db) as history:
+            if args.command == "list":
+                print(f"{'#':>5}  {'taken at':<19}  {'files':>7}  {'size':>10}  {'stored':<8} git")
+                for s in history.snapshots():
+                    git = f"{s.git_branch}@{s.git_head or 'no commits'} ({s.git_changes} changed)" if s.git_branch else "-"
+                    stored = "full" if s.full else f"delta>{s.base_id}"
+                    print(f"{s.id:>5}  {s.taken_at:<19}  {s.files:>7}  {human(s.bytes):>10}  {stored:<8} {git}")
+
+            elif args.command == "growth":
+                rows = history.growth(args.dir.strip("/") or ".", since)
+                if not rows:
+                    print(f"No snapshots contain {args.dir}")
+                    return
+                print(f"📈 {args.dir}: {rows[0][2]} -> {rows[-1][2]} files, "
+                      f"{human(rows[0][3])} -> {human(rows[-1][3])} over {len(rows)} snapshots")
+                previous = None
+                for snapshot_id, taken_at, files, size in rows:
+                    change = f"{files - previous[0]:+6} files {human(size - previous[1], True):>11}" if previous else ""
+                    print(f"   #{snapshot_id:<5} {taken_at}  {files:>7} files {human(size):>10}  {change}")
+                    previous = (files, size)
+
+            elif args.command == "dirs":
+                latest = history.latest()
+                old_id = history.first_since(since) if since else history.snapshots()[0].id
+                if old_id is None or old_id == latest.id:
+                    print("Need at least two snapshots in that window")
+                    return
+                rows = history.fastest_growing(old_id, latest.id, args.limit)
+                print(f"🚀 Fastest-growing directories, #{old_id} -> #{latest.id}:" if rows
+                      else f"No directory grew between #{old_id} and #{latest.id}")
+                for path, grown, files in rows:
+                    print(f"   {human(grown, True):>11} {files:+6} files  {path}/")
+
+            elif args.command == "diff":
+                new_id = args.new or history.latest().id
+                old_id = args.old or (history.latest(1) or history.latest()).id
+                old, new = history.files(old_id), history.files(new_id)
+                added, removed, changed = compare(old, new)
+                grown = sum(size for size, _ in new.values()) - sum(size for size, _ in old.values())
+                print(f"🔍 #{old_id} -> #{new_id}: {len(added)} added, {len(removed)} removed, "
+                      f"{len(changed)} changed, {human(grown, True)}")
+                for path in added:
+                    print(f"   + {path} ({human(new[path][0])})")
+                for path in removed:
+                    print(f"   - {path} ({human(old[path][0])})")
+                for path in changed:
+                    print(f"   ~ {path} ({human(new[path][0] - old[path][0], True)})")
+
+            elif args.command == "compact":
+                before = Path(args.db).stat().st_size
+                count = history.compact()
+                print(f"🗜️ Delta-encoded {count} snapshots: {human(before)} -> {human(Path(args.db).stat().st_size)}")
+    except HistoryError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,978 @@
+#!/usr/bin/env python3
+"""
+Incremental docs build
+Renders 01-core/docs into 01-core/site without MkDocs, re-rendering only what changed
+
+Run with: python 05-utilities/scripts/build_docs.py             # incremental
+          python 05-utilities/scripts/build_docs.py --explain   # say why each page was rendered
+          python 05-utilities/scripts/build_docs.py --force     # render every page
+          python 05-utilities/scripts/build_docs.py --clean     # delete the site folder
+
+A page is re-rendered only when something it depends on changed:
+- its own source (content hash; mtime and size only decide whether to re-hash)
+- a file it includes with --8<-- "path.md" (relative to docs/, nested includes too)
+- a page it links to was added, removed, retitled or changed its headings
+  (empty link text shows the target's title, #anchors are checked)
+- the navigation: mkdocs.yml site_name/nav or a page title shown in the nav,
+  since every page embeds the nav
+- the previous or next page in nav order was retitled (the pager shows its title)
+The graph, hashes and outputs are kept in site/build-manifest.json. When many
+pages need rendering (a cold build) they are spread over a process pool.
+
+Search: every build also updates site/search/, an inverted index split into
+one small JSON shard per two-letter term prefix (t-in.json holds "install",
+"index"...). The search box (docs-search.js) downloads meta.json, then only
+the shards for the prefixes being typed and the doc blocks of the top hits.
+Only shards containing terms of rendered or removed pages are rewritten;
+--gzip adds pre-compressed .gz siblings for static hosts.
+
+Understands the Markdown this template uses: headings, paragraphs, emphasis,
+code spans and fences, links, images, lists, tables, blockquotes, raw HTML,
+admonitions (!!! note "Title") and snippets (--8<--). Files and folders whose
+name starts with "_" are include-only. `mkdocs build` still works for the full
+Material theme; this builder is for fast edit-and-preview loops and big sites.
+"""
+
+import os
+import re
+import sys
+import html
+import json
+import shutil
+import gzip
+import hashlib
+import argparse
+import posixpath
+import itertools
+import unicodedata
+from collections import Counter
+from pathlib import Path, PurePosixPath
+from time import perf_counter
+from urllib.parse import urlsplit
+from concurrent.futures import ProcessPoolExecutor
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+CORE_DIR = PROJECT_DIR / "01-core"
+DOCS_DIR = CORE_DIR / "docs"
+SITE_DIR = CORE_DIR / "site"
+CONFIG_FILE = CORE_DIR / "mkdocs.yml"
+SEARCH_SCRIPT = Path(__file__).resolve().with_name("docs-search.js")
+MANIFEST_NAME = "build-manifest.json"
+# Bump when rendering changes, so every page is rendered again
+BUILDER_VERSION = 2
+POOL_MIN_PAGES = 64
+
+SEARCH_DIR = "search"
+SEARCH_CACHE = ".cache.json"
+SEARCH_VERSION = 1
+PREFIX_LENGTH = 2      # Shard key: t-<first two letters of the term>.json
+DOCS_BLOCK = 128       # Result titles/URLs/summaries per d-<block>.json
+TITLE_WEIGHT = 10
+HEADING_WEIGHT = 3
+MAX_WEIGHT = 255
+SUMMARY_LENGTH = 160
+GZIP_MIN_SIZE = 512
+STOPWORDS = frozenset("""a an and are as at be but by can do for from has have how if in into is it its
+not of on or so than that the their then there these this to was we were what when which will with
+you your""".split())
+
+CSS = """\
+*{box-sizing:border-box}
+body{margin:0;font:16px/1.6 system-ui,-apple-system,"Segoe UI",Roboto,sans-serif;color:#1f2328;background:#fff}
+header{display:flex;align-items:center;gap:1rem;padding:.75rem 1.5rem;background:#1f6feb}
+header a{color:#fff;font-weight:600;text-decoration:none}
+.search{position:relative;margin-left:auto}
+.search input{width:16rem;max-width:50vw;padding:.35rem .6rem;border:0;border-radius:4px;font:inherit}
+.search-results{position:absolute;right:0;z-index:10;width:24rem;max-width:90vw;max-height:70vh;overflow:auto;
+  background:#fff;border:1px solid #d0d7de;border-radius:6px;box-shadow:0 8px 24px rgba(0,0,0,.15)}
+.search-results a{display:block;padding:.5rem .75rem;color:#1f2328;font-weight:400;border-bottom:1px solid #eaeef2}
+.search-results a:hover,.search-results a:focus{background:#f0f6ff}
+.search-results strong{display:block;color:#1f6feb}
+.search-results small{color:#59636e}
+.search-results p{margin:0;padding:.5rem .75rem;color:#59636e}
+.layout{display:flex;max-width:1200px;margin:0 auto}
+.sidebar{flex:0 0 16rem;padding:1rem 1.5rem;border-right:1px solid #d0d7de;font-size:.9rem}
+.sidebar ul{list-style:none;margin:0;padding-left:.75rem}
+.sidebar>ul{padding:0}
+.sidebar a{color:#1f2328;text-decoration:none}
+.sidebar .active>a{color:#1f6feb;font-weight:600}
+.sidebar .section{display:block;margin-top:.5rem;font-weight:600}
+main{flex:1;min-width:0;padding:1rem 2rem 3rem}
+a{color:#1f6feb}
+pre{overflow:auto;padding:.75rem 1rem;background:#f6f8fa;border-radius:6px}
+code{font:.875em ui-monospace,SFMono-Regular,Menlo,Consolas,monospace}
+:not(pre)>code{padding:.1em .3em;background:#f6f8fa;border-radius:4px}
+table{border-collapse:collapse}
+th,td{padding:.4rem .75rem;border:1px solid #d0d7de}
+blockquote{margin:0;padding:0 1rem;color:#59636e;border-left:4px solid #d0d7de}
+.admonition{margin:1rem 0;padding:.5rem 1rem;border-left:4px solid #1f6feb;background:#f0f6ff;border-radius:4px}
+.admonition.warning,.admonition.caution{border-color:#d29922;background:#fff8e5}
+.admonition.danger,.admonition.error{border-color:#cf222e;background:#ffebe9}
+.admonition-title{margin:0;font-weight:600}
+.pager{display:flex;justify-content:space-between;margin-top:3rem;padding-top:1rem;border-top:1px solid #d0d7de}
+@media (max-width:768px){.layout{display:block}.sidebar{border:0;border-bottom:1px solid #d0d7de}}
+"""
+
+PAGE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{root}assets/docs.css">
+</head>
+<body>
+<header><a href="{root}index.html">{site_name}</a>
+<div class="search"><input id="search" type="search" placeholder="Search" autocomplete="off" aria-label="Search">
+<div id="search-results" class="search-results" hidden></div></div></header>
+<div class="layout">
+<nav class="sidebar">{nav}</nav>
+<main>
+{body}
+<footer class="pager">{prev}{next}</footer>
+</main>
+</div>
+<script src="{root}assets/docs-search.js" data-root="{root}" defer></script>
+</body>
+</html>
+"""
+
+
+# ---------- inline Markdown ----------
+
+CODE_SPAN = re.compile(r"(`+)(.+?)\1", re.S)
+IMAGE = re.compile(r"!\[([^\]]*)\]\(\s*<?([^)\s>]*)>?(?:\s+\"([^\"]*)\")?\s*\)")
+LINK = re.compile(r"\[([^\]]*)\]\(\s*<?([^)\s>]*)>?(?:\s+\"([^\"]*)\")?\s*\)")
+AUTOLINK = re.compile(r"<(https?://[^>\s]+)>")
+STRONG = re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1")
+EMPHASIS = re.compile(r"(?<![\w*])([*_])(?=\S)(.+?)(?<=\S)\1(?![\w*])")
+BARE_LT = re.compile(r"<(?![a-zA-Z/!])")
+BARE_AMP = re.compile(r"&(?!#?\w+;)")
+PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+
+
+def plain(text):
+    """Markdown inline text without markup, for titles and heading ids"""
+    text = CODE_SPAN.sub(lambda m: m.group(2).strip(), text)
+    text = IMAGE.sub(r"\1", text)
+    text = LINK.sub(r"\1", text)
+    text = re.sub(r"<[^>]+>", "", text)
+    return re.sub(r"[*_]{1,2}(?=\S)(.+?)(?<=\S)[*_]{1,2}", r"\1", text).strip()
+
+
+def slugify(text):
+    """Heading id, as MkDocs' toc extension makes it"""
+    text = unicodedata.normalize("NFKD", plain(text)).encode("ascii", "ignore").decode("ascii")
+    text = re.sub(r"[^\w\s-]", "", text).strip().lower()
+    return re.sub(r"[-\s]+", "-", text)
+
+
+def unique_id(slug, seen):
+    """slug, then slug_1, slug_2... for repeated headings"""
+    candidate = slug or "section"
+    count = seen.get(candidate, 0)
+    seen[candidate] = count + 1
+    return candidate if not count else f"{candidate}_{count}"
+
+
+def render_inline(text, ctx):
+    stash = []
+
+    def keep(fragment):
+        stash.append(fragment)
+        return f"\x00{len(stash) - 1}\x00"
+
+    text = CODE_SPAN.sub(lambda m: keep(f"<code>{html.escape(m.group(2).strip(), quote=False)}</code>"), text)
+    text = AUTOLINK.sub(lambda m: keep(f'<a href="{html.escape(m.group(1))}">{html.escape(m.group(1))}</a>'), text)
+    text = BARE_AMP.sub("&amp;", BARE_LT.sub("&lt;", text))
+
+    def image(match):
+        alt, src, title = match.groups()
+        title_attr = f' title="{html.escape(title)}"' if title else ""
+        return keep(f'<img src="{html.escape(src)}" alt="{html.escape(alt)}"{title_attr}>')
+
+    def link(match):
+        label, url, title = match.groups()
+        href, fallback = ctx.link(url)
+        inner = render_inline(label, ctx) if label.strip() else html.escape(fallback or url)
+        title_attr = f' title="{html.escape(title)}"' if title else ""
+        return keep(f'<a href="{html.escape(href)}"{title_attr}>{inner}</a>')
+
+    text = IMAGE.sub(image, text)
+    text = LINK.sub(link, text)
+    text = STRONG.sub(r"<strong>\2</strong>", text)
+    text = EMPHASIS.sub(r"<em>\2</em>", text)
+    while PLACEHOLDER.search(text):
+        text = PLACEHOLDER.sub(lambda m: stash[int(m.group(1))], text)
+    return text
+
+
+# ---------- block Markdown ----------
+
+FENCE = re.compile(r"^(\s*)(`{3,}|~{3,})\s*([\w+#.-]*)")
+HEADING = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+SETEXT = re.compile(r"^\s{0,3}(=+|-+)\s*$")
+RULE = re.compile(r"^\s{0,3}([-*_])(\s*\1){2,}\s*$")
+LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d{1,9}[.)])(\s+|$)(.*)$")
+ADMONITION = re.compile(r"^!!!\s+([\w-]+)(?:\s+\"([^\"]*)\")?\s*$")
+TABLE_RULE = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+HTML_BLOCK = re.compile(r"^\s{0,3}<(/?)(address|article|aside|blockquote|details|div|dl|figure|footer|form|h[1-6]|"
+                        r"header|hr|iframe|ol|p|pre|section|summary|table|ul|video|!--)[\s>/]", re.I)
+INCLUDE = re.compile(r"""^([ \t]*)--8<--[ \t]+["']([^"']+)["'][ \t]*$""", re.M)
+
+
+def indent_of(line):
+    return len(line) - len(line.lstrip())
+
+
+def starts_block(line):
+    """True if line starts a new block, so it ends a paragraph without a blank line"""
+    if HEADING.match(line) or FENCE.match(line) or ADMONITION.match(line) or HTML_BLOCK.match(line):
+        return True
+    if line.lstrip().startswith(">") or RULE.match(line):
+        return True
+    item = LIST_ITEM.match(line)
+    # Only a bullet or "1." interrupts a paragraph, so "2024. was a good year" stays text
+    return bool(item and item.group(4).strip() and item.group(2)[:-1] in ("", "1"))
+
+
+def split_row(line):
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def render_table(lines, ctx):
+    aligns = []
+    for cell in split_row(lines[1]):
+        if cell.startswith(":") and cell.endswith(":"):
+            aligns.append(' style="text-align:center"')
+        elif cell.endswith(":"):
+            aligns.append(' style="text-align:right"')
+        elif cell.startswith(":"):
+            aligns.append(' style="text-align:left"')
+        else:
+            aligns.append("")
+
+    def row(line, tag):
+        cells = split_row(line)
+        cells += [""] * (len(aligns) - len(cells))
+        return "<tr>" + "".join(f"<{tag}{align}>{render_inline(cell, ctx)}</{tag}>"
+                                for cell, align in zip(cells, aligns)) + "</tr>"
+
+    body = "".join(row(line, "td") for line in lines[2:])
+    return f"<table><thead>{row(lines[0], 'th')}</thead><tbody>{body}</tbody></table>"
+
+
+def parse_list(lines, i):
+    """Items of the list starting at lines[i]: (ordered, start, items, loose, next index)"""
+    first = LIST_ITEM.match(lines[i])
+    base = indent_of(lines[i])
+    ordered = first.group(2)[0].isdigit()
+    start = int(first.group(2)[:-1]) if ordered else 1
+    items, loose = [], False
+    while i < len(lines):
+        match = LIST_ITEM.match(lines[i])
+        if not match or indent_of(lines[i]) != base or match.group(2)[0].isdigit() != ordered:
+            break
+        content = base + len(match.group(2)) + max(1, min(len(match.group(3)), 4))
+        body = [match.group(4)]
+        i += 1
+        while i < len(lines):
+            line = lines[i]
+            if not line.strip():
+                j = i
+                while j < len(lines) and not lines[j].strip():
+                    j += 1
+                if j < len(lines) and indent_of(lines[j]) >= content:
+                    if not LIST_ITEM.match(lines[j]):
+                        loose = True
+                    body.extend([""] * (j - i))
+                    i = j
+                    continue
+                sibling = j < len(lines) and indent_of(lines[j]) == base and LIST_ITEM.match(lines[j])
+                if sibling and sibling.group(2)[0].isdigit() == ordered:
+                    loose = True
+                i = j
+                break
+            if indent_of(line) >= content:
+                body.append(line[content:])
+            elif LIST_ITEM.match(line) and indent_of(line) > base:
+                body.append(line.lstrip() if indent_of(line) < content else line[content:])
+            elif LIST_ITEM.match(line):
+                break  # Next item of this list or of an outer one
+            elif body[-1].strip() and not starts_block(line):
+                body.append(line.strip())  # Lazy paragraph continuation
+            else:
+                break
+            i += 1
+        items.append(body)
+    return ordered, start, items, loose, i
+
+
+def render_blocks(lines, ctx, tight=False):
+    """HTML for a list of Markdown lines; tight drops <p> around paragraphs (list items)"""
+    out = []
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        if not line.strip():
+            i += 1
+            continue
+
+        fence = FENCE.match(line)
+        if fence:
+            indent, marker, lang = fence.groups()
+            body = []
+            i += 1
+            while i < n and not (lines[i].strip().startswith(marker) and set(lines[i].strip()) == {marker[0]}):
+                body.append(lines[i][len(indent):] if lines[i].startswith(indent) else lines[i].lstrip())
+                i += 1
+            i += 1
+            css = f' class="language-{html.escape(lang)}"' if lang else ""
+            out.append(f"<pre><code{css}>{html.escape(chr(10).join(body), quote=False)}</code></pre>")
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            out.append(ctx.heading(len(heading.group(1)), heading.group(2)))
+            i += 1
+            continue
+
+        if RULE.match(line):
+            out.append("<hr>")
+            i += 1
+            continue
+
+        admonition = ADMONITION.match(line)
+        if admonition:
+            kind, title = admonition.groups()
+            title = kind.replace("-", " ").title() if title is None else title
+            body = []
+            i += 1
+            while i < n and (not lines[i].strip() or indent_of(lines[i]) >= 4):
+                body.append(lines[i][4:])
+                i += 1
+            title_html = f'<p class="admonition-title">{render_inline(title, ctx)}</p>' if title else ""
+            out.append(f'<div class="admonition {html.escape(kind)}">{title_html}{render_blocks(body, ctx)}</div>')
+            continue
+
+        if line.lstrip().startswith(">"):
+            body = []
+            while i < n and lines[i].strip() and (lines[i].lstrip().startswith(">") or not starts_block(lines[i])):
+                body.append(re.sub(r"^\s*> ?", "", lines[i]))
+                i += 1
+            out.append(f"<blockquote>{render_blocks(body, ctx)}</blockquote>")
+            continue
+
+        if LIST_ITEM.match(line):
+            ordered, start, items, loose, i = parse_list(lines, i)
+            tag = "ol" if ordered else "ul"
+            start_attr = f' start="{start}"' if ordered and start != 1 else ""
+            inner = "".join(f"<li>{render_blocks(body, ctx, tight=not loose)}</li>" for body in items)
+            out.append(f"<{tag}{start_attr}>{inner}</{tag}>")
+            continue
+
+        if "|" in line and i + 1 < n and TABLE_RULE.match(lines[i + 1]) and "-" in lines[i + 1]:
+            rows = [line, lines[i + 1]]
+            i += 2
+            while i < n and lines[i].strip() and "|" in lines[i]:
+                rows.append(lines[i])
+                i += 1
+            out.append(render_table(rows, ctx))
+            continue
+
+        if HTML_BLOCK.match(line):
+            while i < n and lines[i].strip():
+                out.append(lines[i])
+                i += 1
+            continue
+
+        paragraph = [line.strip()]
+        i += 1
+        while i < n and lines[i].strip() and not SETEXT.match(lines[i]) and not starts_block(lines[i]):
+            paragraph.append(lines[i].strip())
+            i += 1
+        if i < n and SETEXT.match(lines[i]) and lines[i].strip():
+            out.append(ctx.heading(1 if lines[i].strip()[0] == "=" else 2, " ".join(paragraph)))
+            i += 1
+            continue
+        text = render_inline("\n".join(paragraph), ctx)
+        out.append(text if tight else f"<p>{text}</p>")
+    return "\n".join(out)
+
+
+# ---------- pages and the site ----------
+
+def output_path(page):
+    """docs/a/b.md -> site/a/b.html"""
+    return str(PurePosixPath(page).with_suffix(".html"))
+
+
+def resolve(page, url):
+    """Docs-relative target of a relative URL on page, or None for external/anchor-only URLs"""
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path or parts.path.startswith("/"):
+        return None, parts.fragment
+    return posixpath.normpath(posixpath.join(posixpath.dirname(page), parts.path)), parts.fragment
+
+
+def expand_includes(docs, relpath, text, stack=()):
+    """Text with every --8<-- "path" line replaced by that file (relative to docs/), recursively"""
+    def replace(match):
+        indent, target = match.group(1), posixpath.normpath(match.group(2))
+        if target in stack or target == relpath:
+            return f"{indent}<!-- include cycle: {html.escape(target)} -->"
+        try:
+            included = (Path(docs) / target).read_text(encoding="utf-8")
+        except OSError:
+            return f"{indent}<!-- missing include: {html.escape(target)} -->"
+        included = expand_includes(docs, target, included, stack + (relpath,))
+        return "\n".join(indent + line if line else line for line in included.splitlines())
+    return INCLUDE.sub(replace, text)
+
+
+def scan_page(text):
+    """Title, heading ids and link targets of an expanded page, without rendering it"""
+    title, anchors, links, seen = None, [], [], {}
+    in_fence = None
+    lines = text.splitlines()
+    for index, line in enumerate(lines):
+        fence = FENCE.match(line)
+        if in_fence:
+            if line.strip().startswith(in_fence) and set(line.strip()) == {in_fence[0]}:
+                in_fence = None
+            continue
+        if fence:
+            in_fence = fence.group(2)
+            continue
+        heading = HEADING.match(line)
+        level_text = (len(heading.group(1)), heading.group(2)) if heading else None
+        if not heading and index + 1 < len(lines) and line.strip() and not starts_block(line) \
+                and SETEXT.match(lines[index + 1]):
+            level_text = (1 if lines[index + 1].strip()[0] == "=" else 2, line.strip())
+        if level_text:
+            anchors.append(unique_id(slugify(level_text[1]), seen))
+            if title is None and level_text[0] == 1:
+                title = plain(level_text[1])
+        for match in LINK.finditer(CODE_SPAN.sub("", line)):
+            links.append(match.group(2))
+    return {"title": title, "anchors": anchors, "links": links}
+
+
+class PageContext:
+    """Per-page state while rendering: heading ids, link resolution and warnings"""
+
+    def __init__(self, page, site):
+        self.page = page
+        self.site = site
+        self.root = "../" * page.count("/")
+        self.seen = {}
+        self.warnings = []
+
+    def heading(self, level, text):
+        anchor = unique_id(slugify(text), self.seen)
+        return f'<h{level} id="{anchor}">{render_inline(text, self)}</h{level}>'
+
+    def link(self, url):
+        """(href, title of the target page or None)"""
+        target, fragment = resolve(self.page, url)
+        if target is None or not target.endswith(".md"):
+            return url, None
+        info = self.site["pages"].get(target)
+        if info is None:
+            self.warnings.append(f"{self.page}: broken link to {target}")
+            return url, None
+        if fragment and fragment not in info["anchors"]:
+            self.warnings.append(f"{self.page}: {target} has no heading #{fragment}")
+        href = self.root + output_path(target) + (f"#{fragment}" if fragment else "")
+        return href, info["title"]
+
+
+def nav_html(nav, pages):
+    """Site-wide nav as HTML; \\x00 in hrefs stands for each page's path back to the site root"""
+    def items(entries):
+        out = []
+        for title, value in entries:
+            if isinstance(value, list):
+                out.append(f'<li><span class="section">{html.escape(title or "")}</span><ul>{items(value)}</ul></li>')
+            elif value.endswith(".md"):
+                label = title or (pages.get(value) or {}).get("title") or value
+                out.append(f'<li><a href="\x00{output_path(value)}">{html.escape(label)}</a></li>')
+            else:
+                out.append(f'<li><a href="{html.escape(value)}">{html.escape(title or value)}</a></li>')
+        return "".join(out)
+    return f"<ul>{items(nav)}</ul>"
+
+
+def flatten(nav):
+    for title, value in nav:
+        if isinstance(value, list):
+            yield from flatten(value)
+        elif value.endswith(".md"):
+            yield value
+
+
+SITE = None
+
+
+def init_worker(site):
+    global SITE
+    SITE = site
+
+
+def render_page(page):
+    """Render one page into the site folder (runs in worker processes)
+
+    Returns (page, warnings, term weights, summary), the last two for the search index.
+    """
+    site = SITE
+    source = (Path(site["docs"]) / page).read_text(encoding="utf-8")
+    ctx = PageContext(page, site)
+    body = render_blocks(expand_includes(site["docs"], page, source).splitlines(), ctx)
+
+    out = output_path(page)
+    nav = site["nav_html"].replace(f'<li><a href="\x00{out}">', f'<li class="active"><a href="\x00{out}">', 1)
+    nav = nav.replace("\x00", ctx.root)
+
+    # Previous/next page in nav order
+    order = site["order"]
+    position = site["positions"].get(page)
+    prev_link = next_link = "<span></span>"
+    if position is not None and position > 0:
+        other = order[position - 1]
+        prev_link = (f'<a href="{ctx.root}{output_path(other)}" rel="prev">'
+                     f'&larr; {html.escape(site["pages"][other]["title"])}</a>')
+    if position is not None and position + 1 < len(order):
+        other = order[position + 1]
+        next_link = (f'<a href="{ctx.root}{output_path(other)}" rel="next">'
+                     f'{html.escape(site["pages"][other]["title"])} &rarr;</a>')
+
+    title = site["pages"][page]["title"]
+    document = PAGE.format(
+        title=html.escape(f"{title} - {site['site_name']}" if title else site["site_name"]),
+        root=ctx.root, site_name=html.escape(site["site_name"]), nav=nav, body=body,
+        prev=prev_link, next=next_link)
+    target = Path(site["out"]) / out
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(document, encoding="utf-8")
+    return (page, ctx.warnings) + search_entry(title or "", body)
+
+
+# ---------- search index ----------
+
+WORD = re.compile(r"[a-z0-9]+")
+TAG = re.compile(r"<[^>]+>")
+HEADING_TAG = re.compile(r"<h[1-6][^>]*>(.*?)</h[1-6]>", re.S)
+PARAGRAPH_TAG = re.compile(r"<p>(.*?)</p>", re.S)
+
+
+def tokenize(text):
+    """Index terms of text: lowercase ASCII words of 2-32 letters, no stopwords (docs-search.js matches this)"""
+    text = unicodedata.normalize("NFKD", text.lower()).encode("ascii", "ignore").decode("ascii")
+    return [word for word in WORD.findall(text) if 2 <= len(word) <= 32 and word not in STOPWORDS]
+
+
+def strip_tags(fragment):
+    return html.unescape(TAG.sub(" ", fragment))
+
+
+def search_entry(title, body):
+    """(term weights, summary) of a rendered page; title and heading words weigh more"""
+    weights = Counter(tokenize(strip_tags(body)))
+    for heading in HEADING_TAG.findall(body):
+        for word in tokenize(strip_tags(heading)):
+            weights[word] += HEADING_WEIGHT
+    for word in tokenize(title):
+        weights[word] += TITLE_WEIGHT
+    first = PARAGRAPH_TAG.search(body)
+    summary = " ".join(strip_tags(first.group(1)).split()) if first else ""
+    if len(summary) > SUMMARY_LENGTH:
+        summary = summary[:SUMMARY_LENGTH].rsplit(" ", 1)[0] + "…"
+    return {word: min(count, MAX_WEIGHT) for word, count in sorted(weights.items())}, summary
+
+
+def load_search_cache(out):
+    try:
+        cache = json.loads((Path(out) / SEARCH_DIR / SEARCH_CACHE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return cache if cache.get("version") == SEARCH_VERSION else None
+
+
+def write_search_file(folder, name, data, gzip_ready):
+    """Write one index file, plus a .gz sibling when asked and worth it"""
+    path = folder / name
+    path.write_bytes(data)
+    packed = gzip.compress(data, compresslevel=9, mtime=0) if gzip_ready and len(data) >= GZIP_MIN_SIZE else None
+    if packed and len(packed) < len(data):
+        Path(f"{path}.gz").write_bytes(packed)
+    else:
+        Path(f"{path}.gz").unlink(missing_ok=True)
+
+
+def encode_postings(postings):
+    """[(doc id, weight)] -> flat [id gap, weight, id gap, weight...]: small numbers, short JSON"""
+    flat, last = [], 0
+    for doc_id, weight in sorted(postings):
+        flat += [doc_id - last, weight]
+        last = doc_id
+    return flat
+
+
+def update_search(out, entries, pages, gzip_ready=False):
+    """Bring site/search/ up to date with the pages rendered in this build
+
+    entries: {page: (url, title, term weights, summary)} for rendered pages;
+    pages: every page of the site (the others were removed). Document ids are
+    stable, so a page edit only rewrites the shards holding its old or new
+    terms and its own doc block. Returns (files written, files total).
+    """
+    folder = Path(out) / SEARCH_DIR
+    folder.mkdir(parents=True, exist_ok=True)
+    cache = load_search_cache(out) or {"version": SEARCH_VERSION, "ids": {}, "terms": {}, "docs": {}, "files": {}}
+    ids, terms, docs, hashes = cache["ids"], cache["terms"], cache["docs"], cache["files"]
+    prefixes, blocks = set(), set()
+    regzip = cache.get("gzip") != gzip_ready
+    if regzip:
+        # Switching --gzip on or off touches every file
+        prefixes.update(term[:PREFIX_LENGTH] for weights in terms.values() for term in weights)
+        blocks.update(doc_id // DOCS_BLOCK for doc_id in ids.values())
+        cache["gzip"] = gzip_ready
+
+    for page in [page for page in ids if page not in pages]:
+        prefixes.update(term[:PREFIX_LENGTH] for term in terms.pop(page, {}))
+        docs.pop(page, None)
+        blocks.add(ids.pop(page) // DOCS_BLOCK)
+    used = set(ids.values())
+    free_ids = (i for i in itertools.count() if i not in used)
+    for page, (url, title, weights, summary) in sorted(entries.items()):
+        if page not in ids:
+            ids[page] = next(free_ids)
+        old = terms.get(page, {})
+        if old != weights:
+            prefixes.update(term[:PREFIX_LENGTH] for term in set(old) | set(weights))
+            terms[page] = weights
+        if docs.get(page) != [url, title, summary]:
+            docs[page] = [url, title, summary]
+            blocks.add(ids[page] // DOCS_BLOCK)
+
+    # Postings of the affected prefixes only, collected in one pass over the forward index
+    shards = {prefix: {} for prefix in prefixes}
+    for page, weights in terms.items():
+        doc_id = ids[page]
+        for term, weight in weights.items():
+            shard = shards.get(term[:PREFIX_LENGTH])
+            if shard is not None:
+                shard.setdefault(term, []).append((doc_id, weight))
+    pages_by_id = {doc_id: page for page, doc_id in ids.items()}
+    files = {f"t-{prefix}.json": {term: encode_postings(postings) for term, postings in shard.items()}
+             for prefix, shard in shards.items()}
+    files.update({f"d-{block}.json": [docs[pages_by_id[i]] if i in pages_by_id else None
+                                     for i in range(block * DOCS_BLOCK, (block + 1) * DOCS_BLOCK)]
+                  for block in blocks})
+
+    written = 0
+    for name, content in sorted(files.items()):
+        if not content or (name.startswith("d-") and not any(content)):
+            hashes.pop(name, None)
+            (folder / name).unlink(missing_ok=True)
+            Path(folder / f"{name}.gz").unlink(missing_ok=True)
+            continue
+        data = json.dumps(content, separators=(",", ":"), sort_keys=True, ensure_ascii=False).encode("utf-8")
+        digest = sha256(data)
+        if hashes.get(name) != digest or not (folder / name).exists() or regzip:
+            write_search_file(folder, name, data, gzip_ready)
+            hashes[name] = digest
+            written += 1
+
+    # Clients fetch meta.json uncached and append "build" to shard URLs, so a rebuild is picked up at once
+    meta = {"version": SEARCH_VERSION, "docs": len(ids), "prefix": PREFIX_LENGTH, "block": DOCS_BLOCK,
+            "stopwords": sorted(STOPWORDS),
+            "build": sha256(json.dumps(hashes, sort_keys=True).encode("utf-8"))[:12]}
+    (folder / "meta.json").write_text(json.dumps(meta, separators=(",", ":")), encoding="utf-8")
+    (folder / SEARCH_CACHE).write_text(json.dumps(cache, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+    return written, len(hashes)
+
+
+# ---------- mkdocs.yml ----------
+
+def read_config(path):
+    """site_name and nav from mkdocs.yml (the plain YAML subset MkDocs configs use)"""
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return "Documentation", None
+    match = re.search(r"^site_name:\s*(.+?)\s*$", text, re.M)
+    site_name = match.group(1).strip("\"'") if match else "Documentation"
+
+    lines = text.splitlines()
+    start = next((i for i, line in enumerate(lines) if re.match(r"nav\s*:\s*$", line)), None)
+    if start is None:
+        return site_name, None
+    nav = []
+    stack = [(-1, nav)]
+    for line in lines[start + 1:]:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line[0].isspace() and not line.startswith("-"):
+            break
+        entry = re.match(r"(\s*)-\s*(.*)$", line)
+        if not entry:
+            continue
+        indent = len(entry.group(1))
+        while stack[-1][0] >= indent:
+            stack.pop()
+        item = re.match(r"""^(?:"([^"]*)"|'([^']*)'|([^:]+?))\s*:(?:\s+(.*))?$""", entry.group(2).strip())
+        if item and not re.match(r"^\w+://", entry.group(2).strip()):
+            title = next(g for g in item.groups()[:3] if g is not None)
+            value = (item.group(4) or "").strip().strip("\"'")
+        else:
+            title, value = None, entry.group(2).strip().strip("\"'")
+        if value:
+            stack[-1][1].append((title, value))
+        else:
+            children = []
+            stack[-1][1].append((title, children))
+            stack.append((indent, children))
+    return site_name, nav
+
+
+# ---------- build ----------
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(out):
+    try:
+        manifest = json.loads((Path(out) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == BUILDER_VERSION else None
+
+
+def source_files(docs):
+    """Pages (.md), include-only files and assets under docs/, as posix paths"""
+    pages, partials, assets = [], [], []
+    for folder, subdirs, names in os.walk(docs):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        partial_dir = any(part.startswith("_") for part in Path(folder).relative_to(docs).parts)
+        for name in sorted(names):
+            if name.startswith("."):
+                continue
+            relpath = Path(folder, name).relative_to(docs).as_posix()
+            if partial_dir or name.startswith("_"):
+                partials.append(relpath)
+            elif name.endswith(".md"):
+                pages.append(relpath)
+            else:
+                assets.append(relpath)
+    return pages, partials, assets
+
+
+def include_closure(relpath, files):
+    """Every file relpath includes, directly or through other includes"""
+    found, todo = set(), list(files.get(relpath, {}).get("includes", []))
+    while todo:
+        target = todo.pop()
+        if target not in found and target != relpath:
+            found.add(target)
+            todo.extend(files.get(target, {}).get("includes", []))
+    return sorted(found)
+
+
+def build(docs=DOCS_DIR, out=SITE_DIR, config=CONFIG_FILE, force=False, workers=None, gzip_ready=False, log=print):
+    """Render changed pages and their dependents; returns counts, reasons and warnings"""
+    docs, out = Path(docs), Path(out)
+    previous = load_manifest(out) or {"files": {}, "pages": {}, "assets": {}, "site": None}
+    old_files, old_pages = previous["files"], previous["pages"]
+    pages, partials, assets = source_files(docs)
+
+    # 1. Content hashes; mtime and size decide whether a file is read at all.
+    #    Include targets are hashed too, even outside docs/ ("../README.md")
+    files, changed = {}, set()
+    todo = pages + partials
+    while todo:
+        relpath = todo.pop()
+        if relpath in files:
+            continue
+        try:
+            stat = (docs / relpath).stat()
+        except OSError:
+            continue  # Missing include: the page shows a comment, and is rendered again once it exists
+        old = old_files.get(relpath)
+        if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+            files[relpath] = old
+        else:
+            data = (docs / relpath).read_bytes()
+            digest = sha256(data)
+            if not old or old["sha256"] != digest:
+                changed.add(relpath)
+            files[relpath] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest,
+                              "includes": [posixpath.normpath(m.group(2))
+                                           for m in INCLUDE.finditer(data.decode("utf-8"))]}
+        todo.extend(files[relpath]["includes"])
+    changed.update(set(old_files) - set(files))
+
+    # 2. Per-page metadata (title, anchors, links), re-scanned only when the page or an include changed
+    info = {}
+    for page in pages:
+        closure = include_closure(page, files)
+        key = sha256(json.dumps([files[page]["sha256"]] + [files.get(f, {}).get("sha256") for f in closure]).encode())
+        old = old_pages.get(page)
+        if old and old["key"] == key:
+            info[page] = dict(old, includes=closure)
+            continue
+        # "key" covers the page and its includes; a missing include counts as None until it appears
+        text = expand_includes(docs, page, (docs / page).read_text(encoding="utf-8"))
+        scanned = scan_page(text)
+        targets = sorted({t for t, _ in (resolve(page, url) for url in scanned["links"]) if t and t.endswith(".md")})
+        info[page] = {"key": key, "title": scanned["title"] or PurePosixPath(page).stem.replace("-", " ").title(),
+                      "anchors": scanned["anchors"], "links": targets, "includes": closure,
+                      "warnings": old["warnings"] if old else []}
+
+    # 3. Site-wide inputs: nav (with the titles it shows) and the builder itself
+    site_name, nav = read_config(config)
+    if nav is None:
+        nav = [(None, page) for page in sorted(pages, key=lambda p: (p != "index.md", p))]
+    nav_markup = nav_html(nav, info)
+    order = [page for page in dict.fromkeys(flatten(nav)) if page in info]
+    site_key = sha256(json.dumps([BUILDER_VERSION, site_name, nav_markup, order, CSS]).encode())
+
+    # 4. Dependency graph: who has to be re-rendered, and why
+    signature = {page: [data["title"], data["anchors"]] for page, data in info.items()}
+    retitled = {page for page in set(info) | set(old_pages)
+                if page not in info or page not in old_pages
+                or signature[page] != [old_pages[page]["title"], old_pages[page]["anchors"]]}
+    search_ready = all((out / SEARCH_DIR / name).exists() for name in ("meta.json", SEARCH_CACHE))
+    neighbours = {page: [order[i] for i in (position - 1, position + 1) if 0 <= i < len(order)]
+                  for position, page in enumerate(order)}
+    reasons = {}
+    for page, data in info.items():
+        if force:
+            reasons[page] = "forced"
+        elif page not in old_pages:
+            reasons[page] = "new page"
+        elif page in changed:
+            reasons[page] = "changed"
+        elif previous["site"] != site_key:
+            reasons[page] = "navigation changed"
+        elif not (out / output_path(page)).exists():
+            reasons[page] = "output missing"
+        elif any(f in changed for f in data["includes"]):
+            reasons[page] = "includes " + ", ".join(f for f in data["includes"] if f in changed)
+        elif any(t in retitled for t in data["links"]):
+            reasons[page] = "links to " + ", ".join(t for t in data["links"] if t in retitled)
+        elif any(n in retitled for n in neighbours.get(page, ())):
+            reasons[page] = "next to " + ", ".join(n for n in neighbours[page] if n in retitled)
+        elif not search_ready:
+            reasons[page] = "search index missing"
+
+    # 5. Render, in parallel for cold builds
+    site = {"docs": str(docs), "out": str(out), "site_name": site_name, "nav_html": nav_markup, "order": order,
+            "positions": {page: i for i, page in enumerate(order)},
+            "pages": {page: {"title": data["title"], "anchors": data["anchors"]} for page, data in info.items()}}
+    dirty = sorted(reasons)
+    workers = workers if workers is not None else os.cpu_count() or 1
+    out.mkdir(parents=True, exist_ok=True)
+    if len(dirty) >= POOL_MIN_PAGES and workers > 1:
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(site,)) as pool:
+            rendered = list(pool.map(render_page, dirty, chunksize=max(1, len(dirty) // (workers * 4))))
+    else:
+        init_worker(site)
+        rendered = [render_page(page) for page in dirty]
+    # Warnings are kept per page, so an incremental build still reports those of untouched pages
+    for page, page_warnings, _, _ in rendered:
+        info[page]["warnings"] = page_warnings
+    removed = sorted(set(old_pages) - set(info))
+    for page in removed:
+        (out / output_path(page)).unlink(missing_ok=True)
+
+    search_files = (0, None)
+    if rendered or removed or previous.get("search_gzip", False) != gzip_ready:
+        entries = {page: (output_path(page), info[page]["title"], weights, summary)
+                   for page, _, weights, summary in rendered}
+        search_files = update_search(out, entries, set(info), gzip_ready)
+
+    # 6. Assets are copied when their size or mtime changed
+    copied = {}
+    css_path = out / "assets" / "docs.css"
+    if not css_path.exists() or css_path.read_text(encoding="utf-8") != CSS:
+        css_path.parent.mkdir(parents=True, exist_ok=True)
+        css_path.write_text(CSS, encoding="utf-8")
+    script = SEARCH_SCRIPT.read_bytes() if SEARCH_SCRIPT.exists() else b""
+    script_path = out / "assets" / "docs-search.js"
+    if not script_path.exists() or script_path.read_bytes() != script:
+        script_path.write_bytes(script)
+    for relpath in assets:
+        stat = (docs / relpath).stat()
+        record = [stat.st_mtime_ns, stat.st_size]
+        if previous["assets"].get(relpath) != record or not (out / relpath).exists():
+            (out / relpath).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(docs / relpath, out / relpath)
+        copied[relpath] = record
+    for relpath in set(previous["assets"]) - set(copied):
+        (out / relpath).unlink(missing_ok=True)
+
+    manifest = {"version": BUILDER_VERSION, "site": site_key, "files": files, "pages": info, "assets": copied,
+                "search_gzip": gzip_ready}
+    (out / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    return {"pages": len(info), "rendered": len(dirty), "reasons": reasons,
+            "removed": len(removed), "search_files": search_files,
+            "warnings": [w for page in sorted(info) for w in info[page]["warnings"]]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental static build of 01-core/docs (no MkDocs needed)")
+    parser.add_argument("--docs", default=str(DOCS_DIR), help="Markdown folder (default: 01-core/docs)")
+    parser.add_argument("--out", default=str(SITE_DIR), help="Output folder (default: 01-core/site)")
+    parser.add_argument("--config", default=str(CONFIG_FILE), help="mkdocs.yml with site_name and nav")
+    parser.add_argument("--workers", type=int, help="Processes for cold builds (default: one per CPU, 1 = none)")
+    parser.add_argument("--force", action="store_true", help="Render every page")
+    parser.add_argument("--explain", action="store_true", help="List rendered pages and why")
+    parser.add_argument("--strict", action="store_true", help="Exit with an error on broken links")
+    parser.add_argument("--gzip", action="store_true", help="Write .gz siblings of the search index files")
+    parser.add_argument("--clean", action="store_true", help="Delete the output folder and exit")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    if args.clean:
+        shutil.rmtree(out, ignore_errors=True)
+        print(f"🧹 Removed {out}")
+        return
+    if not Path(args.docs).is_dir():
+        print(f"❌ Docs folder not found: {args.docs}")
+        sys.exit(1)
+
+    start = perf_counter()
+    try:
+        result = build(args.docs, out, args.config, force=args.force, workers=args.workers, gzip_ready=args.gzip)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ Build failed: {e}")
+        sys.exit(1)
+    elapsed = (perf_counter() - start) * 1000
+
+    reasons = result["reasons"]
+    direct = sum(1 for reason in reasons.values() if reason in ("changed", "new page", "forced"))
+    print(f"📚 Rendered {result['rendered']} of {result['pages']} pages ({direct} changed, "
+          f"{result['rendered'] - direct} dependents), removed {result['removed']} in {elapsed:.0f} ms -> {out}")
+    written, total = result["search_files"]
+    if total is not None:
+        print(f"🔎 Search index: rewrote {written} of {total} shard files")
+    if args.explain:
+        for page, reason in sorted(reasons.items()):
+            print(f"   {page}: {reason}")
+    for warning in result["warnings"]:
+        print(f"⚠️ {warning}")
+    print(f"💡 Preview: python 05-utilities/scripts/serve.py --directory {out}")
+    if args.strict and result["warnings"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+// Docs search for sites built by build_docs.py
+// Loads search/meta.json, then only the index shards for the prefixes being typed
+// and the doc blocks of the best hits: a few KB per query instead of the whole index.
+(function () {
+  "use strict";
+
+  const LIMIT = 10;
+  const DELAY_MS = 120;
+
+  const root = (document.currentScript && document.currentScript.dataset.root) || "";
+  const input = document.getElementById("search");
+  const panel = document.getElementById("search-results");
+  if (!input || !panel) return;
+
+  const files = new Map();
+  let metaPromise = null;
+
+  function loadMeta() {
+    if (!metaPromise) {
+      // Uncached, so a rebuilt site is picked up at once; shards are cached per build
+      metaPromise = fetch(root + "search/meta.json", { cache: "no-cache" })
+        .then((response) => (response.ok ? response.json() : null))
+        .catch(() => null);
+    }
+    return metaPromise;
+  }
+
+  function load(meta, name) {
+    if (!files.has(name)) {
+      files.set(name, fetch(root + "search/" + name + "?v=" + meta.build)
+        .then((response) => (response.ok ? response.json() : null))
+        .catch(() => null));
+    }
+    return files.get(name);
+  }
+
+  // Same rules as tokenize() in build_docs.py
+  function tokenize(meta, text) {
+    const words = text.toLowerCase().normalize("NFKD").replace(/[^\x00-\x7f]/g, "").match(/[a-z0-9]+/g) || [];
+    return [...new Set(words)].filter((word) => word.length >= 2 && word.length <= 32 && !meta.stopwords.includes(word));
+  }
+
+  // Every word must match the start of an indexed term ("inst" finds "install"); scores add up per page
+  async function search(query) {
+    const meta = await loadMeta();
+    if (!meta) return null;
+    const words = tokenize(meta, query);
+    if (!words.length) return [];
+    const shards = await Promise.all(words.map((word) => load(meta, "t-" + word.slice(0, meta.prefix) + ".json")));
+
+    let scores = null;
+    words.forEach((word, index) => {
+      const shard = shards[index] || {};
+      const best = new Map();
+      for (const term in shard) {
+        if (!term.startsWith(word)) continue;
+        const postings = shard[term];
+        const idf = Math.log(1 + meta.docs / (postings.length / 2));
+        const boost = term === word ? 1.5 : 1;
+        let id = 0;
+        for (let i = 0; i < postings.length; i += 2) {
+          id += postings[i];
+          const score = postings[i + 1] * idf * boost;
+          if (score > (best.get(id) || 0)) best.set(id, score);
+        }
+      }
+      if (scores === null) {
+        scores = best;
+        return;
+      }
+      for (const [id, score] of scores) {
+        if (best.has(id)) scores.set(id, score + best.get(id));
+        else scores.delete(id);
+      }
+    });
+
+    const top = [...scores].sort((a, b) => b[1] - a[1]).slice(0, LIMIT);
+    const blockIds = [...new Set(top.map(([id]) => Math.floor(id / meta.block)))];
+    const blocks = new Map(await Promise.all(blockIds.map(async (block) => [block, await load(meta, "d-" + block + ".json")])));
+    return top
+      .map(([id]) => (blocks.get(Math.floor(id / meta.block)) || [])[id % meta.block])
+      .filter(Boolean);
+  }
+
+  function show(results) {
+    if (results === null) {
+      panel.innerHTML = "<p>Search index not found: run build_docs.py</p>";
+    } else if (!results.length) {
+      panel.innerHTML = "<p>No results</p>";
+    } else {
+      panel.replaceChildren(...results.map(([url, title, summary]) => {
+        const link = document.createElement("a");
+        link.href = root + url;
+        const heading = document.createElement("strong");
+        heading.textContent = title;
+        const text = document.createElement("small");
+        text.textContent = summary;
+        link.append(heading, text);
+        return link;
+      }));
+    }
+    panel.hidden = false;
+  }
+
+  let timer = null;
+  let latest = 0;
+  input.addEventListener("input", () => {
+    clearTimeout(timer);
+    timer = setTimeout(async () => {
+      const ticket = ++latest;
+      if (!input.value.trim()) {
+        panel.hidden = true;
+        return;
+      }
+      const results = await search(input.value);
+      // Drop answers to queries the user has already typed past
+      if (ticket === latest) show(results);
+    }, DELAY_MS);
+  });
+  input.addEventListener("keydown", (event) => {
+    if (event.key === "Escape") {
+      panel.hidden = true;
+      input.blur();
+    } else if (event.key === "Enter") {
+      const first = panel.querySelector("a");
+      if (first) window.location.href = first.href;
+    }
+  });
+  input.addEventListener("focus", loadMeta, { once: true });
+  document.addEventListener("click", (event) => {
+    if (event.target !== input && !panel.contains(event.target)) panel.hidden = true;
+  });
+})();
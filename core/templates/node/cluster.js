@@ -0,0 +1,160 @@
+// Cluster entry point: one index.js worker per CPU core, all sharing the same port
+//
+// Run with: npm run start:cluster          (WEB_CONCURRENCY=4 to pick the worker count)
+//
+// - A worker that crashes is replaced; one that crashes again within seconds of
+//   starting is restarted with a growing delay instead of in a tight loop.
+// - SIGHUP (or `kill -HUP <primary pid>`) does a rolling restart: each worker is
+//   replaced only after its successor is listening, so no request is refused.
+// - SIGTERM / SIGINT stop all workers gracefully: in-flight requests finish first.
+// - GET /api/metrics on any worker reports every worker (the primary collects them).
+
+const os = require('os');
+const path = require('path');
+const cluster = require('cluster');
+
+const WORKERS = Number(process.env.WEB_CONCURRENCY) ||
+    (os.availableParallelism ? os.availableParallelism() : os.cpus().length);
+const SHUTDOWN_TIMEOUT_MS = 10000;
+const CRASH_WINDOW_MS = 5000;
+const MAX_BACKOFF_MS = 30000;
+
+cluster.setupPrimary({ exec: path.join(__dirname, 'index.js') });
+
+let shuttingDown = false;
+let restarting = false;
+let backoffMs = 0;
+const startedAt = new Map();   // worker id -> start time
+const retiring = new Set();    // workers we asked to exit
+
+function fork() {
+    const worker = cluster.fork();
+    startedAt.set(worker.id, Date.now());
+    worker.on('message', (message) => onWorkerMessage(worker, message));
+    return worker;
+}
+
+// Ask a worker to finish its requests and exit; kill it if it takes too long
+function retire(worker) {
+    return new Promise((resolve) => {
+        retiring.add(worker.id);
+        const timer = setTimeout(() => worker.process.kill('SIGKILL'), SHUTDOWN_TIMEOUT_MS);
+        worker.once('exit', () => {
+            clearTimeout(timer);
+            resolve();
+        });
+        if (worker.isConnected()) {
+            worker.send('shutdown');
+        } else {
+            worker.process.kill('SIGTERM');
+        }
+    });
+}
+
+cluster.on('exit', (worker, code, signal) => {
+    const lived = Date.now() - (startedAt.get(worker.id) || 0);
+    startedAt.delete(worker.id);
+    if (retiring.delete(worker.id) || shuttingDown) {
+        return;
+    }
+
+    console.log(`⚠️ Worker ${worker.id} (pid ${worker.process.pid}) died (${signal || code})`);
+    if (lived < CRASH_WINDOW_MS) {
+        backoffMs = Math.min(Math.max(backoffMs * 2, 500), MAX_BACKOFF_MS);
+    } else {
+        backoffMs = 0;
+    }
+    if (backoffMs) {
+        console.log(`   restarting in ${backoffMs}ms (crashed ${lived}ms after start)`);
+    }
+    setTimeout(() => {
+        if (!shuttingDown) {
+            fork();
+        }
+    }, backoffMs);
+});
+
+async function rollingRestart() {
+    if (restarting || shuttingDown) {
+        return;
+    }
+    restarting = true;
+    console.log('🔄 Rolling restart...');
+    for (const worker of Object.values(cluster.workers)) {
+        if (shuttingDown) {
+            break;
+        }
+        const replacement = fork();
+        await new Promise((resolve) => {
+            replacement.once('listening', resolve);
+            replacement.once('exit', resolve);
+        });
+        await retire(worker);
+    }
+    restarting = false;
+    console.log('✅ Rolling restart complete');
+}
+
+async function shutdown(signal) {
+    if (shuttingDown) {
+        return;
+    }
+    shuttingDown = true;
+    console.log(`\n🛑 ${signal}: stopping ${Object.keys(cluster.workers).length} worker(s)...`);
+    await Promise.all(Object.values(cluster.workers).map(retire));
+    process.exit(0);
+}
+
+// Metrics fan-out: a worker asks, the primary collects a snapshot from every worker
+const metricQueries = new Map();   // query id -> { from, expected, snapshots, timer }
+
+function finishQuery(id) {
+    const query = metricQueries.get(id);
+    if (!query) {
+        return;
+    }
+    clearTimeout(query.timer);
+    metricQueries.delete(id);
+    const workers = query.snapshots.sort((a, b) => a.worker - b.worker);
+    if (query.from.isConnected()) {
+        query.from.send({ type: 'metrics:result', id, workers });
+    }
+}
+
+function onWorkerMessage(worker, message) {
+    if (!message || typeof message !== 'object') {
+        return;
+    }
+    if (message.type === 'metrics:query') {
+        const targets = Object.values(cluster.workers).filter((w) => w.isConnected());
+        metricQueries.set(message.id, {
+            from: worker,
+            expected: targets.length,
+            snapshots: [],
+            timer: setTimeout(() => finishQuery(message.id), 1000)
+        });
+        for (const target of targets) {
+            target.send({ type: 'metrics:collect', id: message.id, reset: message.reset });
+        }
+    } else if (message.type === 'metrics:snapshot') {
+        const query = metricQueries.get(message.id);
+        if (query) {
+            query.snapshots.push(message.snapshot);
+            if (query.snapshots.length >= query.expected) {
+                finishQuery(message.id);
+            }
+        }
+    }
+}
+
+console.log(`🚀 Cluster primary ${process.pid} starting ${WORKERS} worker(s)`);
+for (let i = 0; i < WORKERS; i++) {
+    fork();
+}
+
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+if (process.platform !== 'win32') {
+    process.on('SIGHUP', rollingRestart);
+    console.log(`   kill -HUP ${process.pid} for a zero-downtime rolling restart`);
+}
@@ -0,0 +1,191 @@
+// Runtime metrics for /api/metrics
+// Event-loop lag, event-loop utilization, heap usage, request counts and latency
+// percentiles, all from Node's built-in perf_hooks (no dependencies).
+//
+// Latency and lag are HDR-style histograms, so recording costs the same at any
+// request rate. Scrape with ?reset=1 to start a fresh window, e.g. between the
+// warm-up and measured phases of a load test.
+
+const v8 = require('v8');
+const cluster = require('cluster');
+const { performance, monitorEventLoopDelay, createHistogram } = require('perf_hooks');
+
+const MB = 1024 * 1024;
+
+// Samples the event loop every 10ms; lag is how much later than that each sample ran
+const RESOLUTION_MS = 10;
+const loopDelay = monitorEventLoopDelay({ resolution: RESOLUTION_MS });
+loopDelay.enable();
+
+const latency = createHistogram();   // request latency in microseconds
+const startedAt = Date.now();
+let windowStart = Date.now();
+let lastUtilization = performance.eventLoopUtilization();
+let active = 0;
+let total = 0;
+let byStatus = {};
+
+function middleware(req, res, next) {
+    const start = process.hrtime.bigint();
+    active++;
+    res.once('close', () => {
+        active--;
+        total++;
+        const status = `${Math.floor(res.statusCode / 100)}xx`;
+        byStatus[status] = (byStatus[status] || 0) + 1;
+        latency.record(Math.max(1, Number((process.hrtime.bigint() - start) / 1000n)));
+    });
+    next();
+}
+
+function summarize(histogram, scale, offset = 0) {
+    const round = (value) => Math.max(0, Math.round((value / scale - offset) * 1000) / 1000);
+    if (histogram.count === 0) {
+        return { count: 0 };
+    }
+    return {
+        count: histogram.count,
+        min: round(histogram.min),
+        mean: round(histogram.mean),
+        max: round(histogram.max),
+        stddev: Math.round((histogram.stddev / scale) * 1000) / 1000,
+        p50: round(histogram.percentile(50)),
+        p90: round(histogram.percentile(90)),
+        p99: round(histogram.percentile(99)),
+        p999: round(histogram.percentile(99.9))
+    };
+}
+
+function snapshot() {
+    const now = Date.now();
+    const elapsed = Math.max((now - windowStart) / 1000, 0.001);
+    const memory = process.memoryUsage();
+    const heap = v8.getHeapStatistics();
+    // Share of the window the loop spent running JavaScript rather than idle:
+    // near 1.0 means the process is CPU-saturated and more requests only add queueing
+    const utilization = performance.eventLoopUtilization(lastUtilization);
+
+    return {
+        pid: process.pid,
+        worker: cluster.isWorker ? cluster.worker.id : null,
+        uptime_s: Math.round((now - startedAt) / 1000),
+        window_s: Math.round(elapsed * 1000) / 1000,
+        requests: {
+            total,
+            active,
+            per_second: Math.round((total / elapsed) * 10) / 10,
+            by_status: { ...byStatus }
+        },
+        latency_ms: summarize(latency, 1000),
+        event_loop: {
+            utilization: Math.round(utilization.utilization * 1000) / 1000,
+            lag_ms: summarize({
+                count: loopDelay.count,
+                min: loopDelay.min,
+                mean: loopDelay.mean,
+                max: loopDelay.max,
+                stddev: loopDelay.stddev,
+                percentile: (p) => loopDelay.percentile(p)
+            }, 1e6, RESOLUTION_MS)
+        },
+        memory_mb: {
+            rss: Math.round(memory.rss / MB * 10) / 10,
+            heap_used: Math.round(memory.heapUsed / MB * 10) / 10,
+            heap_total: Math.round(memory.heapTotal / MB * 10) / 10,
+            heap_limit: Math.round(heap.heap_size_limit / MB * 10) / 10,
+            external: Math.round(memory.external / MB * 10) / 10
+        }
+    };
+}
+
+function reset() {
+    latency.reset();
+    loopDelay.reset();
+    total = 0;
+    byStatus = {};
+    windowStart = Date.now();
+    lastUtilization = performance.eventLoopUtilization();
+}
+
+// In cluster mode each worker only sees its own traffic; ask the primary to
+// collect a snapshot from every worker so one scrape covers the whole service
+let nextQuery = 0;
+const pendingQueries = new Map();
+
+function clusterSnapshot(resetAfter, timeoutMs = 2000) {
+    return new Promise((resolve) => {
+        const id = `${process.pid}-${nextQuery++}`;
+        const timer = setTimeout(() => {
+            pendingQueries.delete(id);
+            resolve(null);
+        }, timeoutMs);
+        pendingQueries.set(id, (workers) => {
+            clearTimeout(timer);
+            resolve(workers);
+        });
+        process.send({ type: 'metrics:query', id, reset: resetAfter });
+    });
+}
+
+if (cluster.isWorker) {
+    process.on('message', (message) => {
+        if (!message || typeof message !== 'object') {
+            return;
+        }
+        if (message.type === 'metrics:collect') {
+            process.send({ type: 'metrics:snapshot', id: message.id, snapshot: snapshot() });
+            if (message.reset) {
+                reset();
+            }
+        } else if (message.type === 'metrics:result' && pendingQueries.has(message.id)) {
+            const resolve = pendingQueries.get(message.id);
+            pendingQueries.delete(message.id);
+            resolve(message.workers);
+        }
+    });
+}
+
+function combine(workers) {
+    const sum = (pick) => workers.reduce((acc, worker) => acc + pick(worker), 0);
+    const byStatus = {};
+    for (const worker of workers) {
+        for (const [status, count] of Object.entries(worker.requests.by_status)) {
+            byStatus[status] = (byStatus[status] || 0) + count;
+        }
+    }
+    return {
+        workers: workers.length,
+        requests: {
+            total: sum((w) => w.requests.total),
+            active: sum((w) => w.requests.active),
+            per_second: Math.round(sum((w) => w.requests.per_second) * 10) / 10,
+            by_status: byStatus
+        },
+        // Percentiles cannot be merged exactly; the worst worker bounds the service
+        latency_ms_worst: {
+            p50: Math.max(...workers.map((w) => w.latency_ms.p50 || 0)),
+            p99: Math.max(...workers.map((w) => w.latency_ms.p99 || 0))
+        },
+        event_loop_lag_p99_ms_worst: Math.max(...workers.map((w) => w.event_loop.lag_ms.p99 || 0)),
+        event_loop_utilization_max: Math.max(...workers.map((w) => w.event_loop.utilization)),
+        rss_mb: Math.round(sum((w) => w.memory_mb.rss) * 10) / 10
+    };
+}
+
+async function handler(req, res) {
+    const resetAfter = req.query.reset === '1' || req.query.reset === 'true';
+    if (cluster.isWorker && req.query.scope !== 'worker') {
+        const workers = await clusterSnapshot(resetAfter);
+        if (workers) {
+            res.json({ cluster: combine(workers), workers });
+            return;
+        }
+    }
+    const body = snapshot();
+    if (resetAfter) {
+        reset();
+    }
+    res.json(body);
+}
+
+module.exports = { middleware, handler, snapshot, reset };
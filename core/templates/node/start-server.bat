@@ -0,0 +1,12 @@
+echo Starting Node.js application...
+cd 01-core
+if exist "package.json" (
+    if not exist "node_modules" (
+        echo Installing dependencies...
+        npm install
+    )
+    npm start
+) else (
+    echo Error: package.json not found
+    echo Run: npm init -y
+)
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Benchmarks for the data pipeline
+Per-chunk transforms on a fixed synthetic chunk, so runs are comparable
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from harness import bench
+
+# Benchmarks import the application the same way main.py is run: from 01-core/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+import pipeline  # noqa: E402
+
+CHUNK_DIR = Path(tempfile.gettempdir()) / "bench-pipeline"
+
+
+def make_chunk():
+    """One default-sized chunk of 4 float64 columns, saved as .npy like the ingest stage does"""
+    CHUNK_DIR.mkdir(exist_ok=True)
+    path = CHUNK_DIR / "chunk.npy"
+    if not path.exists():
+        rng = np.random.default_rng(42)
+        np.save(path, rng.normal(100.0, 15.0, (pipeline.DEFAULT_CHUNK_ROWS, 4)))
+    return (str(path), 0, None)
+
+
+@bench(setup=make_chunk, repeat=7)
+def chunk_stats(ref):
+    pipeline.chunk_stats(ref)
+
+
+@bench(setup=make_chunk, repeat=7)
+def normalize_chunk(ref):
+    pipeline.normalize_chunk((ref, str(CHUNK_DIR / "normalized.npy"), np.full(4, 100.0), np.full(4, 15.0)))
+
+
+@bench(setup=lambda: [pipeline.chunk_stats(make_chunk())] * 64, repeat=7)
+def merge_stats(partials):
+    total = partials[0]
+    for partial in partials[1:]:
+        total = pipeline.merge_stats(total, partial)
@@ -0,0 +1,316 @@
+"""
+Streaming data pipeline
+Chunked, cached and parallel processing of the files in 03-content/data
+
+Nothing is ever loaded whole. A source is read `chunk_rows` rows at a time,
+every transform is a vectorized numpy operation on one chunk, and chunks are
+spread over a process pool.
+
+Stages:
+    ingest      CSV -> float64 chunk files (.npy), streamed with pandas' chunked
+                reader; .npy sources are memory-mapped directly and need no ingest
+    stats       per-column count, mean, std, min and max: one partial result per
+                chunk, merged with Chan's parallel variance formula
+    normalize   z-scores of every chunk, written as float32 chunk files
+
+Each stage's output is cached in 03-content/data/.cache/<stage>/ under a key
+built from the source's path, size and modification time plus the stage's
+parameters, so a rerun skips every stage whose input has not changed.
+Outputs are written to a temporary folder and renamed when complete, so an
+interrupted run never leaves a half-written cache entry behind.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import itertools
+from pathlib import Path
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "03-content" / "data"
+CACHE_DIR = DATA_DIR / ".cache"
+OUTPUT_DIR = DATA_DIR / "output"
+DEFAULT_CHUNK_ROWS = 250_000
+# Bump when a stage's output format or logic changes, to invalidate old caches
+PIPELINE_VERSION = 1
+
+# (path, start, stop): rows start:stop of a .npy file; stop None means to the end
+Chunks = namedtuple("Chunks", "refs columns rows key cached")
+
+
+# ---------------------------------------------------------------------------
+# Cache keys and entries
+
+def source_key(path):
+    """Changes whenever the file is replaced or modified"""
+    stat = Path(path).stat()
+    return _hash([str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns])
+
+
+def stage_key(stage, upstream, **params):
+    return _hash([PIPELINE_VERSION, stage, upstream, params])
+
+
+def _hash(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def cached_chunks(stage, name, key, build, force=False):
+    """Folder of a stage's chunk files, running build(folder) -> meta only on a cache miss
+
+    Returns (folder, meta, cached). Older entries for the same source are
+    removed once the new one is complete.
+    """
+    target = CACHE_DIR / stage / f"{name}@{key}"
+    meta_path = target / "meta.json"
+    if meta_path.exists() and not force:
+        return target, json.loads(meta_path.read_text(encoding="utf-8")), True
+
+    tmp = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    try:
+        meta = build(tmp)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    shutil.rmtree(target, ignore_errors=True)
+    tmp.replace(target)
+
+    for stale in target.parent.glob(f"{name}@*"):
+        if stale != target and ".tmp-" not in stale.name:
+            shutil.rmtree(stale, ignore_errors=True)
+    return target, meta, False
+
+
+def chunk_refs(folder, chunks):
+    return [(str(folder / f"chunk-{i:05d}.npy"), 0, None) for i in range(chunks)]
+
+
+# ---------------------------------------------------------------------------
+# Readers
+
+def load(ref):
+    """Rows of one chunk as a 2-D array, memory-mapped: only touched pages are read"""
+    path, start, stop = ref
+    array = np.load(path, mmap_mode="r")
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    return array[start:stop]
+
+
+def read_csv_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    """Yield (column names, float64 array) blocks of at most chunk_rows rows
+
+    The numeric columns are picked from the first block (or given as columns);
+    later values that do not parse become NaN instead of changing the dtype.
+    """
+    import pandas as pd
+
+    names = list(columns) if columns else None
+    reader = pd.read_csv(path, chunksize=chunk_rows, usecols=names)
+    for frame in reader:
+        if names is None:
+            names = list(frame.select_dtypes("number").columns)
+            if not names:
+                raise ValueError(f"{path} has no numeric columns")
+        block = frame[names].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+        yield names, block
+
+
+def source_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None, force=False):
+    """Chunks of a source file: a memory-mapped .npy is split in place, a CSV is ingested once"""
+    path = Path(path)
+    key = stage_key("ingest", source_key(path), chunk_rows=chunk_rows, columns=columns)
+
+    if path.suffix == ".npy":
+        array = np.load(path, mmap_mode="r")
+        if array.ndim > 2:
+            raise ValueError(f"{path}: expected a 1-D or 2-D array, got shape {array.shape}")
+        width = 1 if array.ndim == 1 else array.shape[1]
+        names = list(columns) if columns else [f"column_{i}" for i in range(width)]
+        refs = [(str(path), start, start + chunk_rows) for start in range(0, len(array), chunk_rows)]
+        return Chunks(refs, names, len(array), key, True)
+
+    def ingest(folder):
+        rows = 0
+        names = []
+        count = 0
+        for count, (names, block) in enumerate(read_csv_chunks(path, chunk_rows, columns), 1):
+            np.save(folder / f"chunk-{count - 1:05d}.npy", block)
+            rows += len(block)
+        return {"source": str(path), "columns": names, "rows": rows, "chunks": count}
+
+    folder, meta, cached = cached_chunks("ingest", path.stem, key, ingest, force)
+    return Chunks(chunk_refs(folder, meta["chunks"]), meta["columns"], meta["rows"], key, cached)
+
+
+# ---------------------------------------------------------------------------
+# Parallel map over chunks
+
+def map_chunks(fn, tasks, workers=None):
+    """fn(task) for every task in a process pool, results in task order
+
+    At most two tasks per worker are in flight, so results are consumed as
+    they arrive and a long task list never queues all at once. Tasks and
+    results should be small (chunk refs, partial aggregates): the chunk data
+    itself is read by the worker from the memory-mapped file.
+    """
+    tasks = list(tasks)
+    workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+    if workers == 1:
+        return [fn(task) for task in tasks]
+
+    results = [None] * len(tasks)
+    queue = iter(enumerate(tasks))
+    with ProcessPoolExecutor(workers) as pool:
+        pending = {pool.submit(fn, task): i for i, task in itertools.islice(queue, workers * 2)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+                for i, task in itertools.islice(queue, 1):
+                    pending[pool.submit(fn, task)] = i
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Vectorized transforms (module level, so worker processes can import them)
+
+def chunk_stats(ref):
+    """Partial per-column statistics of one chunk, ignoring NaN"""
+    block = load(ref)
+    valid = ~np.isnan(block)
+    count = valid.sum(axis=0)
+    total = np.where(valid, block, 0.0).sum(axis=0)
+    mean = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+    m2 = np.where(valid, (block - mean) ** 2, 0.0).sum(axis=0)
+    return {
+        "count": count,
+        "mean": mean,
+        "m2": m2,
+        "min": np.where(valid, block, np.inf).min(axis=0, initial=np.inf),
+        "max": np.where(valid, block, -np.inf).max(axis=0, initial=-np.inf),
+    }
+
+
+def merge_stats(a, b):
+    """Combine two partial results (Chan et al. parallel mean/variance)"""
+    count = a["count"] + b["count"]
+    delta = b["mean"] - a["mean"]
+    safe = np.maximum(count, 1)
+    return {
+        "count": count,
+        "mean": a["mean"] + delta * b["count"] / safe,
+        "m2": a["m2"] + b["m2"] + delta ** 2 * a["count"] * b["count"] / safe,
+        "min": np.minimum(a["min"], b["min"]),
+        "max": np.maximum(a["max"], b["max"]),
+    }
+
+
+def normalize_chunk(task):
+    """Write the z-scores of one chunk as float32; returns the number of rows"""
+    ref, out_path, mean, std = task
+    block = load(ref)
+    scale = np.where(std > 0, std, 1.0)
+    np.save(out_path, ((block - mean) / scale).astype(np.float32))
+    return len(block)
+
+
+# ---------------------------------------------------------------------------
+# Stages
+
+def column_stats(chunks, name, workers=None, force=False):
+    """Per-column statistics of all chunks, cached as JSON next to the chunk caches"""
+    key = stage_key("stats", chunks.key)
+    path = CACHE_DIR / "stats" / f"{name}@{key}.json"
+    if path.exists() and not force:
+        return json.loads(path.read_text(encoding="utf-8")), True
+
+    total = None
+    for partial in map_chunks(chunk_stats, chunks.refs, workers):
+        total = partial if total is None else merge_stats(total, partial)
+    if total is None:
+        # No chunks (an empty array, a CSV with no rows): every column has no values
+        count = np.zeros(len(chunks.columns), dtype=np.int64)
+        std = np.zeros(len(chunks.columns))
+    else:
+        count = total["count"]
+        std = np.sqrt(np.divide(total["m2"], count - 1, out=np.zeros_like(total["m2"]), where=count > 1))
+    stats = {}
+    for i, column in enumerate(chunks.columns):
+        has_values = bool(count[i])
+        stats[column] = {
+            "count": int(count[i]),
+            "missing": chunks.rows - int(count[i]),
+            "mean": float(total["mean"][i]) if has_values else None,
+            "std": float(std[i]) if has_values else None,
+            "min": float(total["min"][i]) if has_values else None,
+            "max": float(total["max"][i]) if has_values else None,
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+    for stale in path.parent.glob(f"{name}@*.json"):
+        if stale != path:
+            stale.unlink()
+    return stats, False
+
+
+def normalize(chunks, stats, name, workers=None, force=False):
+    """z-scored float32 copy of every chunk, as Chunks"""
+    key = stage_key("normalize", chunks.key)
+    mean = np.array([stats[c]["mean"] or 0.0 for c in chunks.columns])
+    std = np.array([stats[c]["std"] or 0.0 for c in chunks.columns])
+
+    def build(folder):
+        tasks = [(ref, str(folder / f"chunk-{i:05d}.npy"), mean, std) for i, ref in enumerate(chunks.refs)]
+        rows = sum(map_chunks(normalize_chunk, tasks, workers))
+        return {"columns": chunks.columns, "rows": rows, "chunks": len(tasks)}
+
+    folder, meta, cached = cached_chunks("normalize", name, key, build, force)
+    return Chunks(chunk_refs(folder, meta["chunks"]), meta["columns"], meta["rows"], key, cached)
+
+
+def run(source, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None, workers=None, force=False):
+    """Run every stage for one source file; returns a summary dict"""
+    source = Path(source)
+    chunks = source_chunks(source, chunk_rows, columns, force)
+    stats, stats_cached = column_stats(chunks, source.stem, workers, force)
+    normalized = normalize(chunks, stats, source.stem, workers, force)
+
+    summary = {
+        "source": str(source),
+        "rows": chunks.rows,
+        "chunks": len(chunks.refs),
+        "stages": {"ingest": chunks.cached, "stats": stats_cached, "normalize": normalized.cached},
+        "normalized": str(Path(normalized.refs[0][0]).parent) if normalized.refs else None,
+        "columns": stats,
+    }
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    (OUTPUT_DIR / f"{source.stem}-summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
+
+
+def make_sample(path, rows, chunk_rows=DEFAULT_CHUNK_ROWS, seed=42):
+    """Write a synthetic CSV of `rows` rows, generated and appended one chunk at a time"""
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for start in range(0, rows, chunk_rows):
+        size = min(chunk_rows, rows - start)
+        frame = pd.DataFrame({
+            "id": np.arange(start, start + size),
+            "category": rng.choice(np.array(["a", "b", "c"]), size),
+            "value": rng.normal(100.0, 15.0, size),
+            "amount": rng.exponential(20.0, size).round(2),
+            "score": rng.uniform(0.0, 1.0, size),
+        })
+        frame.to_csv(path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+    return path
@@ -0,0 +1,86 @@
+"""
+Benchmark harness
+Register timed cases with @bench; run_benchmarks.py discovers and runs them
+
+    from harness import bench
+
+    @bench(repeat=7)
+    def sort_100k():
+        sorted(DATA)
+
+    @bench(setup=lambda: list(range(10**6)), repeat=5)
+    def sum_list(values):          # setup runs untimed, its result is the argument
+        sum(values)
+
+Each case is calibrated so one sample lasts at least --min-time (a fast
+function is called many times per sample), then timed `repeat` times with
+the garbage collector off. Results are per call.
+"""
+
+import gc
+import statistics
+from time import perf_counter
+
+CASES = {}
+
+
+def bench(name=None, repeat=5, setup=None, unit="s"):
+    """Decorator registering a benchmark case"""
+    def register(fn):
+        CASES[name or fn.__name__] = {"fn": fn, "repeat": repeat, "setup": setup, "unit": unit}
+        return fn
+    return register
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def calibrate(call, min_time):
+    """Calls per sample so that one sample takes at least min_time seconds"""
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            call()
+        if perf_counter() - start >= min_time or number >= 1 << 24:
+            return number
+        number *= 10
+
+
+def run_case(case, min_time=0.05, repeat=None):
+    """Time one registered case; returns a result record (seconds per call)"""
+    args = (case["setup"](),) if case["setup"] else ()
+    fn = case["fn"]
+
+    def call():
+        fn(*args)
+
+    number = calibrate(call, min_time)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat or case["repeat"]):
+            start = perf_counter()
+            for _ in range(number):
+                call()
+            samples.append((perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "value": statistics.median(samples),
+        "unit": case["unit"],
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "p95": percentile(samples, 0.95),
+        "runs": len(samples),
+        "calls_per_run": number,
+    }
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+Runs every @bench case in 01-core/tests/bench/bench_*.py and compares against a baseline
+
+Usage:
+    python 01-core/tests/bench/run_benchmarks.py run                  # -> results.json
+    python 01-core/tests/bench/run_benchmarks.py run -k sort --repeat 15
+    python 01-core/tests/bench/run_benchmarks.py run --save-baseline  # store as baseline.json
+    python 01-core/tests/bench/run_benchmarks.py compare results.json # exit 1 on a regression
+
+Baselines are machine specific: record one per machine (or CI runner type)
+before comparing, and commit it if everyone benchmarks on the same hardware.
+"""
+
+import os
+import sys
+import json
+import platform
+import argparse
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_RESULTS = BENCH_DIR / "results.json"
+
+sys.path.insert(0, str(BENCH_DIR))
+import harness  # noqa: E402
+
+
+def load_cases(pattern=None):
+    """Import every bench_*.py module; returns {case name: case} in file order"""
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    cases = {}
+    for name, case in harness.CASES.items():
+        if not pattern or pattern in name:
+            cases[name] = case
+    return cases
+
+
+def run(args):
+    cases = load_cases(args.k)
+    if not cases:
+        print("❌ No benchmark cases found" + (f" matching '{args.k}'" if args.k else ""))
+        sys.exit(2)
+    results = {}
+    for name, case in cases.items():
+        result = harness.run_case(case, min_time=args.min_time, repeat=args.repeat)
+        results[name] = result
+        print(f"⏱️ {name:<32} {format_time(result['value']):>10} per call "
+              f"(±{result['stdev'] / result['value']:.0%} over {result['runs']} runs, "
+              f"{result['calls_per_run']} calls each)" if result["value"] else f"⏱️ {name:<32} too fast to time")
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("µs", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.3f} {unit}"
+    return f"{seconds * 1e9:.1f} ns"
+
+
+def compare(current, baseline, threshold):
+    """Return (rows, regressions) comparing the median time of every shared case"""
+    rows = []
+    regressions = []
+    for name, result in sorted(current["results"].items()):
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, None, result["value"], None, "new"))
+            continue
+        old, new = base["value"], result["value"]
+        change = (new - old) / old if old else 0.0
+        # Slower than the threshold and slower than the baseline's own run-to-run spread
+        noise = max(threshold, 2 * base.get("stdev", 0) / old if old else 0)
+        status = "REGRESSION" if change > noise else ("improved" if change < -noise else "ok")
+        rows.append((name, old, new, change, status))
+        if status == "REGRESSION":
+            regressions.append(name)
+    return rows, regressions
+
+
+def print_comparison(rows, threshold):
+    print(f"{'Case':<32} {'Baseline':>12} {'Current':>12} {'Change':>9}  Status (threshold {threshold:.0%})")
+    for name, old, new, change, status in rows:
+        old_text = format_time(old) if old is not None else "-"
+        change_text = f"{change:+9.1%}" if change is not None else f"{'-':>9}"
+        print(f"{name:<32} {old_text:>12} {format_time(new):>12} {change_text}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the project's benchmarks and compare against a baseline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmark cases and save JSON results")
+    run_parser.add_argument("-k", metavar="TEXT", help="Only run cases whose name contains TEXT")
+    run_parser.add_argument("--repeat", type=int, help="Timed runs per case (default: per case, usually 5)")
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per run (default: 0.05)")
+    run_parser.add_argument("--output", default=str(DEFAULT_RESULTS), help="Results file (default: results.json)")
+    run_parser.add_argument("--save-baseline", action="store_true", help=f"Also save results as {DEFAULT_BASELINE.name}")
+
+    compare_parser = sub.add_parser("compare", help="Flag regressions against a stored baseline")
+    compare_parser.add_argument("results", nargs="?", default=str(DEFAULT_RESULTS), help="Results file from `run`")
+    compare_parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline results file")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Allowed relative slowdown before flagging (default: 0.10)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args)
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"✅ Results saved: {args.output}")
+        if args.save_baseline:
+            DEFAULT_BASELINE.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            print(f"📌 Baseline saved: {DEFAULT_BASELINE}")
+        return
+
+    try:
+        current = json.loads(Path(args.results).read_text(encoding="utf-8"))
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read results: {e}")
+        sys.exit(2)
+
+    if current["meta"].get("machine") != baseline["meta"].get("machine") or \
+            current["meta"].get("python") != baseline["meta"].get("python"):
+        print("⚠️ Baseline was recorded on a different machine or Python version; differences may not be regressions")
+    rows, regressions = compare(current, baseline, args.threshold)
+    print_comparison(rows, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
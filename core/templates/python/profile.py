@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Profiler wrapper
+Runs a script under cProfile, tracemalloc and/or a sampling profiler
+
+Run with: python 05-utilities/scripts/profile.py                      # CPU profile of 01-core/main.py
+          python 05-utilities/scripts/profile.py --memory app.py arg1  # top allocations as well
+          python 05-utilities/scripts/profile.py --sample --folded stacks.txt
+          python 05-utilities/scripts/profile.py --no-cpu --memory -m mypackage.cli
+
+--cpu (default)  deterministic cProfile; summary table plus profile.prof
+                 (open with `python -m pstats profile.prof` or snakeviz)
+--memory         tracemalloc: peak traced memory and the lines that allocated most
+--sample         a signal timer interrupts the program every --interval ms and
+                 records the stack: low overhead, shows where wall time goes in
+                 long runs. --folded writes stacks for flamegraph.pl / speedscope.
+                 Unix only (setitimer).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# This file is named profile.py: keep its folder off sys.path, or cProfile's own
+# `import profile` would load this script instead of the standard library module
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != SCRIPT_DIR]
+
+import io
+import time
+import runpy
+import pstats
+import signal
+import argparse
+import cProfile
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+
+CORE_DIR = SCRIPT_DIR.parent.parent / "01-core"
+DEFAULT_TARGET = CORE_DIR / "main.py"
+
+
+class Sampler:
+    """Collects call stacks from a SIGPROF (CPU time) or SIGALRM (wall time) timer"""
+
+    def __init__(self, interval, wall=False):
+        self.interval = interval
+        self.timer, self.signal = (signal.ITIMER_REAL, signal.SIGALRM) if wall else (signal.ITIMER_PROF, signal.SIGPROF)
+        self.stacks = Counter()
+
+    def _handle(self, signum, frame):
+        stack = []
+        # Stop at this wrapper's frames so stacks start at the profiled program
+        while frame is not None and frame.f_code.co_filename != __file__:
+            code = frame.f_code
+            if "runpy" not in code.co_filename:
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        signal.signal(self.signal, self._handle)
+        signal.setitimer(self.timer, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc):
+        signal.setitimer(self.timer, 0, 0)
+        signal.signal(self.signal, signal.SIG_DFL)
+
+    def report(self, top):
+        total = sum(self.stacks.values())
+        own = Counter()
+        inclusive = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                inclusive[frame] += count
+        print(f"\n🎯 Sampling: {total} samples every {self.interval * 1000:g} ms")
+        if not total:
+            print("   (the program finished before the first sample)")
+            return
+        print(f"   {'self %':>7} {'total %':>8}  function")
+        for frame, count in own.most_common(top):
+            print(f"   {count / total:7.1%} {inclusive[frame] / total:8.1%}  {frame}")
+
+    def write_folded(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def run_target(args):
+    """Run the script or module like `python <script>` / `python -m <module>` would"""
+    if args.module:
+        sys.argv = [args.target] + args.args
+        sys.path.insert(0, os.getcwd())
+        runpy.run_module(args.target, run_name="__main__", alter_sys=True)
+    else:
+        target = Path(args.target).resolve()
+        sys.argv = [str(target)] + args.args
+        sys.path.insert(0, str(target.parent))
+        runpy.run_path(str(target), run_name="__main__")
+
+
+def print_memory(snapshot, top):
+    current, peak = tracemalloc.get_traced_memory()
+    print(f"\n🧠 Memory: peak {peak / 1024 / 1024:.1f} MB traced, {current / 1024 / 1024:.1f} MB still allocated at exit")
+    stats = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+        tracemalloc.Filter(False, runpy.__file__),
+    ]).statistics("lineno")
+    print(f"   {'size':>10} {'blocks':>8}  allocated at")
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        print(f"   {stat.size / 1024:8.1f}KB {stat.count:8}  {frame.filename}:{frame.lineno}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile a Python script: CPU, memory and sampled stacks")
+    parser.add_argument("target", nargs="?", default=str(DEFAULT_TARGET), help="Script (default: 01-core/main.py)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments passed to the script")
+    parser.add_argument("-m", dest="module", action="store_true", help="Treat target as a module name")
+    parser.add_argument("--no-cpu", dest="cpu", action="store_false", help="Skip the cProfile run")
+    parser.add_argument("--memory", action="store_true", help="Trace allocations with tracemalloc")
+    parser.add_argument("--frames", type=int, default=1, help="tracemalloc frames kept per allocation (default: 1)")
+    parser.add_argument("--sample", action="store_true", help="Sample stacks with a signal timer (Unix)")
+    parser.add_argument("--wall", action="store_true", help="Sample wall time (SIGALRM) instead of CPU time")
+    parser.add_argument("--interval", type=float, default=5.0, help="Sampling interval in ms (default: 5)")
+    parser.add_argument("--folded", help="Write sampled stacks in folded format to this file")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key (default: cumulative, e.g. tottime)")
+    parser.add_argument("--top", type=int, default=25, help="Rows per report (default: 25)")
+    parser.add_argument("-o", "--output", default="profile.prof", help="cProfile output file (default: profile.prof)")
+    args = parser.parse_args()
+
+    if args.sample and not hasattr(signal, "setitimer"):
+        parser.error("--sample needs signal.setitimer, which this platform does not have")
+    if not args.module and not Path(args.target).is_file():
+        parser.error(f"no such script: {args.target}")
+
+    profiler = cProfile.Profile() if args.cpu else None
+    sampler = Sampler(args.interval / 1000, args.wall) if args.sample else None
+    if args.memory:
+        tracemalloc.start(args.frames)
+
+    exit_code = 0
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            if sampler:
+                stack.enter_context(sampler)
+            if profiler:
+                stack.enter_context(profiler)
+            run_target(args)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot() if args.memory else None
+
+    # The program's own output is above; reports go below a clear marker
+    print(f"\n{'=' * 60}\n⏱️ {args.target} ran in {elapsed:.3f}s (exit code {exit_code})")
+    if profiler:
+        profiler.dump_stats(args.output)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats(args.sort).print_stats(args.top)
+        print(f"\n🔥 CPU profile (sorted by {args.sort}, saved to {args.output}):")
+        print(stream.getvalue().strip())
+    if snapshot:
+        print_memory(snapshot, args.top)
+        tracemalloc.stop()
+    if sampler:
+        sampler.report(args.top)
+        if args.folded:
+            sampler.write_folded(args.folded)
+            print(f"   Folded stacks saved to {args.folded}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+echo Starting Python application...
+cd 01-core
+if exist "..\venv\Scripts\activate.bat" (
+    call ..\venv\Scripts\activate.bat
+    python main.py
+) else if exist "venv\Scripts\activate.bat" (
+    call venv\Scripts\activate.bat
+    python main.py
+) else (
+    echo Warning: Virtual environment not found
+    echo Run: python -m venv venv
+    echo Then: venv\Scripts\activate
+    echo Then: pip install -r requirements.txt
+    python main.py
+)
\ No newline at end of file
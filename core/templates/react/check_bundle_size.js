@@ -0,0 +1,125 @@
+#!/usr/bin/env node
+/*
+ * Bundle size budget check
+ * Fails (exit code 1) when a production chunk exceeds its budget
+ *
+ * Run with: npm run build                  (runs automatically as "postbuild")
+ *           node ../05-utilities/scripts/check_bundle_size.js [--config bundle-budgets.json] [--json]
+ *
+ * Budgets live in 01-core/bundle-budgets.json:
+ *   { "pattern": "static/js/*.chunk.js", "maxKB": 50 }               every matching file
+ *   { "pattern": "static/js/*.js", "maxKB": 200, "total": true }     all matching files together
+ * Sizes are gzip sizes when "gzip" is true (what browsers download), raw bytes otherwise.
+ */
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const CORE_DIR = path.resolve(__dirname, '..', '..', '01-core');
+
+function parseArgs(argv) {
+    const args = { config: path.join(CORE_DIR, 'bundle-budgets.json'), json: false };
+    for (let i = 0; i < argv.length; i++) {
+        if (argv[i] === '--config') args.config = path.resolve(argv[++i]);
+        else if (argv[i] === '--json') args.json = true;
+    }
+    return args;
+}
+
+function globToRegExp(pattern) {
+    let source = '';
+    for (let i = 0; i < pattern.length; i++) {
+        const ch = pattern[i];
+        if (ch === '*' && pattern[i + 1] === '*') {
+            source += '.*';
+            i++;
+        } else if (ch === '*') {
+            source += '[^/]*';
+        } else if (ch === '?') {
+            source += '[^/]';
+        } else {
+            source += ch.replace(/[.+^${}()|[\]\\]/g, '\\$&');
+        }
+    }
+    return new RegExp('^' + source + '$');
+}
+
+function listFiles(dir, base = dir) {
+    let files = [];
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+        const full = path.join(dir, entry.name);
+        if (entry.isDirectory()) files = files.concat(listFiles(full, base));
+        else if (entry.isFile()) files.push(path.relative(base, full).split(path.sep).join('/'));
+    }
+    return files;
+}
+
+function measure(file, gzip) {
+    const data = fs.readFileSync(file);
+    return gzip ? zlib.gzipSync(data, { level: 9 }).length : data.length;
+}
+
+function check(config, buildDir) {
+    const files = listFiles(buildDir).filter((file) => !file.endsWith('.map') && !file.endsWith('.LICENSE.txt'));
+    const sizes = new Map(files.map((file) => [file, measure(path.join(buildDir, file), config.gzip !== false)]));
+    const results = [];
+
+    for (const budget of config.budgets) {
+        const regex = globToRegExp(budget.pattern);
+        const matching = files.filter((file) => regex.test(file));
+        const limit = budget.maxKB * 1024;
+        if (budget.total) {
+            const size = matching.reduce((sum, file) => sum + sizes.get(file), 0);
+            results.push({ name: `${budget.pattern} (total of ${matching.length})`, size, limit, ok: size <= limit });
+        } else {
+            for (const file of matching) {
+                const size = sizes.get(file);
+                results.push({ name: file, size, limit, ok: size <= limit });
+            }
+        }
+    }
+    return results;
+}
+
+function main() {
+    const args = parseArgs(process.argv.slice(2));
+    let config;
+    try {
+        config = JSON.parse(fs.readFileSync(args.config, 'utf8'));
+    } catch (error) {
+        console.error(`❌ Cannot read budgets: ${error.message}`);
+        process.exit(2);
+    }
+
+    const buildDir = path.resolve(path.dirname(args.config), config.buildDir || 'build');
+    if (!fs.existsSync(buildDir)) {
+        console.error(`❌ No build output at ${buildDir}: run npm run build first`);
+        process.exit(2);
+    }
+
+    const results = check(config, buildDir);
+    const failures = results.filter((result) => !result.ok);
+
+    if (args.json) {
+        console.log(JSON.stringify({ gzip: config.gzip !== false, results, failures: failures.length }, null, 2));
+    } else {
+        const kind = config.gzip !== false ? 'gzip' : 'raw';
+        console.log(`📦 Bundle size budgets (${kind})`);
+        for (const result of results) {
+            const used = ((result.size / result.limit) * 100).toFixed(0);
+            const line = `${(result.size / 1024).toFixed(1).padStart(8)} KB / ${(result.limit / 1024).toFixed(0).padStart(4)} KB ${used.padStart(4)}%  ${result.name}`;
+            console.log(`${result.ok ? '  ✅' : '  ❌'} ${line}`);
+        }
+        if (!results.length) console.log('  ⚠️ No files matched any budget pattern');
+    }
+
+    if (failures.length) {
+        console.error(`❌ ${failures.length} bundle(s) over budget: split code with React.lazy or raise the limit in bundle-budgets.json`);
+        process.exit(1);
+    }
+}
+
+main();
@@ -0,0 +1,28 @@
+import React, { Suspense } from 'react';
+import { Routes, Route } from 'react-router-dom';
+import Nav from './components/Nav';
+import Loading from './components/Loading';
+import ErrorBoundary from './components/ErrorBoundary';
+import { routes, NotFound } from './routes';
+import './App.css';
+
+export default function App() {
+    return (
+        <div className="app">
+            {/* Nav gets a module-level array: its props never change, so memo skips every re-render */}
+            <Nav routes={routes} />
+            <main className="app-main">
+                <ErrorBoundary>
+                    <Suspense fallback={<Loading />}>
+                        <Routes>
+                            {routes.map(({ path, Component }) => (
+                                <Route key={path} path={path} element={<Component />} />
+                            ))}
+                            <Route path="*" element={<NotFound />} />
+                        </Routes>
+                    </Suspense>
+                </ErrorBoundary>
+            </main>
+        </div>
+    );
+}
@@ -0,0 +1,22 @@
+import React from 'react';
+
+// A lazy chunk can fail to load (offline, or a deploy replaced it); show a retry instead of a blank page
+export default class ErrorBoundary extends React.Component {
+    state = { error: null };
+
+    static getDerivedStateFromError(error) {
+        return { error };
+    }
+
+    render() {
+        if (this.state.error) {
+            return (
+                <div className="error" role="alert">
+                    <p>Something went wrong loading this page.</p>
+                    <button onClick={() => window.location.reload()}>Reload</button>
+                </div>
+            );
+        }
+        return this.props.children;
+    }
+}
@@ -0,0 +1,40 @@
+import React, { memo, useCallback, useMemo, useState } from 'react';
+
+// Memoized row: re-renders only when its own item or selection state changes
+const Item = memo(function Item({ item, selected, onSelect }) {
+    return (
+        <li className={selected ? 'item selected' : 'item'} onClick={() => onSelect(item.id)}>
+            {item.label}
+        </li>
+    );
+});
+
+export default function ItemList({ items }) {
+    const [query, setQuery] = useState('');
+    const [selectedId, setSelectedId] = useState(null);
+
+    // Filtering only reruns when the items or the query change
+    const visible = useMemo(() => {
+        const needle = query.trim().toLowerCase();
+        return needle ? items.filter((item) => item.label.toLowerCase().includes(needle)) : items;
+    }, [items, query]);
+
+    // Stable callback so memoized rows are not re-rendered by a new function each time
+    const handleSelect = useCallback((id) => setSelectedId(id), []);
+
+    return (
+        <div className="item-list">
+            <input
+                type="search"
+                placeholder="Filter…"
+                value={query}
+                onChange={(event) => setQuery(event.target.value)}
+            />
+            <ul>
+                {visible.map((item) => (
+                    <Item key={item.id} item={item} selected={item.id === selectedId} onSelect={handleSelect} />
+                ))}
+            </ul>
+        </div>
+    );
+}
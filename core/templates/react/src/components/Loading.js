@@ -0,0 +1,5 @@
+import React from 'react';
+
+export default function Loading() {
+    return <div className="loading" role="status" aria-live="polite">Loading…</div>;
+}
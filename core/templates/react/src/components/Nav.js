@@ -0,0 +1,23 @@
+import React, { memo } from 'react';
+import { NavLink } from 'react-router-dom';
+
+function Nav({ routes }) {
+    return (
+        <nav className="app-nav">
+            {routes.map((route) => (
+                <NavLink
+                    key={route.path}
+                    to={route.path}
+                    end
+                    // Warm the route's chunk so the click renders without a loading state
+                    onMouseEnter={route.load}
+                    onFocus={route.load}
+                >
+                    {route.label}
+                </NavLink>
+            ))}
+        </nav>
+    );
+}
+
+export default memo(Nav);
@@ -0,0 +1,11 @@
+import React from 'react';
+import { Link } from 'react-router-dom';
+
+export default function NotFound() {
+    return (
+        <section>
+            <h1>Page not found</h1>
+            <p><Link to="/">Back to the home page</Link></p>
+        </section>
+    );
+}
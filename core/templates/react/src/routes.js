@@ -0,0 +1,14 @@
+import { lazy } from 'react';
+
+// Each page is its own chunk. The loaders are kept so navigation links can
+// start downloading a chunk on hover/focus, before the click.
+export const routes = [
+    { path: '/', label: 'Home', load: () => import('./pages/Home') },
+    { path: '/about', label: 'About', load: () => import('./pages/About') },
+];
+
+for (const route of routes) {
+    route.Component = lazy(route.load);
+}
+
+export const NotFound = lazy(() => import('./pages/NotFound'));
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Asset build for deployment
+Copies 01-core into dist/ with minified, content-hashed CSS/JS bundles
+
+Run with: python 05-utilities/scripts/build.py            # incremental
+          python 05-utilities/scripts/build.py --force    # rebuild everything
+          python 05-utilities/scripts/build.py --clean    # delete dist/
+
+- style.css -> style.3f2a9c1e.css (hash of the minified content), same for .js
+- href/src references in HTML pages are rewritten to the hashed names
+- Text files get a .gz sibling (serve.py sends it to gzip clients as-is)
+- dist/build-manifest.json records inputs (mtime, size, hash) and outputs;
+  unchanged inputs are not reprocessed and stale outputs are removed
+
+Minification is deliberately conservative: comments and redundant
+whitespace only. JavaScript keeps its line breaks, so automatic semicolon
+insertion behaves exactly as in the source.
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import shutil
+import posixpath
+import hashlib
+import argparse
+from pathlib import Path, PurePosixPath
+from time import perf_counter
+from urllib.parse import urlsplit
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+SOURCE_DIR = PROJECT_DIR / "01-core"
+DIST_DIR = PROJECT_DIR / "dist"
+MANIFEST_NAME = "build-manifest.json"
+MANIFEST_VERSION = 1
+HASH_LENGTH = 8
+GZIP_MIN_SIZE = 512
+GZIP_SUFFIXES = {".html", ".htm", ".css", ".js", ".mjs", ".json", ".svg", ".txt", ".xml", ".map", ".md"}
+HTML_SUFFIXES = {".html", ".htm"}
+REFERENCE = re.compile(r"""(\b(?:href|src)\s*=\s*)(["'])([^"']+)\2""", re.I)
+
+
+# ---------- minifiers ----------
+
+CSS_TOKENS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)""", re.S)
+
+
+def minify_css(text):
+    """Strip comments (except /*! ... */) and whitespace that carries no meaning"""
+    parts = []
+    code = []
+    last = 0
+    for match in CSS_TOKENS.finditer(text):
+        code.append(text[last:match.start()])
+        last = match.end()
+        kept = match.group(1) or (match.group(2) if match.group(2).startswith("/*!") else None)
+        if kept is None:
+            code.append(" ")  # Dropped comment: still separates tokens
+            continue
+        parts += [("code", "".join(code)), ("string", kept)]
+        code = []
+    code.append(text[last:])
+    parts.append(("code", "".join(code)))
+
+    out = []
+    for kind, chunk in parts:
+        if kind == "code":
+            chunk = re.sub(r"\s+", " ", chunk)
+            # Never around + or -: they are operators inside calc()
+            chunk = re.sub(r" ?([{};,>~]) ?", r"\1", chunk)
+            chunk = re.sub(r": ", ":", chunk)
+            chunk = chunk.replace(";}", "}")
+        out.append(chunk)
+    return "".join(out).strip() + "\n"
+
+
+REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+                  "throw", "case", "do", "else", "yield", "await"}
+
+
+def minify_js(text):
+    """Drop comments, indentation and blank lines; line breaks are kept so ASI is unaffected
+
+    Checks (python -m doctest build.py):
+    >>> minify_js("x = i++ / 2;  // half\\n")
+    'x = i++ / 2;\\n'
+    >>> minify_js('s = `a ${cond ? `x  y` : ""} b`;  /* keep */\\n')
+    's = `a ${cond ? `x  y` : ""} b`;\\n'
+    >>> minify_js("t = `${ {a: 1}.a }  /* not a comment */`;\\n")
+    't = `${ {a: 1}.a }  /* not a comment */`;\\n'
+    """
+    out = []
+    i, n = 0, len(text)
+    last = ""       # last significant character emitted
+    word = ""       # identifier or keyword that ended at `last`
+    incdec = False  # `last` closed a ++ or -- token: `i++ / 2` is a division, not a regex
+    space = newline = False
+    templates = []  # per open template `${`: braces opened inside it and not yet closed
+
+    def emit(chunk):
+        nonlocal space, newline
+        if out and newline:
+            out.append("\n")
+        elif out and space:
+            out.append(" ")
+        space = newline = False
+        out.append(chunk)
+
+    while i < n:
+        ch = text[i]
+        if ch in " \t\r\n\f\v":
+            if ch == "\n":
+                newline = True
+            else:
+                space = True
+            i += 1
+        elif ch == "/" and text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end < 0 else end
+        elif ch == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            if "\n" in text[i:end]:
+                newline = True
+            else:
+                space = True
+            i = end
+        elif ch == "`" or (ch == "}" and templates and not templates[-1]):
+            # Template literal text, from its opening ` or the } closing a ${: copied verbatim
+            if ch == "}":
+                templates.pop()
+            j = i + 1
+            while j < n and text[j] != "`" and not text.startswith("${", j):
+                j += 2 if text[j] == "\\" else 1
+            last = "`"
+            if j < n and text[j] == "`":
+                j += 1
+            elif j < n:
+                j += 2
+                templates.append(0)
+                last = "{"
+            emit(text[i:j])
+            word, incdec = "", False
+            i = j
+        elif ch in "'\"" or (ch == "/" and not incdec
+                               and (not last or last in REGEX_PRECEDERS or word in REGEX_KEYWORDS)):
+            # String or regex literal: copied verbatim
+            j = i + 1
+            in_class = False
+            while j < n:
+                c = text[j]
+                if c == "\\":
+                    j += 2
+                    continue
+                if ch == "/" and c == "[":
+                    in_class = True
+                elif ch == "/" and c == "]":
+                    in_class = False
+                elif c == ch and not in_class:
+                    break
+                elif c == "\n":
+                    break  # Unterminated literal: leave the rest to the browser to reject
+                j += 1
+            j += 1
+            if ch == "/":
+                while j < n and (text[j].isalnum() or text[j] == "_"):
+                    j += 1  # flags
+            emit(text[i:j])
+            last, word, incdec = ch, "", False
+            i = j
+        else:
+            j = i
+            if ch.isalnum() or ch in "_$":
+                while j < n and (text[j].isalnum() or text[j] in "_$"):
+                    j += 1
+                word = text[i:j]
+            else:
+                j = i + 1
+                word = ""
+            # A second adjacent + or - completes ++/--; a third starts a new token (a+++b is a++ + b)
+            incdec = ch in "+-" and last == ch and not (space or newline or incdec)
+            if templates and ch in "{}":
+                templates[-1] += 1 if ch == "{" else -1
+            emit(text[i:j])
+            last = text[j - 1]
+            i = j
+    return "".join(out).strip() + "\n"
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js, ".mjs": minify_js}
+
+
+# ---------- build ----------
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hashed_name(relpath, digest):
+    path = PurePosixPath(relpath)
+    return str(path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}"))
+
+
+def load_manifest(dist):
+    try:
+        manifest = json.loads((dist / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def source_files(src):
+    """Relative posix paths of every file to publish, hidden files skipped"""
+    files = []
+    for folder, subdirs, names in os.walk(src):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith(".") and d != "node_modules")
+        for name in sorted(names):
+            if not name.startswith("."):
+                files.append(Path(folder, name).relative_to(src).as_posix())
+    return files
+
+
+def write_output(dist, relpath, data):
+    """Write a dist file plus its .gz sibling, returns the files written"""
+    target = dist / relpath
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+    written = [relpath]
+    if target.suffix.lower() in GZIP_SUFFIXES and len(data) >= GZIP_MIN_SIZE:
+        packed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(packed) < len(data):
+            Path(str(target) + ".gz").write_bytes(packed)
+            written.append(relpath + ".gz")
+    return written
+
+
+def rewrite_references(html, page, outputs):
+    """Point href/src attributes of a page at the built file names"""
+    page_dir = PurePosixPath(page).parent
+
+    def replace(match):
+        prefix, quote, url = match.groups()
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or not parts.path:
+            return match.group(0)
+        rooted = parts.path.startswith("/")
+        target = posixpath.normpath(parts.path.lstrip("/") if rooted else (page_dir / parts.path).as_posix())
+        built = outputs.get(target)
+        if built is None:
+            return match.group(0)
+        new_url = "/" + built if rooted else posixpath.relpath(built, page_dir.as_posix())
+        new_url += (f"?{parts.query}" if parts.query else "") + (f"#{parts.fragment}" if parts.fragment else "")
+        return f"{prefix}{quote}{new_url}{quote}"
+
+    return REFERENCE.sub(replace, html)
+
+
+def build(src=SOURCE_DIR, dist=DIST_DIR, force=False, log=print):
+    """Build src into dist, reusing outputs whose inputs did not change"""
+    src, dist = Path(src), Path(dist)
+    # Read even with force: its outputs are still cleaned up when superseded
+    previous = load_manifest(dist)
+    old_inputs = previous["inputs"] if previous else {}
+    inputs, outputs, written = {}, {}, set()
+    counts = {"built": 0, "reused": 0, "removed": 0}
+
+    files = source_files(src)
+    pages = [f for f in files if PurePosixPath(f).suffix.lower() in HTML_SUFFIXES]
+    assets = [f for f in files if f not in set(pages)]
+
+    def unchanged(relpath, stat, extra=None):
+        """Previous record for relpath if its input and outputs are untouched, else None"""
+        old = None if force else old_inputs.get(relpath)
+        if not old or old["size"] != stat.st_size or old.get("extra") != extra:
+            return None
+        if old["mtime_ns"] != stat.st_mtime_ns:
+            # Touched but maybe not edited: the hash decides
+            if sha256((src / relpath).read_bytes()) != old["sha256"]:
+                return None
+        if not all((dist / path).exists() for path in old["files"]):
+            return None
+        return dict(old, mtime_ns=stat.st_mtime_ns)
+
+    # Assets first: pages need their final names
+    for relpath in assets:
+        stat = (src / relpath).stat()
+        record = unchanged(relpath, stat)
+        if record is None:
+            data = (src / relpath).read_bytes()
+            digest = sha256(data)
+            minify = MINIFIERS.get(PurePosixPath(relpath).suffix.lower())
+            if minify:
+                data = minify(data.decode("utf-8")).encode("utf-8")
+                output = hashed_name(relpath, sha256(data))
+            else:
+                output = relpath
+            record = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest,
+                      "output": output, "files": write_output(dist, output, data), "extra": None}
+            counts["built"] += 1
+        else:
+            counts["reused"] += 1
+        inputs[relpath] = record
+        outputs[relpath] = record["output"]
+        written.update(record["files"])
+
+    # A page is rebuilt when it changed or when any asset name it may reference changed
+    names = sha256(json.dumps(outputs, sort_keys=True).encode("utf-8"))
+    for relpath in pages:
+        stat = (src / relpath).stat()
+        record = unchanged(relpath, stat, extra=names)
+        if record is None:
+            raw = (src / relpath).read_bytes()
+            html = rewrite_references(raw.decode("utf-8"), relpath, outputs)
+            record = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256(raw),
+                      "output": relpath, "files": write_output(dist, relpath, html.encode("utf-8")),
+                      "extra": names}
+            counts["built"] += 1
+        else:
+            counts["reused"] += 1
+        inputs[relpath] = record
+        outputs[relpath] = relpath
+        written.update(record["files"])
+
+    # Outputs of deleted inputs and superseded hashes
+    for old in old_inputs.values():
+        for path in old["files"]:
+            if path not in written and (dist / path).exists():
+                (dist / path).unlink()
+                counts["removed"] += 1
+
+    dist.mkdir(parents=True, exist_ok=True)
+    manifest = {"version": MANIFEST_VERSION, "inputs": inputs, "assets": outputs}
+    (dist / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build 01-core into dist/ with minified, hashed assets")
+    parser.add_argument("--src", default=str(SOURCE_DIR), help="Source folder (default: 01-core)")
+    parser.add_argument("--dist", default=str(DIST_DIR), help="Output folder (default: dist)")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and rebuild everything")
+    parser.add_argument("--clean", action="store_true", help="Delete the output folder and exit")
+    args = parser.parse_args()
+
+    dist = Path(args.dist)
+    if args.clean:
+        shutil.rmtree(dist, ignore_errors=True)
+        print(f"🧹 Removed {dist}")
+        return
+    if not Path(args.src).is_dir():
+        print(f"❌ Source folder not found: {args.src}")
+        sys.exit(1)
+
+    start = perf_counter()
+    try:
+        counts = build(args.src, dist, force=args.force)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ Build failed: {e}")
+        sys.exit(1)
+    elapsed = (perf_counter() - start) * 1000
+    print(f"📦 Built {counts['built']}, reused {counts['reused']}, removed {counts['removed']} "
+          f"in {elapsed:.0f} ms -> {dist}")
+    manifest = load_manifest(dist)
+    for source, output in sorted(manifest["assets"].items()):
+        if source != output:
+            print(f"   {source} -> {output}")
+    print(f"💡 Preview: python 05-utilities/scripts/serve.py --directory {dist}")
+
+
+if __name__ == "__main__":
+    main()
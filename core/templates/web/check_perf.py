@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Page weight check
+Offline report of a page's render-blocking resources and byte weights
+
+Run with: python 05-utilities/scripts/check_perf.py
+          python 05-utilities/scripts/check_perf.py 01-core/about.html --budget-kb 50
+          python 05-utilities/scripts/check_perf.py --json
+
+Nothing is fetched: local files are measured raw and gzip compressed,
+third-party URLs are listed but not weighed.
+"""
+
+import re
+import sys
+import gzip
+import json
+import argparse
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import urlsplit, unquote
+
+CORE_DIR = Path(__file__).resolve().parent.parent.parent / "01-core"
+DEFAULT_PAGE = CORE_DIR / "index.html"
+
+CSS_IMPORT = re.compile(r"@import\s+(?:url\()?\s*['\"]?([^'\")\s;]+)", re.I)
+FONT_FACE = re.compile(r"@font-face\s*{([^}]*)}", re.I)
+CSS_URL = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)", re.I)
+ACTIVE_LISTENER = re.compile(r"addEventListener\(\s*['\"](scroll|wheel|touchstart|touchmove)['\"][^;]*", re.I)
+
+
+class PageScanner(HTMLParser):
+    """Collects the resources a page references and whether they block rendering"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.resources = []
+        self.inline = {"style": [], "script": []}
+        self.in_head = True
+        self.in_noscript = False
+        self.capture = None
+
+    def add(self, kind, url, blocking, note):
+        if self.in_noscript:
+            # Only used when scripting is off, where the preloaded copy never applies
+            blocking, note = False, "<noscript> fallback"
+        self.resources.append({"kind": kind, "url": url, "blocking": blocking, "note": note,
+                               "location": "head" if self.in_head else "body"})
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {key: (value or "") for key, value in attrs}
+        if tag == "body":
+            self.in_head = False
+        elif tag == "noscript":
+            self.in_noscript = True
+        elif tag == "link" and attrs.get("href"):
+            rel = attrs.get("rel", "").lower().split()
+            media = attrs.get("media", "all").strip().lower()
+            if "stylesheet" in rel:
+                if media in ("print", "not all") or "disabled" in attrs:
+                    self.add("css", attrs["href"], False, f"media={media}")
+                else:
+                    self.add("css", attrs["href"], True, "<link rel=stylesheet>")
+            elif "preload" in rel and attrs.get("as") == "style":
+                self.add("css", attrs["href"], False, "preloaded, applied on load")
+            elif "preload" in rel:
+                self.add(attrs.get("as") or "preload", attrs["href"], False, "preload")
+            elif "icon" in rel:
+                self.add("image", attrs["href"], False, "icon")
+        elif tag == "script":
+            if attrs.get("src"):
+                if "async" in attrs:
+                    self.add("js", attrs["src"], False, "async")
+                elif "defer" in attrs or attrs.get("type") == "module":
+                    self.add("js", attrs["src"], False, "deferred")
+                else:
+                    self.add("js", attrs["src"], True, "parser-blocking <script>")
+            elif attrs.get("type", "text/javascript") in ("", "text/javascript", "module", "application/javascript"):
+                self.capture = "script"
+        elif tag == "style":
+            self.capture = "style"
+        elif tag == "img" and attrs.get("src"):
+            self.add("image", attrs["src"], False, "lazy" if attrs.get("loading") == "lazy" else "eager")
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.in_head = False
+        elif tag == "noscript":
+            self.in_noscript = False
+        if tag in ("style", "script"):
+            self.capture = None
+
+    def handle_data(self, data):
+        if self.capture:
+            self.inline[self.capture].append(data)
+
+
+def is_external(url):
+    parts = urlsplit(url)
+    return bool(parts.scheme or parts.netloc)
+
+
+def local_path(url, base):
+    path = unquote(urlsplit(url).path)
+    if path.startswith("/"):
+        return CORE_DIR / path.lstrip("/")
+    return base / path
+
+
+def weigh(data):
+    return {"bytes": len(data), "gzip_bytes": len(gzip.compress(data, 6))}
+
+
+def scan_css(text, base, origin, findings, fonts):
+    """Record @import chains and @font-face declarations of a stylesheet"""
+    for url in CSS_IMPORT.findall(text):
+        findings.append(f"{origin}: @import {url} delays the stylesheet until the import loads")
+    for body in FONT_FACE.findall(text):
+        display = re.search(r"font-display\s*:\s*([\w-]+)", body)
+        family = re.search(r"font-family\s*:\s*['\"]?([^;'\"]+)", body)
+        sources = [u for u in CSS_URL.findall(body)]
+        local = [u for u in sources if not is_external(u)]
+        fonts.append({
+            "family": family.group(1).strip() if family else "?",
+            "display": display.group(1) if display else None,
+            "sources": sources,
+            "missing": [u for u in local if not local_path(u, base).exists()],
+        })
+        if not display or display.group(1) in ("auto", "block"):
+            findings.append(f"{origin}: @font-face without font-display: swap/optional hides text while the font loads")
+
+
+def scan_js(text, origin, findings):
+    for match in ACTIVE_LISTENER.finditer(text):
+        if "passive" not in match.group(0):
+            findings.append(f"{origin}: '{match.group(1)}' listener is not passive (can delay scrolling)")
+
+
+def check(page):
+    page = Path(page).resolve()
+    base = page.parent
+    html_bytes = page.read_bytes()
+    scanner = PageScanner()
+    scanner.feed(html_bytes.decode("utf-8", "replace"))
+
+    findings = []
+    fonts = []
+    resources = []
+    for resource in scanner.resources:
+        entry = dict(resource, bytes=None, gzip_bytes=None)
+        if is_external(resource["url"]):
+            entry["external"] = True
+            if resource["blocking"]:
+                findings.append(f"third-party {resource['kind']} blocks rendering: {resource['url']}")
+        else:
+            entry["external"] = False
+            path = local_path(resource["url"], base)
+            if not path.is_file():
+                findings.append(f"missing file: {resource['url']}")
+            else:
+                data = path.read_bytes()
+                entry.update(weigh(data))
+                if resource["kind"] == "css":
+                    scan_css(data.decode("utf-8", "replace"), path.parent, resource["url"], findings, fonts)
+                elif resource["kind"] == "js":
+                    scan_js(data.decode("utf-8", "replace"), resource["url"], findings)
+        resources.append(entry)
+
+    inline_style = "".join(scanner.inline["style"])
+    inline_script = "".join(scanner.inline["script"])
+    scan_css(inline_style, base, "inline <style>", findings, fonts)
+    scan_js(inline_script, "inline <script>", findings)
+
+    page_weight = weigh(html_bytes)
+    blocking = [r for r in resources if r["blocking"]]
+    # A file referenced twice (preload plus <noscript>) is downloaded once
+    local = {r["url"]: r for r in resources if r["bytes"] is not None}.values()
+    return {
+        "page": str(page),
+        "html": page_weight,
+        "inline": {"style_bytes": len(inline_style.encode()), "script_bytes": len(inline_script.encode())},
+        "resources": resources,
+        "blocking": len(blocking),
+        "fonts": fonts,
+        "findings": findings,
+        "total": {
+            "bytes": page_weight["bytes"] + sum(r["bytes"] for r in local),
+            "gzip_bytes": page_weight["gzip_bytes"] + sum(r["gzip_bytes"] for r in local),
+        },
+        # Bytes the browser must have before it can render anything
+        "critical_gzip_bytes": page_weight["gzip_bytes"] + sum(r["gzip_bytes"] or 0 for r in blocking),
+        "unmeasured_external": sum(1 for r in resources if r["external"]),
+    }
+
+
+def kb(size):
+    return f"{size / 1024:.1f} KB" if size is not None else "external"
+
+
+def print_report(report):
+    print(f"📄 {report['page']}: {kb(report['html']['bytes'])} ({kb(report['html']['gzip_bytes'])} gzip)")
+    print(f"🎨 Inline: {kb(report['inline']['style_bytes'])} <style>, {kb(report['inline']['script_bytes'])} <script>")
+
+    blocking = [r for r in report["resources"] if r["blocking"]]
+    print(f"\n🚧 Render-blocking resources: {len(blocking)}")
+    for r in blocking:
+        print(f"   {r['kind']:<5} {r['url'][:60]:<60} {kb(r['bytes']):>10}  {r['note']} in <{r['location']}>")
+
+    others = [r for r in report["resources"] if not r["blocking"]]
+    if others:
+        print(f"\n📦 Other resources: {len(others)}")
+        for r in others:
+            print(f"   {r['kind']:<5} {r['url'][:60]:<60} {kb(r['bytes']):>10}  {r['note']}")
+
+    if report["fonts"]:
+        print("\n🔤 Fonts:")
+        for font in report["fonts"]:
+            missing = f", missing: {', '.join(font['missing'])}" if font["missing"] else ""
+            print(f"   {font['family']}: font-display {font['display'] or 'not set'}{missing}")
+
+    print(f"\n⚖️ Total local weight: {kb(report['total']['bytes'])} ({kb(report['total']['gzip_bytes'])} gzip)")
+    print(f"⏱️ Critical path: {kb(report['critical_gzip_bytes'])} gzip before first render")
+    if report["unmeasured_external"]:
+        print(f"🌐 {report['unmeasured_external']} third-party resource(s) not measured (offline check)")
+
+    if report["findings"]:
+        print("\n💡 Findings:")
+        for finding in report["findings"]:
+            print(f"   - {finding}")
+    else:
+        print("\n✅ No blocking third-party resources or scroll-handler issues found")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report render-blocking resources and byte weights of a page")
+    parser.add_argument("page", nargs="?", default=str(DEFAULT_PAGE), help="HTML page (default: 01-core/index.html)")
+    parser.add_argument("--budget-kb", type=float, help="Fail if the gzip critical path exceeds this many KB")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    try:
+        report = check(args.page)
+    except OSError as e:
+        print(f"❌ Cannot read page: {e}")
+        sys.exit(2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.budget_kb is not None and report["critical_gzip_bytes"] > args.budget_kb * 1024:
+        print(f"❌ Critical path {kb(report['critical_gzip_bytes'])} exceeds budget {args.budget_kb:g} KB",
+              file=sys.stderr if args.json else sys.stdout)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
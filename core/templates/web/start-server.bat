@@ -0,0 +1,10 @@
+if exist "05-utilities\scripts\serve.py" (
+    python "05-utilities\scripts\serve.py"
+) else (
+    echo Starting basic file server...
+    if exist "01-core\index.html" (
+        start "" "01-core\index.html"
+    ) else (
+        echo Open files in 01-core/ folder to get started
+    )
+)
\ No newline at end of file
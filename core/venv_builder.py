@@ -0,0 +1,177 @@
+"""
+Virtualenv Builder
+Provisions a project virtualenv on a background thread during generation
+
+Creating a venv is dominated by ensurepip, which is independent of the
+project files, so create_project starts it before writing templates and
+only hands over requirements.txt once it exists:
+
+    builder = VenvBuilder("venv", VenvOptions(wheelhouses=["~/wheels"]))
+    builder.start()
+    ...write files...
+    builder.install("01-core/requirements.txt")
+    result = builder.wait()
+
+Packages are installed with pip --no-index from local wheelhouses (a folder
+of .whl files, or a cache tree such as pip's wheels/ cache, searched
+recursively), never from the network. With a base venv the new one is
+cloned from it instead (files are hardlinked, the few files that embed the
+venv path are rewritten), so whatever the base already has is installed
+instantly and pip only adds what is missing.
+"""
+
+import os
+import time
+import shutil
+import threading
+import subprocess
+import venv
+from pathlib import Path
+from collections import namedtuple
+
+from profiling import NULL_PROFILER
+
+VenvOptions = namedtuple("VenvOptions", "wheelhouses base", defaults=((), None))
+VenvResult = namedtuple("VenvResult", "ok path python method installed seconds message")
+
+PIP_TIMEOUT = 600
+
+
+def venv_python(path):
+    """Interpreter inside a venv folder"""
+    path = Path(path)
+    return path / "Scripts" / "python.exe" if os.name == "nt" else path / "bin" / "python"
+
+
+def site_packages(path):
+    path = Path(path)
+    return [path / "Lib" / "site-packages"] if os.name == "nt" else sorted(path.glob("lib/python*/site-packages"))
+
+
+def find_links(wheelhouses):
+    """Folders that directly contain wheels, for pip --find-links"""
+    folders = []
+    for wheelhouse in wheelhouses:
+        for dirpath, dirnames, filenames in os.walk(Path(wheelhouse).expanduser()):
+            dirnames.sort()
+            if any(name.endswith(".whl") for name in filenames):
+                folders.append(dirpath)
+    return folders
+
+
+def _link_or_copy(source, target):
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _rewrite(path, old, new):
+    """Replace the base venv path in one file, without touching the hardlinked original"""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return False
+    if old not in data or b"\0" in data[:1024]:
+        return False
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data.replace(old, new))
+    shutil.copymode(path, tmp_path)
+    tmp_path.replace(path)
+    return True
+
+
+def clone_venv(base, target):
+    """Copy a prebuilt venv to target by hardlinks, repointing scripts and .pth files"""
+    base = Path(base).expanduser().resolve()
+    target = Path(target).absolute()
+    if not (base / "pyvenv.cfg").is_file():
+        raise OSError(f"{base} is not a virtualenv (no pyvenv.cfg)")
+    shutil.copytree(base, target, symlinks=True, copy_function=_link_or_copy)
+
+    old, new = str(base).encode(), str(target).encode()
+    scripts = target / ("Scripts" if os.name == "nt" else "bin")
+    candidates = [target / "pyvenv.cfg"]
+    candidates += [p for p in scripts.iterdir() if p.is_file() and not p.is_symlink()]
+    for site in site_packages(target):
+        candidates += site.glob("*.pth")
+        candidates += site.glob("*.egg-link")
+    for path in candidates:
+        # Binary launchers (.exe) are skipped; `python -m <tool>` always works
+        _rewrite(path, old, new)
+
+
+class VenvBuilder:
+    """Creates a venv in a thread, then installs requirements once they are written"""
+
+    def __init__(self, path, options=None, profiler=NULL_PROFILER):
+        # Absolute, since create_project changes into the new project directory
+        self.path = Path(path).absolute()
+        self.options = options or VenvOptions()
+        self.profiler = profiler
+        self._requirements = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="venv-builder", daemon=True)
+        self._result = None
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def install(self, requirements):
+        """Hand over the requirements file (None to only create the venv)"""
+        self._requirements = Path(requirements).absolute() if requirements else None
+        self._ready.set()
+
+    def wait(self):
+        """Block until the venv is ready, returns a VenvResult"""
+        self._ready.set()
+        self._thread.join()
+        return self._result
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            if self.options.base:
+                method = "cloned"
+                with self.profiler.span("clone base venv", "venv"):
+                    clone_venv(self.options.base, self.path)
+            else:
+                method = "created"
+                with self.profiler.span("create venv", "venv"):
+                    venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt").create(self.path)
+        except Exception as e:
+            self._ready.wait()
+            self._result = VenvResult(False, str(self.path), None, None, 0, time.perf_counter() - start,
+                                      f"Could not create virtualenv: {e}")
+            return
+
+        self._ready.wait()
+        installed, message = 0, None
+        if self._requirements and self._requirements.is_file():
+            with self.profiler.span("pip install", "venv"):
+                installed, message = self._pip_install()
+        self._result = VenvResult(message is None, str(self.path), str(venv_python(self.path)), method,
+                                  installed, time.perf_counter() - start, message)
+
+    def _pip_install(self):
+        """Offline pip install of the requirements; returns (packages installed, error or None)"""
+        links = find_links(self.options.wheelhouses)
+        if not links and not self.options.base:
+            return 0, "No wheelhouse given: requirements were not installed (pip runs offline only)"
+        command = [str(venv_python(self.path)), "-m", "pip", "install", "--no-index",
+                   "--disable-pip-version-check", "--no-input", "-q", "-r", str(self._requirements)]
+        for folder in links:
+            command += ["--find-links", folder]
+        before = self._package_count()
+        try:
+            subprocess.run(command, check=True, capture_output=True, text=True, timeout=PIP_TIMEOUT)
+        except subprocess.CalledProcessError as e:
+            lines = [line for line in (e.stderr or e.stdout or "").splitlines() if line.strip()]
+            return 0, "pip install failed: " + (lines[-1] if lines else f"exit code {e.returncode}")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return 0, f"pip install failed: {e}"
+        return max(self._package_count() - before, 0), None
+
+    def _package_count(self):
+        return sum(1 for site in site_packages(self.path) for _ in site.glob("*.dist-info"))